@@ -1,17 +1,36 @@
 import openpyxl
 import asyncio
+import atexit
+import base64
+import copy
+import hashlib
+import heapq
+import itertools
+import json
+import multiprocessing
+import queue
+import threading
+import time
+import uuid
+import weakref
 from collections import defaultdict
 from openpyxl import Workbook
-from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, PatternFill, Border, Side, NamedStyle
+from openpyxl.styles.borders import DEFAULT_BORDER
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.utils.cell import coordinate_to_tuple
+from openpyxl.utils.indexed_list import IndexedList
 import os
 import re
-from calendar import monthrange
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
-from flask import Flask, request, jsonify, send_from_directory, session, g
+from flask import Flask, Response, request, jsonify, send_from_directory, session, g, stream_with_context
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
 from werkzeug.security import generate_password_hash, check_password_hash
 import shutil
+import zipfile
 from config.settings import Config
 from models.physchem import db, PhysChemAnalysis
 from models.microbiological import MicrobiologicalAnalysis
@@ -20,8 +39,17 @@ from models.dam_level_snapshot import DamLevelSnapshot
 from models.turbidity_snapshot import TurbiditySnapshot
 from models.leave_records import CTOApplication, LeaveApplication, LeaveCredits, Employee
 from models.auth import AppUser
+from models.screen_data_state import ScreenDataState
+from models.treatment_hour_aggregate import TreatmentHourAggregate
+from models.report_cache_entry import ReportCacheEntry
+from models.water_treatment_daily_rollup import WaterTreatmentDailyRollup
+from models.document_job import DocumentJob
 from openpyxl.drawing.image import Image as XLImage
-from sqlalchemy import func 
+from sqlalchemy import event, func, or_, select, text, union
+from sqlalchemy import inspect as sqlalchemy_inspect
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import aliased, defer
+from sqlalchemy.orm.attributes import get_history
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.units import inch
 from reportlab.pdfgen import canvas
@@ -48,13 +76,80 @@ CORS(app, supports_credentials=True)
 # Initialize database
 db.init_app(app)
 
-# Create tables
-with app.app_context():
-    db.create_all()
+def _create_missing_indexes():
+    """Create model-declared indexes that an existing database does not have yet.
+
+    db.create_all() only emits indexes together with newly created tables, so
+    indexes added to models later are migrated in here.
+    """
+    inspector = sqlalchemy_inspect(db.engine)
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+
+        existing_indexes = {index['name'] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                index.create(db.engine)
+                app.logger.info('Created index %s on %s', index.name, table.name)
+
+
+def _add_missing_columns():
+    """Add nullable model columns that an existing table does not have yet.
+
+    Like indexes, columns added to models after their table was created are
+    not emitted by db.create_all().
+    """
+    inspector = sqlalchemy_inspect(db.engine)
+    for table in db.metadata.sorted_tables:
+        if not inspector.has_table(table.name):
+            continue
+
+        existing_columns = {column['name'] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing_columns or not column.nullable:
+                continue
+            column_type = column.type.compile(dialect=db.engine.dialect)
+            with db.engine.begin() as connection:
+                connection.exec_driver_sql(f'ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}')
+            app.logger.info('Added column %s to %s', column.name, table.name)
+
+
+_startup_lock = threading.Lock()
+_startup_done = False
+
+
+def _run_startup_tasks():
+    """Create and migrate the schema, then run the one-off imports and cleanups, once per process."""
+    global _startup_done
+    if _startup_done:
+        return
+    with _startup_lock:
+        if _startup_done:
+            return
+        with app.app_context():
+            # Create tables
+            db.create_all()
+            _add_missing_columns()
+            _create_missing_indexes()
+            _ensure_default_admin_user()
+            _import_legacy_dam_cache_file()
+            _prune_treatment_hour_aggregates()
+            _ensure_search_indexes()
+        _startup_done = True
+
+
+# Not run at import time: certificate export workers are spawned processes that
+# import this module again and must not repeat the migrations and imports
+@app.before_request
+def run_startup_tasks():
+    _run_startup_tasks()
+
 
 # File number management
 SEQUENCE_FILE = 'last_sequence.txt'
 DAM_LEVEL_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'instance', 'dam_level_cache.json')
+MONITORING_TABLE_XPATH = '/html/body/table/tbody/tr[2]/th/table/tbody/tr/td[2]/table[3]/tbody'
 
 ROLE_PERMISSIONS = {
     'admin': {
@@ -231,10 +326,6 @@ def enforce_api_authentication():
     return None
 
 
-with app.app_context():
-    _ensure_default_admin_user()
-
-
 def _hour_label_for_target(now: datetime, delay_minutes: int) -> str:
     expected = now - timedelta(minutes=delay_minutes)
     hour = expected.strftime('%I').lstrip('0') or '0'
@@ -270,16 +361,11 @@ def _target_slot_datetime(now: datetime, delay_minutes: int) -> datetime:
 def _persist_and_get_recent_dam_snapshots(slot_datetime: datetime, target_hour_label: str, dam_level):
     try:
         if dam_level is not None:
-            existing = DamLevelSnapshot.query.filter_by(slot_datetime=slot_datetime).first()
-            if existing:
-                existing.dam_level = float(dam_level)
-                existing.target_hour = target_hour_label
-            else:
-                db.session.add(DamLevelSnapshot(
-                    slot_datetime=slot_datetime,
-                    target_hour=target_hour_label,
-                    dam_level=float(dam_level)
-                ))
+            _bulk_upsert_snapshots(DamLevelSnapshot, 'dam_level', [{
+                'slot_datetime': slot_datetime,
+                'target_hour': target_hour_label,
+                'dam_level': float(dam_level)
+            }])
 
         db.session.commit()
     except Exception:
@@ -292,16 +378,11 @@ def _persist_and_get_recent_dam_snapshots(slot_datetime: datetime, target_hour_l
 def _persist_and_get_recent_turbidity_snapshots(slot_datetime: datetime, target_hour_label: str, turbidity):
     try:
         if turbidity is not None:
-            existing = TurbiditySnapshot.query.filter_by(slot_datetime=slot_datetime).first()
-            if existing:
-                existing.turbidity = float(turbidity)
-                existing.target_hour = target_hour_label
-            else:
-                db.session.add(TurbiditySnapshot(
-                    slot_datetime=slot_datetime,
-                    target_hour=target_hour_label,
-                    turbidity=float(turbidity)
-                ))
+            _upsert_turbidity_snapshots([{
+                'slot_datetime': slot_datetime,
+                'target_hour': target_hour_label,
+                'turbidity': float(turbidity)
+            }])
 
         db.session.commit()
     except Exception:
@@ -312,155 +393,265 @@ def _persist_and_get_recent_turbidity_snapshots(slot_datetime: datetime, target_
 
 
 def _load_dam_history():
-    payload = _load_dam_cache_payload()
-    history = payload.get('history', []) if isinstance(payload, dict) else []
+    history = _get_screen_state_value('history', [])
     return history if isinstance(history, list) else []
 
 
-def _build_screen_data_history(start_date: datetime = None, end_date: datetime = None):
-    dam_query = DamLevelSnapshot.query
-    turbidity_query = TurbiditySnapshot.query
+def _format_slot_time(slot_datetime: datetime) -> str:
+    hour = slot_datetime.hour % 12 or 12
+    meridiem = 'PM' if slot_datetime.hour >= 12 else 'AM'
+    return f"{hour}:{slot_datetime.minute:02d} {meridiem}"
 
-    if start_date:
-        dam_query = dam_query.filter(DamLevelSnapshot.slot_datetime >= start_date)
-        turbidity_query = turbidity_query.filter(TurbiditySnapshot.slot_datetime >= start_date)
 
-    if end_date:
-        dam_query = dam_query.filter(DamLevelSnapshot.slot_datetime < end_date)
-        turbidity_query = turbidity_query.filter(TurbiditySnapshot.slot_datetime < end_date)
-
-    dam_rows = dam_query.order_by(DamLevelSnapshot.slot_datetime.asc()).all()
-    turbidity_rows = turbidity_query.order_by(TurbiditySnapshot.slot_datetime.asc()).all()
-
-    merged_by_slot = {}
-
-    for row in dam_rows:
-        key = row.slot_datetime.isoformat()
-        merged_by_slot[key] = {
-            'slotDatetime': row.slot_datetime.isoformat(),
-            'date': row.slot_datetime.strftime('%Y-%m-%d'),
-            'time': row.slot_datetime.strftime('%I:%M %p').lstrip('0'),
-            'damLevel': float(row.dam_level) if row.dam_level is not None else None,
-            'turbidity': None
-        }
+SCREEN_DATA_HISTORY_CHUNK_SIZE = 1000
 
-    for row in turbidity_rows:
-        key = row.slot_datetime.isoformat()
-        entry = merged_by_slot.get(key)
-        if not entry:
-            entry = {
-                'slotDatetime': row.slot_datetime.isoformat(),
-                'date': row.slot_datetime.strftime('%Y-%m-%d'),
-                'time': row.slot_datetime.strftime('%I:%M %p').lstrip('0'),
-                'damLevel': None,
-                'turbidity': None
-            }
-            merged_by_slot[key] = entry
 
-        entry['turbidity'] = float(row.turbidity) if row.turbidity is not None else None
+def _iter_screen_data_slot_rows(start_date: datetime = None, end_date: datetime = None):
+    """Yield (slot_datetime, dam_level, turbidity) tuples ordered by slot.
 
-    ordered_entries = sorted(merged_by_slot.values(), key=lambda item: item['slotDatetime'])
-    grouped = defaultdict(list)
+    Both snapshot tables are merged in one query: a UNION of their slot
+    datetimes outer-joined back to each table. Rows are read in keyset chunks,
+    each fully fetched on a short-lived connection before it is yielded, so a
+    slow consumer such as a streamed response never holds a read transaction
+    open against the snapshot writers.
+    """
+    after = None
+    while True:
+        dam_slots = select(DamLevelSnapshot.slot_datetime.label('slot_datetime'))
+        turbidity_slots = select(TurbiditySnapshot.slot_datetime.label('slot_datetime'))
 
-    for entry in ordered_entries:
-        grouped[entry['date']].append(entry)
+        if start_date:
+            dam_slots = dam_slots.where(DamLevelSnapshot.slot_datetime >= start_date)
+            turbidity_slots = turbidity_slots.where(TurbiditySnapshot.slot_datetime >= start_date)
 
-    return [
-        {
+        if end_date:
+            dam_slots = dam_slots.where(DamLevelSnapshot.slot_datetime < end_date)
+            turbidity_slots = turbidity_slots.where(TurbiditySnapshot.slot_datetime < end_date)
+
+        if after:
+            dam_slots = dam_slots.where(DamLevelSnapshot.slot_datetime > after)
+            turbidity_slots = turbidity_slots.where(TurbiditySnapshot.slot_datetime > after)
+
+        slots = union(dam_slots, turbidity_slots).subquery()
+        query = (
+            select(slots.c.slot_datetime, DamLevelSnapshot.dam_level, TurbiditySnapshot.turbidity)
+            .select_from(slots)
+            .outerjoin(DamLevelSnapshot, DamLevelSnapshot.slot_datetime == slots.c.slot_datetime)
+            .outerjoin(TurbiditySnapshot, TurbiditySnapshot.slot_datetime == slots.c.slot_datetime)
+            .order_by(slots.c.slot_datetime.asc())
+            .limit(SCREEN_DATA_HISTORY_CHUNK_SIZE)
+        )
+
+        with db.engine.connect() as connection:
+            rows = connection.execute(query).all()
+
+        for slot_datetime, dam_level, turbidity in rows:
+            if isinstance(slot_datetime, str):
+                slot_datetime = datetime.fromisoformat(slot_datetime)
+            after = slot_datetime
+            yield slot_datetime, dam_level, turbidity
+
+        if len(rows) < SCREEN_DATA_HISTORY_CHUNK_SIZE:
+            return
+
+
+def _iter_screen_data_history_groups(start_date: datetime = None, end_date: datetime = None):
+    current_date = None
+    entries = []
+
+    for slot_datetime, dam_level, turbidity in _iter_screen_data_slot_rows(start_date, end_date):
+        slot_iso = slot_datetime.isoformat()
+        date_key = slot_iso[:10]
+        if date_key != current_date:
+            if entries:
+                yield {'date': current_date, 'entries': entries}
+            current_date = date_key
+            entries = []
+
+        entries.append({
+            'slotDatetime': slot_iso,
             'date': date_key,
-            'entries': grouped[date_key]
-        }
-        for date_key in sorted(grouped.keys())
-    ]
+            'time': _format_slot_time(slot_datetime),
+            'damLevel': float(dam_level) if dam_level is not None else None,
+            'turbidity': float(turbidity) if turbidity is not None else None
+        })
 
+    if entries:
+        yield {'date': current_date, 'entries': entries}
 
-def _build_missing_screen_data_hours(start_date: datetime = None, end_date: datetime = None):
-    dam_query = DamLevelSnapshot.query
-    turbidity_query = TurbiditySnapshot.query
 
-    if start_date:
-        dam_query = dam_query.filter(DamLevelSnapshot.slot_datetime >= start_date)
-        turbidity_query = turbidity_query.filter(TurbiditySnapshot.slot_datetime >= start_date)
+def _build_screen_data_history(start_date: datetime = None, end_date: datetime = None):
+    return list(_iter_screen_data_history_groups(start_date, end_date))
 
-    if end_date:
-        dam_query = dam_query.filter(DamLevelSnapshot.slot_datetime < end_date)
-        turbidity_query = turbidity_query.filter(TurbiditySnapshot.slot_datetime < end_date)
 
-    dam_rows = dam_query.order_by(DamLevelSnapshot.slot_datetime.asc()).all()
-    turbidity_rows = turbidity_query.order_by(TurbiditySnapshot.slot_datetime.asc()).all()
+def _first_screen_data_slot_from(start_date: datetime = None, end_date: datetime = None):
+    candidates = []
+    for model in (DamLevelSnapshot, TurbiditySnapshot):
+        query = db.session.query(func.min(model.slot_datetime))
+        if start_date:
+            query = query.filter(model.slot_datetime >= start_date)
+        if end_date:
+            query = query.filter(model.slot_datetime < end_date)
+        value = query.scalar()
+        if value is not None:
+            candidates.append(value)
+    return min(candidates) if candidates else None
+
+
+def _build_screen_data_history_page(start_date: datetime = None, end_date: datetime = None, days: int = 7, cursor: datetime = None):
+    """Return one page of ``days`` calendar days starting at the cursor.
+
+    ``nextCursor`` is the date of the next slot with data after the page, so
+    long gaps never produce empty pages.
+    """
+    page_from = max(value for value in (start_date, cursor) if value is not None) if (start_date or cursor) else None
+    first_slot = _first_screen_data_slot_from(page_from, end_date)
+    if first_slot is None:
+        return {'groups': [], 'nextCursor': None}
+
+    page_start = first_slot.replace(hour=0, minute=0, second=0, microsecond=0)
+    page_end = page_start + timedelta(days=days)
+    if end_date is not None:
+        page_end = min(page_end, end_date)
+
+    groups = _build_screen_data_history(page_start, page_end)
+    next_slot = _first_screen_data_slot_from(page_end, end_date)
+
+    return {
+        'groups': groups,
+        'nextCursor': next_slot.strftime('%Y-%m-%d') if next_slot else None
+    }
+
+
+HOUR_INDEX_EPOCH = datetime(1970, 1, 1)
+
+
+def _hour_index(value: datetime) -> int:
+    return (value - HOUR_INDEX_EPOCH) // timedelta(hours=1)
+
+
+def _hour_from_index(index: int) -> datetime:
+    return HOUR_INDEX_EPOCH + timedelta(hours=index)
+
 
-    dam_by_slot = {}
-    turbidity_by_slot = {}
+def _load_snapshot_hour_values(model, value_column, start_date: datetime = None, end_date: datetime = None):
+    query = db.session.query(model.slot_datetime, value_column)
+    if start_date:
+        query = query.filter(model.slot_datetime >= start_date)
+    if end_date:
+        query = query.filter(model.slot_datetime < end_date)
+
+    present = set()
+    zero_values = {}
+    for slot_datetime, value in query:
+        index = _hour_index(slot_datetime)
+        if value is None or value == 0:
+            zero_values[index] = float(value) if value is not None else None
+        else:
+            present.add(index)
+    return present, zero_values
 
-    for row in dam_rows:
-        slot = row.slot_datetime.replace(minute=0, second=0, microsecond=0)
-        dam_by_slot[slot] = float(row.dam_level) if row.dam_level is not None else None
 
-    for row in turbidity_rows:
-        slot = row.slot_datetime.replace(minute=0, second=0, microsecond=0)
-        turbidity_by_slot[slot] = float(row.turbidity) if row.turbidity is not None else None
+def _build_missing_screen_data_hours(start_date: datetime = None, end_date: datetime = None, include_entries: bool = True):
+    """Find hours where neither dam level nor turbidity was recorded.
 
-    all_slots = sorted(set(list(dam_by_slot.keys()) + list(turbidity_by_slot.keys())))
+    Hours are handled as integer indices, so the scan is a set difference
+    between the hour range and the hours that have a non-zero reading.
+    """
+    dam_present, dam_zero = _load_snapshot_hour_values(DamLevelSnapshot, DamLevelSnapshot.dam_level, start_date, end_date)
+    turbidity_present, turbidity_zero = _load_snapshot_hour_values(TurbiditySnapshot, TurbiditySnapshot.turbidity, start_date, end_date)
+
+    known_hours = dam_present | turbidity_present | dam_zero.keys() | turbidity_zero.keys()
 
     if start_date is not None:
-        scan_start = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-    elif all_slots:
-        first_slot = all_slots[0]
-        scan_start = first_slot.replace(hour=0, minute=0, second=0, microsecond=0)
+        scan_start = _hour_index(start_date.replace(hour=0, minute=0, second=0, microsecond=0))
+    elif known_hours:
+        scan_start = (min(known_hours) // 24) * 24
     else:
         return {
             'totalMissingHours': 0,
+            'ranges': [],
             'groups': []
         }
 
     if end_date is not None:
-        scan_end = end_date
-    elif all_slots:
-        last_slot = all_slots[-1]
-        scan_end = last_slot.replace(hour=0, minute=0, second=0, microsecond=0) + timedelta(days=1)
+        scan_end = -(-(end_date - HOUR_INDEX_EPOCH) // timedelta(hours=1))
+    elif known_hours:
+        scan_end = (max(known_hours) // 24 + 1) * 24
     else:
-        scan_end = scan_start + timedelta(days=1)
-
-    grouped = defaultdict(list)
-    cursor = scan_start
-
-    while cursor < scan_end:
-        dam_value = dam_by_slot.get(cursor)
-        turbidity_value = turbidity_by_slot.get(cursor)
-
-        dam_missing = dam_value is None or dam_value == 0
-        turbidity_missing = turbidity_value is None or turbidity_value == 0
-
-        if dam_missing and turbidity_missing:
-            date_key = cursor.strftime('%Y-%m-%d')
-            grouped[date_key].append({
-                'slotDatetime': cursor.isoformat(),
-                'time': cursor.strftime('%I:%M %p').lstrip('0'),
-                'damLevel': dam_value,
-                'turbidity': turbidity_value
+        scan_end = scan_start + 24
+
+    missing_hours = sorted(set(range(scan_start, scan_end)) - dam_present - turbidity_present)
+
+    ranges = []
+    run_start = None
+    previous = None
+    for index in missing_hours:
+        if run_start is None:
+            run_start = index
+        elif index != previous + 1:
+            ranges.append((run_start, previous + 1))
+            run_start = index
+        previous = index
+    if run_start is not None:
+        ranges.append((run_start, previous + 1))
+
+    groups = []
+    if include_entries:
+        current_date = None
+        for index in missing_hours:
+            slot = _hour_from_index(index)
+            slot_iso = slot.isoformat()
+            date_key = slot_iso[:10]
+            if date_key != current_date:
+                groups.append({'date': date_key, 'entries': []})
+                current_date = date_key
+            groups[-1]['entries'].append({
+                'slotDatetime': slot_iso,
+                'time': _format_slot_time(slot),
+                'damLevel': dam_zero.get(index),
+                'turbidity': turbidity_zero.get(index)
             })
 
-        cursor += timedelta(hours=1)
-
-    groups = [
-        {
-            'date': date_key,
-            'entries': grouped[date_key]
-        }
-        for date_key in sorted(grouped.keys())
-    ]
-
     return {
-        'totalMissingHours': sum(len(group['entries']) for group in groups),
+        'totalMissingHours': len(missing_hours),
+        'ranges': [
+            {
+                'start': _hour_from_index(range_start).isoformat(),
+                'end': _hour_from_index(range_end).isoformat(),
+                'hours': range_end - range_start
+            }
+            for range_start, range_end in ranges
+        ],
         'groups': groups
     }
 
 
+def _bulk_upsert_snapshots(model, value_field: str, rows):
+    """Insert or update snapshot rows keyed by slot_datetime in one executemany."""
+    if not rows:
+        return
+
+    now = datetime.utcnow()
+    statement = sqlite_insert(model)
+    statement = statement.on_conflict_do_update(
+        index_elements=[model.slot_datetime],
+        set_={
+            value_field: statement.excluded[value_field],
+            'target_hour': statement.excluded.target_hour,
+            'updated_at': statement.excluded.updated_at
+        }
+    )
+    db.session.execute(statement, [{**row, 'created_at': now, 'updated_at': now} for row in rows])
+
+
 def _upsert_manual_screen_data_entries(entries):
     if not isinstance(entries, list):
         raise ValueError('Entries must be an array.')
 
     saved_count = 0
+    dam_rows = {}
+    turbidity_rows = {}
 
     for item in entries:
         if not isinstance(item, dict):
@@ -502,73 +693,267 @@ def _upsert_manual_screen_data_entries(entries):
         target_hour_label = f"{hour}:00 {slot_datetime.strftime('%p')}"
 
         if parsed_dam_level is not None:
-            dam_row = DamLevelSnapshot.query.filter_by(slot_datetime=slot_datetime).first()
-            if dam_row:
-                dam_row.dam_level = parsed_dam_level
-                dam_row.target_hour = target_hour_label
-            else:
-                db.session.add(DamLevelSnapshot(
-                    slot_datetime=slot_datetime,
-                    target_hour=target_hour_label,
-                    dam_level=parsed_dam_level
-                ))
+            dam_rows[slot_datetime] = {
+                'slot_datetime': slot_datetime,
+                'target_hour': target_hour_label,
+                'dam_level': parsed_dam_level
+            }
 
         if parsed_turbidity is not None:
-            turbidity_row = TurbiditySnapshot.query.filter_by(slot_datetime=slot_datetime).first()
-            if turbidity_row:
-                turbidity_row.turbidity = parsed_turbidity
-                turbidity_row.target_hour = target_hour_label
-            else:
-                db.session.add(TurbiditySnapshot(
-                    slot_datetime=slot_datetime,
-                    target_hour=target_hour_label,
-                    turbidity=parsed_turbidity
-                ))
+            turbidity_rows[slot_datetime] = {
+                'slot_datetime': slot_datetime,
+                'target_hour': target_hour_label,
+                'turbidity': parsed_turbidity
+            }
 
         saved_count += 1
 
+    _bulk_upsert_snapshots(DamLevelSnapshot, 'dam_level', list(dam_rows.values()))
+    _upsert_turbidity_snapshots(list(turbidity_rows.values()))
     db.session.commit()
     return saved_count
 
 
-def _get_treatment_activity_metrics(threshold: float = 5.0, reference_time: datetime = None):
-    now = reference_time or datetime.now()
+TREATMENT_HOUR_THRESHOLD = 5.0
+_treatment_aggregate_lock = threading.Lock()
 
-    month_start = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    if month_start.month == 12:
-        next_month_start = month_start.replace(year=month_start.year + 1, month=1)
-    else:
-        next_month_start = month_start.replace(month=month_start.month + 1)
 
-    last_active_row = (
-        TurbiditySnapshot.query
-        .filter(
-            TurbiditySnapshot.turbidity.isnot(None),
-            TurbiditySnapshot.turbidity > threshold,
-            TurbiditySnapshot.slot_datetime <= now
+def _month_bounds(year: int, month: int):
+    month_start = datetime(year, month, 1)
+    if month == 12:
+        return month_start, datetime(year + 1, 1, 1)
+    return month_start, datetime(year, month + 1, 1)
+
+
+def _materialized_treatment_thresholds():
+    """Thresholds kept as monthly aggregates; any other threshold is computed per request."""
+    return [float(value) for value in app.config.get('TREATMENT_HOUR_THRESHOLDS', [TREATMENT_HOUR_THRESHOLD])]
+
+
+def _get_built_treatment_thresholds():
+    thresholds = _get_screen_state_value('treatment_hour_aggregate_thresholds', [])
+    return [float(value) for value in thresholds] if isinstance(thresholds, list) else []
+
+
+def _treatment_hours_scan_query(threshold: float, start: datetime = None, end: datetime = None):
+    year_column = func.strftime('%Y', TurbiditySnapshot.slot_datetime)
+    month_column = func.strftime('%m', TurbiditySnapshot.slot_datetime)
+    query = (
+        db.session.query(
+            year_column,
+            month_column,
+            func.count(TurbiditySnapshot.id),
+            func.max(TurbiditySnapshot.slot_datetime)
         )
-        .order_by(TurbiditySnapshot.slot_datetime.desc())
-        .first()
+        .filter(TurbiditySnapshot.turbidity > threshold)
     )
+    if start is not None:
+        query = query.filter(TurbiditySnapshot.slot_datetime >= start, TurbiditySnapshot.slot_datetime < end)
+    return query.group_by(year_column, month_column)
+
+
+def _scan_treatment_hours(threshold: float, start: datetime = None, end: datetime = None):
+    """GROUP BY scan returning (year, month, treatment_hours, last_active_slot) rows."""
+    return [
+        (int(year_value), int(month_value), treatment_hours, last_active_slot)
+        for year_value, month_value, treatment_hours, last_active_slot
+        in _treatment_hours_scan_query(threshold, start, end).all()
+    ]
+
 
-    total_treatment_hours_month = (
-        TurbiditySnapshot.query
+def _last_active_treatment_slot_query(threshold: float, now: datetime):
+    return (
+        db.session.query(func.max(TurbiditySnapshot.slot_datetime))
         .filter(
-            TurbiditySnapshot.turbidity.isnot(None),
             TurbiditySnapshot.turbidity > threshold,
-            TurbiditySnapshot.slot_datetime >= month_start,
-            TurbiditySnapshot.slot_datetime < next_month_start
+            TurbiditySnapshot.slot_datetime <= now
         )
-        .count()
     )
 
-    last_active_treatment = None
-    if last_active_row and last_active_row.slot_datetime:
-        last_active_treatment = last_active_row.slot_datetime.strftime('%Y-%m-%d %H:%M')
 
+def _ensure_treatment_hour_aggregates(threshold: float = TREATMENT_HOUR_THRESHOLD):
+    """Build the monthly aggregate rows for a configured ``threshold`` once, from a GROUP BY scan."""
+    if threshold in _get_built_treatment_thresholds():
+        return
+
+    with _treatment_aggregate_lock:
+        _invalidate_screen_state()
+        if threshold in _get_built_treatment_thresholds():
+            return
+
+        try:
+            # Deleting first takes SQLite's write lock, so no snapshot upsert can
+            # commit between the scan and registering the threshold below
+            TreatmentHourAggregate.query.filter_by(threshold=threshold).delete()
+            for year, month, treatment_hours, last_active_slot in _scan_treatment_hours(threshold):
+                db.session.add(TreatmentHourAggregate(
+                    year=year,
+                    month=month,
+                    threshold=threshold,
+                    treatment_hours=treatment_hours,
+                    last_active_slot=last_active_slot
+                ))
+
+            _invalidate_screen_state()
+            built = [value for value in _get_built_treatment_thresholds() if value in _materialized_treatment_thresholds()]
+            _set_screen_state_values({'treatment_hour_aggregate_thresholds': built + [threshold]}, commit=False)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+
+
+def _prune_treatment_hour_aggregates():
+    """Drop aggregates for thresholds that are no longer configured."""
+    thresholds = _materialized_treatment_thresholds()
+    removed = TreatmentHourAggregate.query.filter(TreatmentHourAggregate.threshold.notin_(thresholds)).delete()
+    built = _get_built_treatment_thresholds()
+    if removed or any(value not in thresholds for value in built):
+        _set_screen_state_values({
+            'treatment_hour_aggregate_thresholds': [value for value in built if value in thresholds]
+        })
+    else:
+        db.session.commit()
+
+
+def _apply_treatment_hour_changes(changes):
+    """Adjust monthly aggregates for (slot_datetime, old_turbidity, new_turbidity) changes.
+
+    Must run after the snapshot rows are written in the same transaction.
+    """
+    for threshold in _materialized_treatment_thresholds():
+        hour_deltas = defaultdict(int)
+        newest_active = {}
+        deactivated = set()
+
+        for slot_datetime, old_value, new_value in changes:
+            was_active = old_value is not None and old_value > threshold
+            is_active = new_value is not None and new_value > threshold
+            if was_active == is_active:
+                continue
+
+            period = (slot_datetime.year, slot_datetime.month)
+            if is_active:
+                hour_deltas[period] += 1
+                if period not in newest_active or slot_datetime > newest_active[period]:
+                    newest_active[period] = slot_datetime
+            else:
+                hour_deltas[period] -= 1
+                deactivated.add(period)
+
+        for (year, month), delta in hour_deltas.items():
+            aggregate = TreatmentHourAggregate.query.filter_by(year=year, month=month, threshold=threshold).first()
+            if aggregate is None:
+                aggregate = TreatmentHourAggregate(year=year, month=month, threshold=threshold, treatment_hours=0)
+                db.session.add(aggregate)
+
+            aggregate.treatment_hours = max(0, (aggregate.treatment_hours or 0) + delta)
+
+            if (year, month) in deactivated:
+                month_start, next_month_start = _month_bounds(year, month)
+                aggregate.last_active_slot = (
+                    db.session.query(func.max(TurbiditySnapshot.slot_datetime))
+                    .filter(
+                        TurbiditySnapshot.turbidity > threshold,
+                        TurbiditySnapshot.slot_datetime >= month_start,
+                        TurbiditySnapshot.slot_datetime < next_month_start
+                    )
+                    .scalar()
+                )
+            elif (year, month) in newest_active:
+                candidate = newest_active[(year, month)]
+                if aggregate.last_active_slot is None or candidate > aggregate.last_active_slot:
+                    aggregate.last_active_slot = candidate
+
+
+def _begin_write_transaction():
+    """Take SQLite's write lock for the session's transaction now, ahead of reads it depends on.
+
+    pysqlite only opens a transaction before the first INSERT/UPDATE/DELETE, so
+    a session already inside one holds the lock already.
+    """
+    dbapi_connection = db.session.connection().connection.dbapi_connection
+    if not dbapi_connection.in_transaction:
+        dbapi_connection.execute('BEGIN IMMEDIATE')
+
+
+def _upsert_turbidity_snapshots(rows):
+    if not rows:
+        return
+
+    # The previous values feed the aggregate deltas, so no other writer may
+    # change these slots between reading them and the upsert below
+    _begin_write_transaction()
+    slots = [row['slot_datetime'] for row in rows]
+    previous_values = {}
+    for offset in range(0, len(slots), 500):
+        previous_values.update(
+            db.session.query(TurbiditySnapshot.slot_datetime, TurbiditySnapshot.turbidity)
+            .filter(TurbiditySnapshot.slot_datetime.in_(slots[offset:offset + 500]))
+            .all()
+        )
+
+    _bulk_upsert_snapshots(TurbiditySnapshot, 'turbidity', rows)
+    _apply_treatment_hour_changes([
+        (row['slot_datetime'], previous_values.get(row['slot_datetime']), row['turbidity'])
+        for row in rows
+    ])
+
+
+def _treatment_hour_months(threshold: float, year: int):
+    """Return {month: (treatment_hours, last_active_slot)} for one year of ``threshold``."""
+    if threshold in _materialized_treatment_thresholds():
+        _ensure_treatment_hour_aggregates(threshold)
+        return {
+            aggregate.month: (aggregate.treatment_hours, aggregate.last_active_slot)
+            for aggregate in TreatmentHourAggregate.query.filter_by(year=year, threshold=threshold).all()
+        }
+
+    return {
+        month: (treatment_hours, last_active_slot)
+        for _, month, treatment_hours, last_active_slot
+        in _scan_treatment_hours(threshold, datetime(year, 1, 1), datetime(year + 1, 1, 1))
+    }
+
+
+def _get_treatment_activity_metrics(threshold: float = TREATMENT_HOUR_THRESHOLD, reference_time: datetime = None):
+    now = reference_time or datetime.now()
+    total_treatment_hours_month = _treatment_hour_months(threshold, now.year).get(now.month, (0, None))[0]
+
+    materialized = threshold in _materialized_treatment_thresholds()
+    last_active_slot = (
+        db.session.query(func.max(TreatmentHourAggregate.last_active_slot))
+        .filter(TreatmentHourAggregate.threshold == threshold)
+        .scalar()
+    ) if materialized else None
+    if not materialized or (last_active_slot is not None and last_active_slot > now):
+        # Ad-hoc threshold, or future-dated slots exist; scan for the latest active slot up to now.
+        last_active_slot = _last_active_treatment_slot_query(threshold, now).scalar()
+
+    last_active_treatment = last_active_slot.strftime('%Y-%m-%d %H:%M') if last_active_slot else None
     return last_active_treatment, total_treatment_hours_month
 
 
+def _build_treatment_hours_series(year: int, threshold: float = TREATMENT_HOUR_THRESHOLD):
+    monthly = _treatment_hour_months(threshold, year)
+
+    months = []
+    for month in range(1, 13):
+        treatment_hours, last_active_slot = monthly.get(month, (0, None))
+        months.append({
+            'month': month,
+            'treatmentHours': treatment_hours,
+            'lastActiveSlot': last_active_slot.isoformat() if last_active_slot else None
+        })
+
+    return {
+        'year': year,
+        'threshold': threshold,
+        'totalTreatmentHours': sum(entry['treatmentHours'] for entry in months),
+        'months': months
+    }
+
+
 def _build_screen_data_fallback_payload(scrape_error: str = None):
     computed_last_active_treatment, total_treatment_hours_month = _get_treatment_activity_metrics()
     manual_last_active_treatment = _get_last_active_dosing()
@@ -605,85 +990,115 @@ def _build_screen_data_fallback_payload(scrape_error: str = None):
     return payload
 
 
-def _load_dam_cache_payload():
+_screen_state_lock = threading.Lock()
+_screen_state_cache = None
+_screen_state_version = None
+
+
+def _load_screen_state():
+    """Return the decoded state table, re-reading it when any process has changed it.
+
+    The cached copy is checked against the table's row count and latest
+    ``updated_at`` on every read, which is a single aggregate over a handful of
+    rows, so writes from other workers are picked up on their next read.
+    """
+    global _screen_state_cache, _screen_state_version
+    version = tuple(db.session.query(func.count(ScreenDataState.key), func.max(ScreenDataState.updated_at)).one())
+    with _screen_state_lock:
+        if _screen_state_cache is None or _screen_state_version != version:
+            state = {}
+            for key, value in db.session.query(ScreenDataState.key, ScreenDataState.value).all():
+                try:
+                    state[key] = json.loads(value)
+                except (TypeError, ValueError):
+                    continue
+            _screen_state_cache = state
+            _screen_state_version = version
+        return _screen_state_cache
+
+
+def _invalidate_screen_state():
+    global _screen_state_cache
+    with _screen_state_lock:
+        _screen_state_cache = None
+
+
+def _get_screen_state_value(key: str, default=None):
+    return _load_screen_state().get(key, default)
+
+
+def _set_screen_state_values(values: dict, commit: bool = True):
+    """Upsert state keys in one transaction; a value of None deletes the key.
+
+    With ``commit=False`` the writes join the caller's open transaction.
+    """
+    try:
+        for key, value in values.items():
+            if value is None:
+                ScreenDataState.query.filter_by(key=key).delete()
+                continue
+            statement = sqlite_insert(ScreenDataState).values(
+                key=key,
+                value=json.dumps(value),
+                updated_at=datetime.utcnow()
+            )
+            statement = statement.on_conflict_do_update(
+                index_elements=[ScreenDataState.key],
+                set_={'value': statement.excluded.value, 'updated_at': statement.excluded.updated_at}
+            )
+            db.session.execute(statement)
+        if commit:
+            db.session.commit()
+    except Exception:
+        db.session.rollback()
+        app.logger.exception('Failed to save screen data state')
+        raise
+    finally:
+        _invalidate_screen_state()
+
+
+def _import_legacy_dam_cache_file():
     if not os.path.exists(DAM_LEVEL_CACHE_FILE):
-        return {}
+        return
     try:
-        import json
         with open(DAM_LEVEL_CACHE_FILE, 'r', encoding='utf-8') as file_handle:
             payload = json.load(file_handle)
-        return payload if isinstance(payload, dict) else {}
+        if isinstance(payload, dict) and payload:
+            existing_keys = {key for (key,) in db.session.query(ScreenDataState.key).all()}
+            _set_screen_state_values({
+                key: value for key, value in payload.items()
+                if key not in existing_keys and value is not None
+            })
+        os.replace(DAM_LEVEL_CACHE_FILE, f'{DAM_LEVEL_CACHE_FILE}.migrated')
+        app.logger.info('Imported legacy dam level cache file into screen_data_state')
     except Exception:
-        return {}
+        app.logger.exception('Failed to import legacy dam level cache file')
 
 
-def _save_dam_cache_payload(payload):
-    try:
-        import json
-        os.makedirs(os.path.dirname(DAM_LEVEL_CACHE_FILE), exist_ok=True)
-        cache_payload = payload if isinstance(payload, dict) else {}
-        existing_payload = _load_dam_cache_payload()
-        if (
-            isinstance(existing_payload, dict)
-            and existing_payload.get('last_chlorine_tank_change')
-            and not cache_payload.get('last_chlorine_tank_change')
-        ):
-            cache_payload['last_chlorine_tank_change'] = existing_payload.get('last_chlorine_tank_change')
-        if (
-            isinstance(existing_payload, dict)
-            and existing_payload.get('last_active_dosing')
-            and not cache_payload.get('last_active_dosing')
-        ):
-            cache_payload['last_active_dosing'] = existing_payload.get('last_active_dosing')
-        history = cache_payload.get('history', [])
-        if isinstance(history, list):
-            cache_payload['history'] = history[-50:]
-        with open(DAM_LEVEL_CACHE_FILE, 'w', encoding='utf-8') as file_handle:
-            json.dump(cache_payload, file_handle)
-    except Exception:
-        pass
+def _load_dam_cache_payload():
+    return dict(_load_screen_state())
 
 
 def _get_last_chlorine_tank_change():
-    payload = _load_dam_cache_payload()
-    value = payload.get('last_chlorine_tank_change') if isinstance(payload, dict) else None
+    value = _get_screen_state_value('last_chlorine_tank_change')
     return value if isinstance(value, str) and value.strip() else None
 
 
 def _set_last_chlorine_tank_change(date_value: str):
-    payload = _load_dam_cache_payload()
-    if not isinstance(payload, dict):
-        payload = {}
-
     normalized = (date_value or '').strip()
-    if normalized:
-        payload['last_chlorine_tank_change'] = normalized
-    else:
-        payload.pop('last_chlorine_tank_change', None)
-
-    _save_dam_cache_payload(payload)
-    return payload.get('last_chlorine_tank_change')
+    _set_screen_state_values({'last_chlorine_tank_change': normalized or None})
+    return _get_last_chlorine_tank_change()
 
 
 def _get_last_active_dosing():
-    payload = _load_dam_cache_payload()
-    value = payload.get('last_active_dosing') if isinstance(payload, dict) else None
+    value = _get_screen_state_value('last_active_dosing')
     return value if isinstance(value, str) and value.strip() else None
 
 
 def _set_last_active_dosing(value: str):
-    payload = _load_dam_cache_payload()
-    if not isinstance(payload, dict):
-        payload = {}
-
     normalized = (value or '').strip()
-    if normalized:
-        payload['last_active_dosing'] = normalized
-    else:
-        payload.pop('last_active_dosing', None)
-
-    _save_dam_cache_payload(payload)
-    return payload.get('last_active_dosing')
+    _set_screen_state_values({'last_active_dosing': normalized or None})
+    return _get_last_active_dosing()
 
 
 def _get_previous_from_last_displayed(cache_payload, current_target_hour: str):
@@ -726,439 +1141,768 @@ def _find_previous_from_history(history, current_target_hour: str):
     return None
 
 
-async def _scrape_screen_data_live():
-    try:
-        from playwright.async_api import async_playwright
-    except ImportError as exc:
-        raise RuntimeError("Playwright is not installed in backend environment.") from exc
+class _MonitoringBrowserPool:
+    """Keeps a logged-in Chromium context warm for the monitoring portal.
+
+    Playwright objects live on a dedicated event loop thread; request threads
+    hand a page coroutine to ``run`` and block on its result.
+    """
+
+    def __init__(self):
+        self._start_lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._semaphore = None
+        self._session_lock = None
+        self._playwright = None
+        self._browser = None
+        self._context = None
+        self._dashboard_url = None
+        self._idle_pages = []
+
+    def _ensure_loop(self):
+        with self._start_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(self._loop,),
+                    name='monitoring-browser',
+                    daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    @staticmethod
+    def _run_loop(loop):
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    def run(self, page_handler, timeout: float = None):
+        future = asyncio.run_coroutine_threadsafe(self._run_with_page(page_handler), self._ensure_loop())
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError as exc:
+            future.cancel()
+            raise RuntimeError('Timed out waiting for the monitoring portal.') from exc
+
+    def shutdown(self):
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._reset(), loop).result(timeout=10)
+        except Exception:
+            pass
+        loop.call_soon_threadsafe(loop.stop)
+        self._thread.join(timeout=5)
+        self._loop = None
+        self._thread = None
+        self._semaphore = None
+        self._session_lock = None
+
+    async def _run_with_page(self, page_handler):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(max(1, int(app.config.get('MONITORING_MAX_CONCURRENCY', 2))))
+            self._session_lock = asyncio.Lock()
+
+        async with self._semaphore:
+            page = await self._acquire_page()
+            try:
+                result = await page_handler(page)
+            except BaseException:
+                # Also reached through CancelledError when ``run`` times out; the
+                # page may be mid-navigation, so close it instead of reusing it
+                await self._discard_page(page)
+                raise
+            self._idle_pages.append(page)
+            return result
+
+    async def _ensure_context(self):
+        if self._context is not None and self._browser is not None and self._browser.is_connected():
+            return self._context
+
+        await self._reset()
+        try:
+            from playwright.async_api import async_playwright
+        except ImportError as exc:
+            raise RuntimeError("Playwright is not installed in backend environment.") from exc
+
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=app.config.get('MONITORING_HEADLESS', True))
+        self._context = await self._browser.new_context()
+        self._context.set_default_timeout(45000)
+        return self._context
+
+    async def _acquire_page(self):
+        async with self._session_lock:
+            context = await self._ensure_context()
+
+        page = None
+        while self._idle_pages and page is None:
+            candidate = self._idle_pages.pop()
+            if not candidate.is_closed():
+                page = candidate
+        if page is None:
+            page = await context.new_page()
+
+        try:
+            if self._dashboard_url:
+                await page.goto(self._dashboard_url, wait_until='domcontentloaded', timeout=45000)
+                if await page.locator('input[name="username"]').count() == 0:
+                    await page.wait_for_selector(f'xpath={MONITORING_TABLE_XPATH}/tr[1]', state='visible', timeout=30000)
+                    return page
+
+            async with self._session_lock:
+                await self._login(page)
+            return page
+        except BaseException:
+            await self._discard_page(page)
+            raise
+
+    async def _login(self, page):
+        await page.goto(app.config.get('MONITORING_LOGIN_URL'), timeout=45000)
+        await page.wait_for_selector('input[name="username"]', state='visible')
+        await page.fill('input[name="username"]', app.config.get('MONITORING_USERNAME'))
+        await page.fill('input[name="password"]', app.config.get('MONITORING_PASSWORD'))
+        await page.press('input[name="password"]', 'Enter')
+        await page.wait_for_load_state('domcontentloaded', timeout=30000)
+        await page.wait_for_selector(f'xpath={MONITORING_TABLE_XPATH}/tr[1]', state='visible', timeout=30000)
+        self._dashboard_url = page.url
+        app.logger.info('Monitoring portal session established')
+
+    async def _discard_page(self, page):
+        try:
+            await page.close()
+        except Exception:
+            pass
+        if self._browser is None or not self._browser.is_connected():
+            await self._reset()
+
+    async def _reset(self):
+        self._idle_pages = []
+        self._dashboard_url = None
+        for resource in (self._context, self._browser):
+            if resource is None:
+                continue
+            try:
+                await resource.close()
+            except Exception:
+                pass
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception:
+                pass
+        self._playwright = None
+        self._browser = None
+        self._context = None
+
+
+_monitoring_browser_pool = _MonitoringBrowserPool()
+atexit.register(_monitoring_browser_pool.shutdown)
+
+
+MONITORING_TABLE_GRID_SCRIPT = """
+(tableXpath) => {
+    const body = document.evaluate(tableXpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    if (!body) {
+        return [];
+    }
+    return Array.from(body.children)
+        .filter((row) => row.tagName === 'TR')
+        .map((row) => Array.from(row.children)
+            .filter((cell) => cell.tagName === 'TD')
+            .map((cell) => (cell.innerText || '').trim()));
+}
+"""
+
+
+def _normalize_cell_text(text: str) -> str:
+    return ' '.join((text or '').split())
+
+
+def _grid_cell_text(row, column_index: int) -> str:
+    if not row or column_index < 1 or column_index > len(row):
+        return ''
+    return (row[column_index - 1] or '').strip()
+
+
+def _find_grid_row(grid, row_label: str):
+    for row in grid:
+        if row and row_label in _normalize_cell_text(row[0]):
+            return row
+    return None
+
+
+def _find_tank_grid_row(grid, phase_label: str, tank_label: str):
+    candidates = [
+        row for row in grid
+        if len(row) >= 3 and phase_label in _normalize_cell_text(row[1])
+    ]
+    for row in candidates:
+        if _normalize_cell_text(row[2]) == tank_label:
+            return row
+    for row in candidates:
+        if tank_label in _normalize_cell_text(row[2]):
+            return row
+    return None
+
+
+def _parse_monitoring_shift_grid(grid, target_hour_label: str):
+    header_row = grid[0] if grid else []
+    header_map = {}
+    for idx in range(4, 12):
+        normalized = _normalize_hour_header(_grid_cell_text(header_row, idx))
+        if normalized:
+            header_map[normalized] = idx
+
+    target_column = header_map.get(target_hour_label)
+    if target_column is None:
+        raise RuntimeError(f"Target hour {target_hour_label} is not available in shift headers.")
+
+    def row_value(row_label: str, column_index: int):
+        return _parse_numeric(_grid_cell_text(_find_grid_row(grid, row_label), column_index))
+
+    def first_row_value(row_labels, column_index: int):
+        for row_label in row_labels:
+            candidate_value = row_value(row_label, column_index)
+            if candidate_value is not None:
+                return candidate_value
+        return None
+
+    def tank_value(phase_label: str, tank_label: str):
+        return _parse_numeric(_grid_cell_text(_find_tank_grid_row(grid, phase_label, tank_label), target_column))
+
+    def row_series(row_label: str):
+        row = _find_grid_row(grid, row_label)
+        current_value = _parse_numeric(_grid_cell_text(row, target_column))
+
+        previous_value = None
+        for col in range(target_column - 1, 3, -1):
+            parsed = _parse_numeric(_grid_cell_text(row, col))
+            if parsed is not None:
+                previous_value = parsed
+                break
+
+        hours_prior = [
+            _parse_numeric(_grid_cell_text(row, target_column - offset)) if target_column - offset >= 4 else None
+            for offset in (1, 2, 3)
+        ]
+        return current_value, previous_value, hours_prior
+
+    current_dam_value, previous_dam_value, dam_hours_prior = row_series('Dam Level')
+    turbidity_value, previous_turbidity_value, turbidity_hours_prior = row_series('Turbidity')
+
+    old_res_status = _grid_cell_text(_find_grid_row(grid, 'Old Reservoir P3 Status'), target_column)
+    old_res_big_tank_level = first_row_value([
+        'Old Reservoir P3 Big Tank Water Level',
+        'Old Reservoir P3 Big Tank Level',
+        'Old Reservoir Big Tank Water Level',
+        'Old Reservoir Big Tank Level'
+    ], target_column)
+
+    tank_a_level = tank_value('Phase 1', 'A')
+    if tank_a_level is None:
+        tank_a_level = first_row_value([
+            'Tank Water Level Phase 1 A',
+            'Tank Water Level - Phase 1 A',
+            'Tank Water Level Phase 1',
+            'Tank Water Level A'
+        ], target_column)
+
+    tank_b_level = tank_value('Phase 1', 'B')
+    if tank_b_level is None:
+        tank_b_level = first_row_value([
+            'Tank Water Level Phase 1 B',
+            'Tank Water Level - Phase 1 B',
+            'Tank Water Level Phase 2 B',
+            'Tank Water Level - Phase 2 B',
+            'Tank Water Level Phase 2',
+            'Tank Water Level B'
+        ], target_column)
+
+    tank_cd_candidates = [value for value in [tank_value('Phase 2', 'C'), tank_value('Phase 2', 'D')] if value is not None]
+    tank_cd_level = (sum(tank_cd_candidates) / len(tank_cd_candidates)) if tank_cd_candidates else None
+    if tank_cd_level is None:
+        tank_cd_level = first_row_value([
+            'Tank Water Level Phase 2 C',
+            'Tank Water Level - Phase 2 C',
+            'Tank Water Level Phase 2 D',
+            'Tank Water Level - Phase 2 D',
+            'Tank Water Level Phase 3 C & D',
+            'Tank Water Level Phase 3 C&D',
+            'Tank Water Level - Phase 3 C & D',
+            'Tank Water Level Phase 3',
+            'Tank Water Level C & D',
+            'Tank Water Level C&D'
+        ], target_column)
+
+    current_operator = _grid_cell_text(_find_grid_row(grid, 'Encoded By'), target_column)
+
+    return {
+        'target_column': target_column,
+        'turbidity': turbidity_value,
+        'previous_turbidity': previous_turbidity_value,
+        'turbidity_1_hour_prior': turbidity_hours_prior[0],
+        'turbidity_2_hours_prior': turbidity_hours_prior[1],
+        'turbidity_3_hours_prior': turbidity_hours_prior[2],
+        'current_dam_level': current_dam_value,
+        'previous_dam_level': previous_dam_value,
+        'dam_level_1_hour_prior': dam_hours_prior[0],
+        'dam_level_2_hours_prior': dam_hours_prior[1],
+        'dam_level_3_hours_prior': dam_hours_prior[2],
+        'old_res_status': old_res_status or None,
+        'old_res_big_tank_level': old_res_big_tank_level,
+        'tank_a_level': tank_a_level,
+        'tank_b_level': tank_b_level,
+        'tank_cd_level': tank_cd_level,
+        'current_operator': current_operator or None
+    }
+
+
+async def _read_monitoring_shift_table(page, target_hour_label: str):
+    grid = await page.evaluate(MONITORING_TABLE_GRID_SCRIPT, MONITORING_TABLE_XPATH)
+    return _parse_monitoring_shift_grid(grid or [], target_hour_label)
+
+
+def _apply_recent_snapshot_values(payload, recent_dam_snapshots, recent_turbidity_snapshots):
+    snapshot_offset = 1 if payload.get('current_dam_level') is not None else 0
+
+    if len(recent_dam_snapshots) > snapshot_offset and recent_dam_snapshots[snapshot_offset].dam_level is not None:
+        payload['previous_dam_level'] = float(recent_dam_snapshots[snapshot_offset].dam_level)
+        payload['dam_level_1_hour_prior'] = float(recent_dam_snapshots[snapshot_offset].dam_level)
+
+    if len(recent_dam_snapshots) > snapshot_offset + 1 and recent_dam_snapshots[snapshot_offset + 1].dam_level is not None:
+        payload['dam_level_2_hours_prior'] = float(recent_dam_snapshots[snapshot_offset + 1].dam_level)
+
+    if len(recent_dam_snapshots) > snapshot_offset + 2 and recent_dam_snapshots[snapshot_offset + 2].dam_level is not None:
+        payload['dam_level_3_hours_prior'] = float(recent_dam_snapshots[snapshot_offset + 2].dam_level)
+
+    turbidity_snapshot_offset = 1 if payload.get('turbidity') is not None else 0
+
+    if len(recent_turbidity_snapshots) > turbidity_snapshot_offset and recent_turbidity_snapshots[turbidity_snapshot_offset].turbidity is not None:
+        payload['previous_turbidity'] = float(recent_turbidity_snapshots[turbidity_snapshot_offset].turbidity)
+        payload['turbidity_1_hour_prior'] = float(recent_turbidity_snapshots[turbidity_snapshot_offset].turbidity)
+
+    if len(recent_turbidity_snapshots) > turbidity_snapshot_offset + 1 and recent_turbidity_snapshots[turbidity_snapshot_offset + 1].turbidity is not None:
+        payload['turbidity_2_hours_prior'] = float(recent_turbidity_snapshots[turbidity_snapshot_offset + 1].turbidity)
+
+    if len(recent_turbidity_snapshots) > turbidity_snapshot_offset + 2 and recent_turbidity_snapshots[turbidity_snapshot_offset + 2].turbidity is not None:
+        payload['turbidity_3_hours_prior'] = float(recent_turbidity_snapshots[turbidity_snapshot_offset + 2].turbidity)
+
+    return payload
+
+
+def _apply_treatment_metrics(payload):
+    computed_last_active_treatment, total_treatment_hours_month = _get_treatment_activity_metrics()
+    manual_last_active_treatment = _get_last_active_dosing()
+    payload['last_active_dosing'] = manual_last_active_treatment or computed_last_active_treatment
+    payload['total_treatment_hours_month'] = total_treatment_hours_month
+    payload['reserved_metric'] = _get_last_chlorine_tank_change()
+    return payload
+
+
+def _scrape_screen_data_live():
+    username = app.config.get('MONITORING_USERNAME')
+    password = app.config.get('MONITORING_PASSWORD')
+    delay_minutes = app.config.get('MONITORING_ENTRY_DELAY_MINUTES', 12)
+
+    if not username or not password:
+        raise RuntimeError("Monitoring credentials are missing. Set MONITORING_USERNAME and MONITORING_PASSWORD.")
+
+    target_hour_label = _hour_label_for_target(datetime.now(), delay_minutes)
+
+    scraped = _monitoring_browser_pool.run(
+        lambda page: _read_monitoring_shift_table(page, target_hour_label),
+        timeout=app.config.get('MONITORING_SCRAPE_TIMEOUT_SECONDS', 90)
+    )
+    current_dam_value = scraped['current_dam_level']
+
+    target_slot_datetime = _target_slot_datetime(datetime.now(), delay_minutes)
+    recent_dam_snapshots = _persist_and_get_recent_dam_snapshots(
+        target_slot_datetime,
+        target_hour_label,
+        current_dam_value
+    )
+    recent_turbidity_snapshots = _persist_and_get_recent_turbidity_snapshots(
+        target_slot_datetime,
+        target_hour_label,
+        scraped['turbidity']
+    )
+
+    if current_dam_value is not None:
+        try:
+            _set_screen_state_values({
+                'last_displayed_current_dam': current_dam_value,
+                'last_displayed_target_hour': target_hour_label,
+                'last_displayed_fetched_at': datetime.now().isoformat()
+            })
+        except Exception:
+            pass
+
+    payload = {
+        'target_hour': target_hour_label,
+        **scraped,
+        'fetched_at': datetime.now().isoformat()
+    }
+    _apply_recent_snapshot_values(payload, recent_dam_snapshots, recent_turbidity_snapshots)
+    return _apply_treatment_metrics(payload)
+
+
+class _ScreenDataScheduler:
+    """Scrapes the monitoring portal once per hourly slot and caches the payload.
+
+    The live endpoint serves the cached payload and only triggers a refresh when
+    the cached slot is older than the current target slot. Refreshes are
+    single-flight, so concurrent clients share one scrape.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._refreshing = False
+        self._payload = None
+        self._slot_datetime = None
+        self._refreshed_at = None
+        self._last_attempt_at = None
+        self._last_error = None
+
+    def ensure_started(self):
+        if not app.config.get('MONITORING_SCHEDULER_ENABLED', True):
+            return
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name='screen-data-scheduler', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout=5)
+        self._thread = None
+
+    def _run(self):
+        self.refresh()
+        while not self._stop_event.is_set():
+            delay_minutes = app.config.get('MONITORING_ENTRY_DELAY_MINUTES', 12)
+            now = datetime.now()
+            next_run = _target_slot_datetime(now, delay_minutes) + timedelta(hours=1, minutes=delay_minutes)
+            if self._stop_event.wait(max(1.0, (next_run - now).total_seconds())):
+                break
+            self.refresh()
+
+    def refresh(self, wait: bool = False, timeout: float = None):
+        with self._condition:
+            if not self._refreshing:
+                self._refreshing = True
+                threading.Thread(target=self._refresh_worker, name='screen-data-refresh', daemon=True).start()
+            if wait:
+                self._condition.wait_for(lambda: not self._refreshing, timeout=timeout)
+
+    def _refresh_worker(self):
+        slot_datetime = _target_slot_datetime(datetime.now(), app.config.get('MONITORING_ENTRY_DELAY_MINUTES', 12))
+        payload = None
+        error = None
+        try:
+            with app.app_context():
+                payload = _scrape_screen_data_live()
+        except Exception as exc:
+            app.logger.exception('Scheduled screen data scrape failed')
+            error = str(exc)
+        finally:
+            with self._condition:
+                self._last_attempt_at = datetime.now()
+                if payload is not None:
+                    self._payload = payload
+                    self._slot_datetime = slot_datetime
+                    self._refreshed_at = self._last_attempt_at
+                    self._last_error = None
+                else:
+                    self._last_error = error or 'Screen data scrape failed.'
+                self._refreshing = False
+                self._condition.notify_all()
+
+        if payload is not None:
+            _screen_data_broadcaster.publish(self.snapshot())
+
+    def _is_stale(self, now: datetime) -> bool:
+        current_slot = _target_slot_datetime(now, app.config.get('MONITORING_ENTRY_DELAY_MINUTES', 12))
+        return self._payload is None or self._slot_datetime != current_slot
+
+    def _can_retry(self, now: datetime) -> bool:
+        if self._last_attempt_at is None:
+            return True
+        retry_seconds = app.config.get('MONITORING_REFRESH_RETRY_SECONDS', 120)
+        return (now - self._last_attempt_at).total_seconds() >= retry_seconds
+
+    def snapshot(self):
+        now = datetime.now()
+        with self._condition:
+            if self._payload is None:
+                return None
+
+            payload = dict(self._payload)
+            payload['cache_age_seconds'] = round((now - self._refreshed_at).total_seconds(), 1)
+            payload['cache_stale'] = self._is_stale(now)
+            if self._last_error:
+                payload['scrape_error'] = self._last_error
+            return payload
+
+    def get_live_payload(self, wait: bool = True):
+        self.ensure_started()
+        now = datetime.now()
+
+        with self._condition:
+            has_payload = self._payload is not None
+            should_refresh = self._is_stale(now) and (self._refreshing or self._can_retry(now))
+
+        if should_refresh:
+            self.refresh(
+                wait=wait and not has_payload,
+                timeout=app.config.get('MONITORING_SCRAPE_TIMEOUT_SECONDS', 90)
+            )
+
+        payload = self.snapshot()
+        if payload is None:
+            with self._condition:
+                last_error = self._last_error
+            return _build_screen_data_fallback_payload(last_error)
+        return payload
+
+    def reload_derived_values(self):
+        with self._condition:
+            if self._payload is None:
+                return
+            payload = dict(self._payload)
 
-    login_url = app.config.get('MONITORING_LOGIN_URL')
-    username = app.config.get('MONITORING_USERNAME')
-    password = app.config.get('MONITORING_PASSWORD')
-    headless = app.config.get('MONITORING_HEADLESS', True)
-    delay_minutes = app.config.get('MONITORING_ENTRY_DELAY_MINUTES', 12)
+        recent_dam_snapshots = DamLevelSnapshot.query.order_by(DamLevelSnapshot.slot_datetime.desc()).limit(4).all()
+        recent_turbidity_snapshots = TurbiditySnapshot.query.order_by(TurbiditySnapshot.slot_datetime.desc()).limit(4).all()
+        _apply_recent_snapshot_values(payload, recent_dam_snapshots, recent_turbidity_snapshots)
+        _apply_treatment_metrics(payload)
 
-    if not username or not password:
-        raise RuntimeError("Monitoring credentials are missing. Set MONITORING_USERNAME and MONITORING_PASSWORD.")
+        with self._condition:
+            self._payload = payload
 
-    table_xpath = '/html/body/table/tbody/tr[2]/th/table/tbody/tr/td[2]/table[3]/tbody'
-    target_hour_label = _hour_label_for_target(datetime.now(), delay_minutes)
-    dam_cache_payload = _load_dam_cache_payload()
 
-    async with async_playwright() as playwright:
-        browser = await playwright.chromium.launch(headless=headless)
-        context = await browser.new_context()
-        page = await context.new_page()
-        page.set_default_timeout(45000)
+class _ScreenDataBroadcaster:
+    """Fans screen-data payloads out to Server-Sent Events subscribers."""
 
-        try:
-            await page.goto(login_url, timeout=45000)
-            await page.wait_for_selector('input[name="username"]', state='visible')
-            await page.fill('input[name="username"]', username)
-            await page.fill('input[name="password"]', password)
-            await page.press('input[name="password"]', 'Enter')
-            await page.wait_for_load_state('domcontentloaded', timeout=30000)
-            await page.wait_for_selector(f'xpath={table_xpath}/tr[1]', state='visible', timeout=30000)
-
-            header_cells = page.locator(f'xpath={table_xpath}/tr[1]/td[position() >= 4 and position() <= 11]')
-            header_texts = await header_cells.all_inner_texts()
-            header_map = {}
-            for idx, text in enumerate(header_texts, start=4):
-                normalized = _normalize_hour_header(text)
-                if normalized:
-                    header_map[normalized] = idx
-
-            target_column = header_map.get(target_hour_label)
-            if target_column is None:
-                raise RuntimeError(f"Target hour {target_hour_label} is not available in shift headers.")
-
-            async def get_row_cell_text(row_label: str, column_index: int) -> str:
-                row_locator = page.locator(
-                    f'xpath={table_xpath}/tr[td[1][contains(normalize-space(.), "{row_label}")]]'
-                ).first
-                if await row_locator.count() == 0:
-                    return ''
-                cell_locator = row_locator.locator(f'xpath=./td[{column_index}]').first
-                if await cell_locator.count() == 0:
-                    return ''
-                return (await cell_locator.inner_text()).strip()
-
-            async def get_tank_cell_text(phase_label: str, tank_label: str, column_index: int) -> str:
-                row_locator = page.locator(
-                    f'xpath={table_xpath}/tr[td[2][contains(normalize-space(.), "{phase_label}")] and td[3][normalize-space(.)="{tank_label}"]]'
-                ).first
-                if await row_locator.count() == 0:
-                    row_locator = page.locator(
-                        f'xpath={table_xpath}/tr[td[2][contains(normalize-space(.), "{phase_label}")] and td[3][contains(normalize-space(.), "{tank_label}")]]'
-                    ).first
-                    if await row_locator.count() == 0:
-                        return ''
-                cell_locator = row_locator.locator(f'xpath=./td[{column_index}]').first
-                if await cell_locator.count() == 0:
-                    return ''
-                return (await cell_locator.inner_text()).strip()
-
-            current_dam_text = await get_row_cell_text('Dam Level', target_column)
-            current_dam_value = _parse_numeric(current_dam_text)
-
-            previous_dam_value = None
-            for col in range(target_column - 1, 3, -1):
-                left_text = await get_row_cell_text('Dam Level', col)
-                parsed = _parse_numeric(left_text)
-                if parsed is not None:
-                    previous_dam_value = parsed
-                    break
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = set()
 
-            dam_level_1_hour_prior = None
-            one_hour_column = target_column - 1
-            if one_hour_column >= 4:
-                one_hour_text = await get_row_cell_text('Dam Level', one_hour_column)
-                dam_level_1_hour_prior = _parse_numeric(one_hour_text)
-
-            dam_level_2_hours_prior = None
-            two_hour_column = target_column - 2
-            if two_hour_column >= 4:
-                two_hour_text = await get_row_cell_text('Dam Level', two_hour_column)
-                dam_level_2_hours_prior = _parse_numeric(two_hour_text)
-
-            dam_level_3_hours_prior = None
-            three_hour_column = target_column - 3
-            if three_hour_column >= 4:
-                three_hour_text = await get_row_cell_text('Dam Level', three_hour_column)
-                dam_level_3_hours_prior = _parse_numeric(three_hour_text)
-
-            turbidity_text = await get_row_cell_text('Turbidity', target_column)
-            turbidity_value = _parse_numeric(turbidity_text)
-
-            previous_turbidity_value = None
-            for col in range(target_column - 1, 3, -1):
-                left_text = await get_row_cell_text('Turbidity', col)
-                parsed = _parse_numeric(left_text)
-                if parsed is not None:
-                    previous_turbidity_value = parsed
-                    break
+    def subscribe(self):
+        subscriber = queue.Queue(maxsize=16)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        return subscriber
 
-            turbidity_1_hour_prior = None
-            if one_hour_column >= 4:
-                one_hour_turbidity_text = await get_row_cell_text('Turbidity', one_hour_column)
-                turbidity_1_hour_prior = _parse_numeric(one_hour_turbidity_text)
-
-            turbidity_2_hours_prior = None
-            if two_hour_column >= 4:
-                two_hour_turbidity_text = await get_row_cell_text('Turbidity', two_hour_column)
-                turbidity_2_hours_prior = _parse_numeric(two_hour_turbidity_text)
-
-            turbidity_3_hours_prior = None
-            if three_hour_column >= 4:
-                three_hour_turbidity_text = await get_row_cell_text('Turbidity', three_hour_column)
-                turbidity_3_hours_prior = _parse_numeric(three_hour_turbidity_text)
-
-            old_res_status = await get_row_cell_text('Old Reservoir P3 Status', target_column)
-            old_res_big_tank_level = None
-            for row_label in [
-                'Old Reservoir P3 Big Tank Water Level',
-                'Old Reservoir P3 Big Tank Level',
-                'Old Reservoir Big Tank Water Level',
-                'Old Reservoir Big Tank Level'
-            ]:
-                candidate_text = await get_row_cell_text(row_label, target_column)
-                candidate_value = _parse_numeric(candidate_text)
-                if candidate_value is not None:
-                    old_res_big_tank_level = candidate_value
-                    break
+    def unsubscribe(self, subscriber):
+        with self._lock:
+            self._subscribers.discard(subscriber)
 
-            tank_a_level = _parse_numeric(await get_tank_cell_text('Phase 1', 'A', target_column))
-            if tank_a_level is None:
-                for row_label in [
-                    'Tank Water Level Phase 1 A',
-                    'Tank Water Level - Phase 1 A',
-                    'Tank Water Level Phase 1',
-                    'Tank Water Level A'
-                ]:
-                    candidate_text = await get_row_cell_text(row_label, target_column)
-                    candidate_value = _parse_numeric(candidate_text)
-                    if candidate_value is not None:
-                        tank_a_level = candidate_value
-                        break
-
-            tank_b_level = _parse_numeric(await get_tank_cell_text('Phase 1', 'B', target_column))
-            if tank_b_level is None:
-                for row_label in [
-                    'Tank Water Level Phase 1 B',
-                    'Tank Water Level - Phase 1 B',
-                    'Tank Water Level Phase 2 B',
-                    'Tank Water Level - Phase 2 B',
-                    'Tank Water Level Phase 2',
-                    'Tank Water Level B'
-                ]:
-                    candidate_text = await get_row_cell_text(row_label, target_column)
-                    candidate_value = _parse_numeric(candidate_text)
-                    if candidate_value is not None:
-                        tank_b_level = candidate_value
-                        break
-
-            tank_c_level = _parse_numeric(await get_tank_cell_text('Phase 2', 'C', target_column))
-            tank_d_level = _parse_numeric(await get_tank_cell_text('Phase 2', 'D', target_column))
-            tank_cd_candidates = [value for value in [tank_c_level, tank_d_level] if value is not None]
-            tank_cd_level = (sum(tank_cd_candidates) / len(tank_cd_candidates)) if tank_cd_candidates else None
-            if tank_cd_level is None:
-                for row_label in [
-                    'Tank Water Level Phase 2 C',
-                    'Tank Water Level - Phase 2 C',
-                    'Tank Water Level Phase 2 D',
-                    'Tank Water Level - Phase 2 D',
-                    'Tank Water Level Phase 3 C & D',
-                    'Tank Water Level Phase 3 C&D',
-                    'Tank Water Level - Phase 3 C & D',
-                    'Tank Water Level Phase 3',
-                    'Tank Water Level C & D',
-                    'Tank Water Level C&D'
-                ]:
-                    candidate_text = await get_row_cell_text(row_label, target_column)
-                    candidate_value = _parse_numeric(candidate_text)
-                    if candidate_value is not None:
-                        tank_cd_level = candidate_value
-                        break
-            current_operator = await get_row_cell_text('Encoded By', target_column)
-
-            target_slot_datetime = _target_slot_datetime(datetime.now(), delay_minutes)
-            recent_dam_snapshots = _persist_and_get_recent_dam_snapshots(
-                target_slot_datetime,
-                target_hour_label,
-                current_dam_value
-            )
-            recent_turbidity_snapshots = _persist_and_get_recent_turbidity_snapshots(
-                target_slot_datetime,
-                target_hour_label,
-                turbidity_value
-            )
+    def publish(self, payload):
+        if payload is None:
+            return
+        message = json.dumps(payload)
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(message)
+            except queue.Full:
+                # Slow clients only need the latest payload.
+                try:
+                    subscriber.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    subscriber.put_nowait(message)
+                except queue.Full:
+                    pass
 
-            snapshot_offset = 1 if current_dam_value is not None else 0
 
-            if len(recent_dam_snapshots) > snapshot_offset and recent_dam_snapshots[snapshot_offset].dam_level is not None:
-                previous_dam_value = float(recent_dam_snapshots[snapshot_offset].dam_level)
-                dam_level_1_hour_prior = float(recent_dam_snapshots[snapshot_offset].dam_level)
+def _publish_screen_data_update():
+    _screen_data_scheduler.reload_derived_values()
+    _screen_data_broadcaster.publish(_screen_data_scheduler.snapshot() or _build_screen_data_fallback_payload())
 
-            if len(recent_dam_snapshots) > snapshot_offset + 1 and recent_dam_snapshots[snapshot_offset + 1].dam_level is not None:
-                dam_level_2_hours_prior = float(recent_dam_snapshots[snapshot_offset + 1].dam_level)
 
-            if len(recent_dam_snapshots) > snapshot_offset + 2 and recent_dam_snapshots[snapshot_offset + 2].dam_level is not None:
-                dam_level_3_hours_prior = float(recent_dam_snapshots[snapshot_offset + 2].dam_level)
+_screen_data_broadcaster = _ScreenDataBroadcaster()
+_screen_data_scheduler = _ScreenDataScheduler()
+atexit.register(_screen_data_scheduler.stop)
 
-            turbidity_snapshot_offset = 1 if turbidity_value is not None else 0
 
-            if len(recent_turbidity_snapshots) > turbidity_snapshot_offset and recent_turbidity_snapshots[turbidity_snapshot_offset].turbidity is not None:
-                previous_turbidity_value = float(recent_turbidity_snapshots[turbidity_snapshot_offset].turbidity)
-                turbidity_1_hour_prior = float(recent_turbidity_snapshots[turbidity_snapshot_offset].turbidity)
+@app.before_request
+def start_screen_data_scheduler():
+    _screen_data_scheduler.ensure_started()
+
+WATER_TREATMENT_REPORT_HEADERS = [
+    'DATE', 'DAM LEVEL', 'RAW WATER', 
+    'CLARIFIED WATER 1', 'CLARIFIED WATER 2',
+    'FILTERED WATER 1', 'FILTERED WATER 2',
+    'PAC DOSAGE\n(L/min)', 'ALUM DOSAGE\n(g/m3)',
+    'PAC CONSUMPTION\n(L/hr)', 'ALUM CONSUMPTION\n(BAGS/HR)', 'TREATMENT HOURS'
+]
+WATER_TREATMENT_REPORT_COLUMN_WIDTHS = {
+    'A': 18, 'B': 12, 'C': 12, 'D': 18, 'E': 18, 'F': 18,
+    'G': 18, 'H': 15, 'I': 15, 'J': 18, 'K': 18, 'L': 18
+}
 
-            if len(recent_turbidity_snapshots) > turbidity_snapshot_offset + 1 and recent_turbidity_snapshots[turbidity_snapshot_offset + 1].turbidity is not None:
-                turbidity_2_hours_prior = float(recent_turbidity_snapshots[turbidity_snapshot_offset + 1].turbidity)
 
-            if len(recent_turbidity_snapshots) > turbidity_snapshot_offset + 2 and recent_turbidity_snapshots[turbidity_snapshot_offset + 2].turbidity is not None:
-                turbidity_3_hours_prior = float(recent_turbidity_snapshots[turbidity_snapshot_offset + 2].turbidity)
+def _add_water_treatment_report_styles(wb):
+    """Register the report's shared named styles so every cell references one style record."""
+    thin_border = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
 
-            if current_dam_value is not None:
-                dam_cache_payload['last_displayed_current_dam'] = current_dam_value
-                dam_cache_payload['last_displayed_target_hour'] = target_hour_label
-                dam_cache_payload['last_displayed_fetched_at'] = datetime.now().isoformat()
-                _save_dam_cache_payload(dam_cache_payload)
+    title_style = NamedStyle(name='wt_title')
+    title_style.font = Font(name='Calibri', size=14, bold=True)
+    title_style.alignment = Alignment(horizontal='center', vertical='center')
+    title_style.fill = PatternFill(start_color='00B0F0', end_color='00B0F0', fill_type='solid')
+    title_style.border = DEFAULT_BORDER
 
-            computed_last_active_treatment, total_treatment_hours_month = _get_treatment_activity_metrics()
-            manual_last_active_treatment = _get_last_active_dosing()
-            last_active_treatment = manual_last_active_treatment or computed_last_active_treatment
+    header_style = NamedStyle(name='wt_header')
+    header_style.font = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
+    header_style.fill = PatternFill(start_color='0070C0', end_color='0070C0', fill_type='solid')
+    header_style.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    header_style.border = thin_border
 
-            return {
-                'target_hour': target_hour_label,
-                'target_column': target_column,
-                'turbidity': turbidity_value,
-                'previous_turbidity': previous_turbidity_value,
-                'turbidity_1_hour_prior': turbidity_1_hour_prior,
-                'turbidity_2_hours_prior': turbidity_2_hours_prior,
-                'turbidity_3_hours_prior': turbidity_3_hours_prior,
-                'current_dam_level': current_dam_value,
-                'previous_dam_level': previous_dam_value,
-                'dam_level_1_hour_prior': dam_level_1_hour_prior,
-                'dam_level_2_hours_prior': dam_level_2_hours_prior,
-                'dam_level_3_hours_prior': dam_level_3_hours_prior,
-                'old_res_status': old_res_status or None,
-                'old_res_big_tank_level': old_res_big_tank_level,
-                'tank_a_level': tank_a_level,
-                'tank_b_level': tank_b_level,
-                'tank_cd_level': tank_cd_level,
-                'current_operator': current_operator or None,
-                'last_active_dosing': last_active_treatment,
-                'total_treatment_hours_month': total_treatment_hours_month,
-                'reserved_metric': dam_cache_payload.get('last_chlorine_tank_change'),
-                'fetched_at': datetime.now().isoformat()
-            }
-        finally:
-            await browser.close()
+    data_style = NamedStyle(name='wt_data')
+    data_style.font = DEFAULT_FONT
+    data_style.alignment = Alignment(horizontal='center', vertical='center')
+    data_style.border = thin_border
 
+    summary_style = NamedStyle(name='wt_summary')
+    summary_style.font = Font(bold=True)
+    summary_style.border = DEFAULT_BORDER
+
+    for style in (title_style, header_style, data_style, summary_style):
+        wb.add_named_style(style)
+
+
+def _iter_with_next(iterable):
+    """Yield ``(item, next_item)`` pairs, with ``None`` as the last item's successor."""
+    iterator = iter(iterable)
+    current = next(iterator, None)
+    while current is not None:
+        following = next(iterator, None)
+        yield current, following
+        current = following
+
+
+def _reading_consumption(record, next_record):
+    """Return ``(requires_treatment, treatment_hours, pac_liters, alum_bags)`` for one reading.
+
+    Treatment runs from ``record`` until ``next_record`` when raw water is
+    above 5 NTU; without a next reading nothing is counted.
+    """
+    requires_treatment = bool(record.raw_water_turbidity and record.raw_water_turbidity > 5)
+    if not requires_treatment or next_record is None:
+        return requires_treatment, 0, 0, 0
+
+    treatment_hours = (next_record.reading_datetime - record.reading_datetime).total_seconds() / 3600
+    # PAC: L/min × 60 × hours = liters
+    pac_liters = record.pac_dosage * 60 * treatment_hours if record.pac_dosage else 0
+    # Alum: % Pump × 0.06 × hours = bags
+    alum_bags = record.alum_dosage * 0.06 * treatment_hours if record.alum_dosage else 0
+    return requires_treatment, treatment_hours, pac_liters, alum_bags
 
-def _run_scrape_coroutine(coroutine_factory):
-    try:
-        return asyncio.run(coroutine_factory())
-    except RuntimeError as error:
-        if 'asyncio.run() cannot be called from a running event loop' not in str(error):
-            raise
-        loop = asyncio.new_event_loop()
-        try:
-            return loop.run_until_complete(coroutine_factory())
-        finally:
-            loop.close()
 
 def create_water_treatment_excel_report(records, report_type, date_info):
-    """Generate Excel report for water treatment records"""
+    """Generate Excel report for water treatment records
+
+    ``records`` may be any iterable ordered by reading time (e.g. a query with
+    ``yield_per``); rows are streamed through a write-only workbook so memory
+    stays bounded for multi-month reports.
+    """
     try:
-        wb = Workbook()
-        ws = wb.active
-        ws.title = f"{report_type} Report"
-        
-        # Header styling
-        header_font = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
-        header_fill = PatternFill(start_color='0070C0', end_color='0070C0', fill_type='solid')
-        header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet(f"{report_type} Report")
+        _add_water_treatment_report_styles(wb)
+
+        def styled(value, style_name):
+            cell = WriteOnlyCell(ws, value=value)
+            cell.style = style_name
+            return cell
+
+        # Column widths must be set before the first row is written
+        for column_letter, width in WATER_TREATMENT_REPORT_COLUMN_WIDTHS.items():
+            ws.column_dimensions[column_letter].width = width
         
         # Title
         title_text = f"TURBIDITY MONITORING FOR THE MONTH OF {date_info.upper()}" if report_type.lower() == 'monthly' else f"TURBIDITY MONITORING - {date_info.upper()}"
-        ws.merge_cells('A1:M1')
-        title_cell = ws['A1']
-        title_cell.value = title_text
-        title_cell.font = Font(name='Calibri', size=14, bold=True)
-        title_cell.alignment = Alignment(horizontal='center', vertical='center')
-        title_cell.fill = PatternFill(start_color='00B0F0', end_color='00B0F0', fill_type='solid')
+        ws.merged_cells.add('A1:M1')
+        ws.append([styled(title_text, 'wt_title')])
+        ws.append([])
         
         # Headers - Row 3
-        headers = [
-            'DATE', 'DAM LEVEL', 'RAW WATER', 
-            'CLARIFIED WATER 1', 'CLARIFIED WATER 2',
-            'FILTERED WATER 1', 'FILTERED WATER 2',
-            'PAC DOSAGE\n(L/min)', 'ALUM DOSAGE\n(g/m3)',
-            'PAC CONSUMPTION\n(L/hr)', 'ALUM CONSUMPTION\n(BAGS/HR)', 'TREATMENT HOURS'
-        ]
-        
-        for col_num, header in enumerate(headers, 1):
-            cell = ws.cell(row=3, column=col_num)
-            cell.value = header
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = header_alignment
-            cell.border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
+        ws.append([styled(header, 'wt_header') for header in WATER_TREATMENT_REPORT_HEADERS])
         
         # Data rows and consumption calculation
-        # Data rows and consumption calculation
-        row_num = 4
+        record_count = 0
         total_alum_bags = 0
         total_pac_liters = 0
         total_treatment_hours = 0
-        dam_levels = []
+        dam_level_total = 0
+        dam_level_count = 0
         
-        for i, record in enumerate(records):
-            # Calculate hours until next reading
-            treatment_hours = 0
-            pac_consumption = 0
-            alum_consumption = 0
-            
-            # Only calculate if raw water > 5 NTU (treatment is needed)
-            requires_treatment = record.raw_water_turbidity and record.raw_water_turbidity > 5
-            
-            if requires_treatment and i < len(records) - 1:
-                next_record = records[i + 1]
-                treatment_hours = (next_record.reading_datetime - record.reading_datetime).total_seconds() / 3600
-                
-                # PAC: L/min × 60 × hours = liters
-                if record.pac_dosage:
-                    pac_consumption = record.pac_dosage * 60 * treatment_hours
-                    total_pac_liters += pac_consumption
-                
-                # Alum: % Pump × 0.06 × hours = bags
-                if record.alum_dosage:
-                    alum_consumption = record.alum_dosage * 0.06 * treatment_hours
-                    total_alum_bags += alum_consumption
-                
-                total_treatment_hours += treatment_hours
+        for record, next_record in _iter_with_next(records):
+            record_count += 1
+
+            requires_treatment, treatment_hours, pac_consumption, alum_consumption = _reading_consumption(record, next_record)
+            total_treatment_hours += treatment_hours
+            total_pac_liters += pac_consumption
+            total_alum_bags += alum_consumption
             
             # Track dam levels for average
             if record.dam_level:
-                dam_levels.append(record.dam_level)
+                dam_level_total += record.dam_level
+                dam_level_count += 1
             
-            # Write data
-            ws.cell(row=row_num, column=1, value=record.reading_datetime.strftime('%m/%d/%y %I:%M %p') if record.reading_datetime else '')
-            ws.cell(row=row_num, column=2, value=record.dam_level if record.dam_level else '')
-            ws.cell(row=row_num, column=3, value=record.raw_water_turbidity if record.raw_water_turbidity else '')
-            ws.cell(row=row_num, column=4, value=record.clarified_water_phase1 if record.clarified_water_phase1 else '')
-            ws.cell(row=row_num, column=5, value=record.clarified_water_phase2 if record.clarified_water_phase2 else '')
-            ws.cell(row=row_num, column=6, value=record.filtered_water_phase1 if record.filtered_water_phase1 else '')
-            ws.cell(row=row_num, column=7, value=record.filtered_water_phase2 if record.filtered_water_phase2 else '')
-            ws.cell(row=row_num, column=8, value=record.pac_dosage if record.pac_dosage else '')
-            ws.cell(row=row_num, column=9, value=record.alum_dosage if record.alum_dosage else '')
+            values = [
+                record.reading_datetime.strftime('%m/%d/%y %I:%M %p') if record.reading_datetime else '',
+                record.dam_level if record.dam_level else '',
+                record.raw_water_turbidity if record.raw_water_turbidity else '',
+                record.clarified_water_phase1 if record.clarified_water_phase1 else '',
+                record.clarified_water_phase2 if record.clarified_water_phase2 else '',
+                record.filtered_water_phase1 if record.filtered_water_phase1 else '',
+                record.filtered_water_phase2 if record.filtered_water_phase2 else '',
+                record.pac_dosage if record.pac_dosage else '',
+                record.alum_dosage if record.alum_dosage else '',
+            ]
             
             # Only show consumption if treatment was required
             if requires_treatment:
-                ws.cell(row=row_num, column=10, value=round(pac_consumption, 2) if pac_consumption > 0 else '')
-                ws.cell(row=row_num, column=11, value=round(alum_consumption, 2) if alum_consumption > 0 else '')
-                ws.cell(row=row_num, column=12, value=round(treatment_hours, 2) if treatment_hours > 0 else '')
+                values += [
+                    round(pac_consumption, 2) if pac_consumption > 0 else '',
+                    round(alum_consumption, 2) if alum_consumption > 0 else '',
+                    round(treatment_hours, 2) if treatment_hours > 0 else ''
+                ]
             else:
-                # If no treatment needed, show 0 or leave blank
-                ws.cell(row=row_num, column=10, value='')
-                ws.cell(row=row_num, column=11, value='')
-                ws.cell(row=row_num, column=12, value='')
-            
-            # Add borders and alignment
-            for col in range(1, 13):
-                cell = ws.cell(row=row_num, column=col)
-                cell.border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-                cell.alignment = Alignment(horizontal='center', vertical='center')
+                values += ['', '', '']
             
-            row_num += 1
+            ws.append([styled(value, 'wt_data') for value in values])
         
         # Add summary rows for monthly reports
-        if report_type.lower() == 'monthly' and len(records) > 0:
-            row_num += 1
-            avg_dam_level = sum(dam_levels) / len(dam_levels) if dam_levels else 0
-            
-            # Average Dam Level
-            ws.cell(row=row_num, column=1, value="AVERAGE DAM LEVEL").font = Font(bold=True)
-            ws.cell(row=row_num, column=2, value=round(avg_dam_level, 2)).font = Font(bold=True)
-            row_num += 1
+        if report_type.lower() == 'monthly' and record_count > 0:
+            ws.append([])
+            avg_dam_level = dam_level_total / dam_level_count if dam_level_count else 0
             
-            # Total Treatment Hours
-            ws.cell(row=row_num, column=1, value="TOTAL TREATMENT HOURS").font = Font(bold=True)
-            ws.cell(row=row_num, column=2, value=round(total_treatment_hours, 2)).font = Font(bold=True)
-            row_num += 1
-            
-            # Total PAC Consumption
-            ws.cell(row=row_num, column=1, value="TOTAL PAC CONSUMPTION").font = Font(bold=True)
-            ws.cell(row=row_num, column=2, value=round(total_pac_liters, 2)).font = Font(bold=True)
-            row_num += 1
-            
-            # Total Alum Consumption
-            ws.cell(row=row_num, column=1, value="TOTAL ALUM CONSUMPTION").font = Font(bold=True)
-            ws.cell(row=row_num, column=2, value=round(total_alum_bags, 2)).font = Font(bold=True)
-        
-        # Adjust column widths
-        ws.column_dimensions['A'].width = 18
-        ws.column_dimensions['B'].width = 12
-        ws.column_dimensions['C'].width = 12
-        ws.column_dimensions['D'].width = 18
-        ws.column_dimensions['E'].width = 18
-        ws.column_dimensions['F'].width = 18
-        ws.column_dimensions['G'].width = 18
-        ws.column_dimensions['H'].width = 15
-        ws.column_dimensions['I'].width = 15
-        ws.column_dimensions['J'].width = 18
-        ws.column_dimensions['K'].width = 18
-        ws.column_dimensions['L'].width = 18
+            for label, value in (
+                ("AVERAGE DAM LEVEL", avg_dam_level),
+                ("TOTAL TREATMENT HOURS", total_treatment_hours),
+                ("TOTAL PAC CONSUMPTION", total_pac_liters),
+                ("TOTAL ALUM CONSUMPTION", total_alum_bags),
+            ):
+                ws.append([styled(label, 'wt_summary'), styled(round(value, 2), 'wt_summary')])
         
         # Save file
         filename = f"Water_Treatment_{report_type}_{date_info.replace(' ', '_').replace('/', '-')}.xlsx"
@@ -1167,7 +1911,15 @@ def create_water_treatment_excel_report(records, report_type, date_info):
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
-        wb.save(filepath)
+        # Saved under a temporary name and moved into place, so a cached report
+        # that is being downloaded or zipped is never overwritten mid-read
+        temp_path = f'{filepath}.{uuid.uuid4().hex}.tmp'
+        try:
+            wb.save(temp_path)
+            os.replace(temp_path, filepath)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
         app.logger.info("Water treatment report created: %s", filename)
         app.logger.info("Water treatment totals alum_bags=%.2f pac_liters=%.2f treatment_hours=%.2f", total_alum_bags, total_pac_liters, total_treatment_hours)
         return filename
@@ -1219,26 +1971,368 @@ def get_next_file_number(peek=True):
     
     return str(sequence).zfill(3)
 
+LIST_PAGE_MAX_LIMIT = 500
+WATER_TREATMENT_BATCH_MAX_DAYS = 62
+WATER_TREATMENT_RANGE_MAX_DAYS = 366 * 5
+
+
+def _encode_list_cursor(sort_value, record_id: int) -> str:
+    payload = json.dumps([sort_value.isoformat() if sort_value is not None else None, record_id])
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def _decode_list_cursor(cursor: str, sort_column):
+    try:
+        sort_text, record_id = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+    except Exception as e:
+        raise ValueError('Invalid cursor') from e
+
+    if sort_text is None or sort_column is None:
+        return None, int(record_id)
+
+    python_type = sort_column.type.python_type
+    if python_type is datetime:
+        return datetime.fromisoformat(sort_text), int(record_id)
+    return python_type.fromisoformat(sort_text), int(record_id)
+
+
+def _list_field_projection(model):
+    """Parse ``fields=`` for a list endpoint.
+
+    Returns ``(fields, deferred_fields)``. ``fields`` is the set of requested
+    keys, or None for all of them. ``deferred_fields`` are the entries of the
+    model's ``LIST_DEFERRED_FIELDS`` (large base64 signature columns) that were
+    not requested explicitly; they are skipped in SQL and in the serialised
+    output.
+    """
+    raw_fields = request.args.get('fields', '')
+    fields = {field.strip() for field in raw_fields.split(',') if field.strip()} or None
+    deferred_fields = tuple(
+        field for field in getattr(model, 'LIST_DEFERRED_FIELDS', ())
+        if not fields or field not in fields
+    )
+    return fields, deferred_fields
+
+
+def _apply_list_projection(query, model, deferred_fields):
+    if not deferred_fields:
+        return query
+    return query.options(*[defer(getattr(model, field)) for field in deferred_fields])
+
+
+def _serialize_list_record(record, fields=None, deferred_fields=()):
+    data = record.to_dict(exclude=deferred_fields) if deferred_fields else record.to_dict()
+    if fields:
+        data = {key: value for key, value in data.items() if key in fields or key == 'id'}
+    return data
+
+
+def _list_page_query(query, model, sort_column=None, position=None):
+    """Order ``query`` for list pages and, given a cursor ``(sort_value, id)`` position, start after it.
+
+    The keyset predicate bounds the sort column from above so SQLite can SEARCH
+    its index rather than walk every newer row. Descending order puts NULL sort
+    values last; a position with a NULL sort value continues inside that tail,
+    from its start when ``id`` is None as well (see _list_page_records).
+    """
+    id_column = model.id
+    if position is not None:
+        sort_value, record_id = position
+        if sort_column is None:
+            query = query.filter(id_column > record_id)
+        elif sort_value is None:
+            query = query.filter(sort_column.is_(None))
+            if record_id is not None:
+                query = query.filter(id_column < record_id)
+        else:
+            query = query.filter(
+                sort_column <= sort_value,
+                or_(sort_column < sort_value, id_column < record_id)
+            )
+
+    order_columns = [id_column] if sort_column is None else [sort_column.desc(), id_column.desc()]
+    return query.order_by(*order_columns)
+
+
+def _list_page_records(query, model, sort_column, position, count):
+    """Fetch up to ``count`` rows after ``position``, moving on to NULL sort values once the rest run out."""
+    records = _list_page_query(query, model, sort_column, position).limit(count).all()
+    if (
+        len(records) < count
+        and position is not None
+        and position[0] is not None
+        and sort_column is not None
+        and sort_column.expression.nullable
+    ):
+        records += _list_page_query(query, model, sort_column, (None, None)).limit(count - len(records)).all()
+    return records
+
+
+def _list_page_limit():
+    """Return the ``limit`` query parameter, or None when it is absent."""
+    raw_limit = request.args.get('limit')
+    if raw_limit is None:
+        return None
+    try:
+        limit = int(raw_limit)
+    except ValueError:
+        limit = 0
+    if limit < 1 or limit > LIST_PAGE_MAX_LIMIT:
+        raise ValueError(f'limit must be between 1 and {LIST_PAGE_MAX_LIMIT}')
+    return limit
+
+
+def _paginated_list_response(query, model, sort_column=None):
+    """Return a list endpoint's response, paginated when ``limit`` or ``cursor`` is given.
+
+    Rows are ordered newest first by ``sort_column`` then ``id``, or by ascending
+    ``id`` when there is no sort column. Without
+    pagination parameters the full list is returned as before. With them, the
+    response is ``{items, nextCursor, limit}`` plus ``total`` when
+    ``include_total=true``. ``nextCursor`` is an opaque keyset cursor for the
+    following page. ``fields=`` narrows each item (see _list_field_projection).
+    """
+    fields, deferred_fields = _list_field_projection(model)
+    query = _apply_list_projection(query, model, deferred_fields)
+    limit = _list_page_limit()
+    cursor = request.args.get('cursor')
+
+    if limit is None and not cursor:
+        return jsonify([
+            _serialize_list_record(record, fields, deferred_fields)
+            for record in _list_page_query(query, model, sort_column).all()
+        ]), 200
+
+    if limit is None:
+        limit = 50
+
+    total = query.order_by(None).count() if request.args.get('include_total', '').lower() == 'true' else None
+
+    position = _decode_list_cursor(cursor, sort_column) if cursor else None
+    records = _list_page_records(query, model, sort_column, position, limit + 1)
+    next_cursor = None
+    if len(records) > limit:
+        records = records[:limit]
+        last_record = records[-1]
+        last_sort_value = getattr(last_record, sort_column.key) if sort_column is not None else None
+        next_cursor = _encode_list_cursor(last_sort_value, last_record.id)
+
+    response = {
+        'items': [_serialize_list_record(record, fields, deferred_fields) for record in records],
+        'nextCursor': next_cursor,
+        'limit': limit
+    }
+    if total is not None:
+        response['total'] = total
+    return jsonify(response), 200
+
+
+SEARCH_INDEXES = {
+    'physchem_search': (
+        PhysChemAnalysis,
+        ('client', 'location', 'source', 'file_prefix', 'file_number', 'or_number', 'analyst', 'collected_by')
+    ),
+    'micro_search': (
+        MicrobiologicalAnalysis,
+        ('client', 'location', 'source', 'file_prefix', 'file_number', 'or_number', 'collected_by')
+    ),
+}
+_search_index_available = False
+
+
+def _ensure_search_indexes():
+    """Create the FTS5 tables and their sync triggers, rebuilding any new index from its table."""
+    global _search_index_available
+
+    try:
+        with db.engine.begin() as connection:
+            for index_name, (model, columns) in SEARCH_INDEXES.items():
+                table_name = model.__tablename__
+                exists = connection.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {'name': index_name}
+                ).first()
+
+                column_list = ', '.join(columns)
+                new_values = ', '.join(f'new.{column}' for column in columns)
+                old_values = ', '.join(f'old.{column}' for column in columns)
+
+                connection.execute(text(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {index_name} USING fts5("
+                    f"{column_list}, content='{table_name}', content_rowid='id')"
+                ))
+                connection.execute(text(
+                    f"CREATE TRIGGER IF NOT EXISTS {index_name}_ai AFTER INSERT ON {table_name} BEGIN "
+                    f"INSERT INTO {index_name}(rowid, {column_list}) VALUES (new.id, {new_values}); END"
+                ))
+                connection.execute(text(
+                    f"CREATE TRIGGER IF NOT EXISTS {index_name}_ad AFTER DELETE ON {table_name} BEGIN "
+                    f"INSERT INTO {index_name}({index_name}, rowid, {column_list}) "
+                    f"VALUES ('delete', old.id, {old_values}); END"
+                ))
+                connection.execute(text(
+                    f"CREATE TRIGGER IF NOT EXISTS {index_name}_au AFTER UPDATE ON {table_name} BEGIN "
+                    f"INSERT INTO {index_name}({index_name}, rowid, {column_list}) "
+                    f"VALUES ('delete', old.id, {old_values}); "
+                    f"INSERT INTO {index_name}(rowid, {column_list}) VALUES (new.id, {new_values}); END"
+                ))
+
+                if not exists:
+                    connection.execute(text(f"INSERT INTO {index_name}({index_name}) VALUES ('rebuild')"))
+                    app.logger.info('Built search index %s', index_name)
+
+        _search_index_available = True
+    except Exception:
+        app.logger.exception('Full-text search index unavailable; falling back to LIKE search')
+        _search_index_available = False
+
+
+def _build_search_match_expression(search_text: str):
+    # Quote each word so FTS5 operators in user input are treated literally; '*' enables prefix matching
+    tokens = re.findall(r'\w+', search_text or '')
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+
+def _search_response(index_name: str, search_text: str, legacy_filter):
+    """Return ranked full-text search results for ``index_name``.
+
+    Without ``limit`` or ``cursor`` every match is returned as an array, as
+    before. With them, the response is ``{items, nextCursor, limit}``.
+    ``nextCursor`` is the offset of the next page of the ranked results.
+    """
+    model, _columns = SEARCH_INDEXES[index_name]
+    match_expression = _build_search_match_expression(search_text)
+
+    if not match_expression:
+        return _paginated_list_response(model.query, model, model.created_at)
+
+    if not _search_index_available:
+        return jsonify([
+            record.to_dict()
+            for record in model.query.filter(legacy_filter).order_by(model.created_at.desc()).all()
+        ]), 200
+
+    limit = _list_page_limit()
+    cursor = request.args.get('cursor')
+    paginate = limit is not None or bool(cursor)
+    if limit is None:
+        limit = 50
+
+    try:
+        offset = int(cursor) if cursor else 0
+    except ValueError as e:
+        raise ValueError('Invalid cursor') from e
+
+    statement = (
+        f"SELECT rowid FROM {index_name} WHERE {index_name} MATCH :match "
+        f"ORDER BY bm25({index_name}), rowid DESC"
+    )
+    params = {'match': match_expression}
+    if paginate:
+        statement += ' LIMIT :limit OFFSET :offset'
+        params.update({'limit': limit + 1, 'offset': offset})
+
+    ranked_ids = [row[0] for row in db.session.execute(text(statement), params)]
+    next_cursor = None
+    if paginate and len(ranked_ids) > limit:
+        ranked_ids = ranked_ids[:limit]
+        next_cursor = str(offset + limit)
+
+    records_by_id = {record.id: record for record in model.query.filter(model.id.in_(ranked_ids)).all()} if ranked_ids else {}
+    items = [records_by_id[record_id].to_dict() for record_id in ranked_ids if record_id in records_by_id]
+
+    if not paginate:
+        return jsonify(items), 200
+    return jsonify({'items': items, 'nextCursor': next_cursor, 'limit': limit}), 200
+
+
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 def allowed_excel_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in {'xlsx', 'xls'}
 
+PHYSCHEM_TEMPLATE_PATH = 'Form.xlsx'
+MICRO_TEMPLATE_PATH = 'MicroTemplate.xlsx'
+
+
+class _WorkbookTemplateCache:
+    """Keeps parsed certificate templates in memory and hands out per-record copies.
+
+    Cloning the parsed workbook is several times cheaper than re-parsing the
+    template with ``openpyxl.load_workbook`` for every certificate. A template
+    is parsed again when its file changes on disk.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._templates = {}
+
+    def _get(self, template_path):
+        path = os.path.abspath(template_path)
+        modified = os.path.getmtime(path)
+        with self._lock:
+            cached = self._templates.get(path)
+            if cached is None or cached[0] != modified:
+                cached = (modified, openpyxl.load_workbook(path))
+                self._templates[path] = cached
+            return cached[1]
+
+    def preload(self, *template_paths):
+        for template_path in template_paths:
+            if os.path.exists(template_path):
+                self._get(template_path)
+
+    def clone(self, template_path):
+        template = self._get(template_path)
+        workbook = copy.deepcopy(template)
+        # deepcopy leaves openpyxl's IndexedList style tables empty; the style
+        # objects in them are never mutated, so the copy can share them
+        for name, value in vars(template).items():
+            if isinstance(value, IndexedList):
+                setattr(workbook, name, IndexedList(value))
+        # Copies start with the template's merges, so they share its merged-cell index
+        for template_sheet, sheet in zip(template.worksheets, workbook.worksheets):
+            _merged_cell_indexes[sheet] = _merged_cell_index(template_sheet)
+        return workbook
+
+
+_certificate_templates = _WorkbookTemplateCache()
+_certificate_templates.preload(PHYSCHEM_TEMPLATE_PATH, MICRO_TEMPLATE_PATH)
+
+
+class _MergedCellIndex:
+    """Maps every cell inside a merged range to the (row, column) of the range's top-left cell."""
+
+    def __init__(self, sheet):
+        self.range_count = len(sheet.merged_cells.ranges)
+        self.anchors = {}
+        for merged_range in sheet.merged_cells.ranges:
+            anchor = (merged_range.min_row, merged_range.min_col)
+            for row in range(merged_range.min_row, merged_range.max_row + 1):
+                for column in range(merged_range.min_col, merged_range.max_col + 1):
+                    self.anchors[(row, column)] = anchor
+
+
+_merged_cell_indexes = weakref.WeakKeyDictionary()
+
+
+def _merged_cell_index(sheet):
+    """Return the sheet's merged-cell index, rebuilding it when merges were added or removed."""
+    index = _merged_cell_indexes.get(sheet)
+    if index is None or index.range_count != len(sheet.merged_cells.ranges):
+        index = _MergedCellIndex(sheet)
+        _merged_cell_indexes[sheet] = index
+    return index
+
+
 def write_to_cell(sheet, cell_address, value):
     """Write to a cell, handling merged cells"""
-    target_cell = sheet[cell_address]
-    
-    # Check if this cell is part of a merged range
-    for merged_range in sheet.merged_cells.ranges:
-        if target_cell.coordinate in merged_range:
-            # Write to the top-left cell of the merged range
-            top_left_cell = merged_range.start_cell
-            sheet.cell(row=top_left_cell.row, column=top_left_cell.column).value = value
-            return
-    
-    # If not merged, write directly
-    target_cell.value = value
+    row, column = coordinate_to_tuple(cell_address)
+
+    # Cells inside a merged range are written to the range's top-left cell
+    row, column = _merged_cell_index(sheet).anchors.get((row, column), (row, column))
+    sheet.cell(row=row, column=column).value = value
 
 def set_sheet_to_a4(sheet):
     """Set sheet to print perfectly on A4 paper - fits on one page"""
@@ -1278,17 +2372,17 @@ def set_sheet_to_a4(sheet):
     sheet.oddFooter.center.text = ""
     sheet.oddFooter.right.text = ""
 
-def create_physchem_excel(analysis, analyst_signature_scale=100, approver_signature_scale=100):
+def create_physchem_excel(analysis, analyst_signature_scale=100, approver_signature_scale=100, output_dir=None):
     """Generate Excel file from PhysChemAnalysis record using template"""
     try:
-        template_path = 'Form.xlsx'
+        template_path = PHYSCHEM_TEMPLATE_PATH
         
         # Load template
         if not os.path.exists(template_path):
             app.logger.error("PhysChem template not found: %s", template_path)
             return None
         
-        wb = openpyxl.load_workbook(template_path)
+        wb = _certificate_templates.clone(template_path)
         
         # Get the correct analyst sheet or use first sheet
         analyst_name = analysis.analyst if analysis.analyst else "Benjamin"
@@ -1457,7 +2551,7 @@ def create_physchem_excel(analysis, analyst_signature_scale=100, approver_signat
         set_sheet_to_a4(ws)
 
         # Save file
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], 'physchem', filename)
+        filepath = os.path.join(output_dir or os.path.join(app.config['UPLOAD_FOLDER'], 'physchem'), filename)
         wb.save(filepath)
         app.logger.info("PhysChem Excel file created: %s", filename)
         return filename
@@ -1470,34 +2564,35 @@ def create_micro_excel(
     show_benjamin=False,
     show_eric=False,
     analyst_signature_scale=100,
-    approver_signature_scale=100
+    approver_signature_scale=100,
+    output_dir=None
 ):
     """Generate Excel file from MicrobiologicalAnalysis record using template"""
     try:
-        template_path = 'MicroTemplate.xlsx'
+        template_path = MICRO_TEMPLATE_PATH
         
         # Load template
         if not os.path.exists(template_path):
             app.logger.error("Micro template not found: %s", template_path)
             return None
         
-        wb = openpyxl.load_workbook(template_path)
+        wb = _certificate_templates.clone(template_path)
         ws = wb.active
         
         # Fill in client information (based on your template)
-        ws['B9'] = analysis.client or ''  # Client
-        ws['B10'] = analysis.source or ''  # Source
-        ws['B11'] = analysis.location or ''  # Location
+        write_to_cell(ws, 'B9', analysis.client or '')  # Client
+        write_to_cell(ws, 'B10', analysis.source or '')  # Source
+        write_to_cell(ws, 'B11', analysis.location or '')  # Location
         
-        ws['B13'] = str(analysis.date_collected) if analysis.date_collected else ''  # Date Collected
-        ws['B14'] = str(analysis.date_analyzed) if analysis.date_analyzed else ''  # Date Analyzed
+        write_to_cell(ws, 'B13', str(analysis.date_collected) if analysis.date_collected else '')  # Date Collected
+        write_to_cell(ws, 'B14', str(analysis.date_analyzed) if analysis.date_analyzed else '')  # Date Analyzed
         
         # Right side
         file_num_text = f"{analysis.file_prefix}{analysis.file_number}" if analysis.file_number else ""
-        ws['F9'] = file_num_text  # FILE #
-        ws['F10'] = analysis.or_number or ''  # O.R. #
-        ws['F13'] = str(analysis.date_submitted) if analysis.date_submitted else ''  # Date Submitted
-        ws['F14'] = analysis.collected_by or ''  # Collected By
+        write_to_cell(ws, 'F9', file_num_text)  # FILE #
+        write_to_cell(ws, 'F10', analysis.or_number or '')  # O.R. #
+        write_to_cell(ws, 'F13', str(analysis.date_submitted) if analysis.date_submitted else '')  # Date Submitted
+        write_to_cell(ws, 'F14', analysis.collected_by or '')  # Collected By
         
         # Fill in test results (rows 19-22)
         # Fill in test results (rows 19-22)
@@ -1537,7 +2632,7 @@ def create_micro_excel(
             if value is not None:
                 # Result with unit in column C (merged with D)
                 result_text = f"{value} {unit}"
-                ws[f'C{row}'] = result_text
+                write_to_cell(ws, f'C{row}', result_text)
                 ws[f'C{row}'].font = Font(name='Calibri', size=10)
                 ws[f'C{row}'].alignment = Alignment(horizontal='center', vertical='center')
                 
@@ -1546,7 +2641,7 @@ def create_micro_excel(
                 remark = 'POSITIVE' if is_positive else 'NEGATIVE'
                 color = 'FF0000' if is_positive else '00FF00'
                 
-                ws[f'F{row}'] = remark
+                write_to_cell(ws, f'F{row}', remark)
                 ws[f'F{row}'].font = Font(name='Calibri', size=10, bold=True, color=color)
         
         # Add Benjamin's signature
@@ -1601,7 +2696,7 @@ def create_micro_excel(
    
         
         # Save file
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], 'micro', filename)
+        filepath = os.path.join(output_dir or os.path.join(app.config['UPLOAD_FOLDER'], 'micro'), filename)
         wb.save(filepath)
         app.logger.info("Micro Excel file created: %s", filename)
         return filename
@@ -1609,47 +2704,689 @@ def create_micro_excel(
         app.logger.exception("Error creating Micro Excel file")
         return None
 
-def convert_excel_to_pdf(excel_path):
-    """Convert Excel file to PDF using LibreOffice"""
+class _PdfConversionService:
+    """Converts Excel files to PDF on resident, pre-started LibreOffice workers.
+
+    Each worker thread owns its own LibreOffice user profile, so workers never
+    contend for a profile lock. When the ``uno`` bridge is importable the
+    worker keeps a headless soffice listening on a private pipe and converts
+    through it; otherwise it falls back to the CLI, but converts every request
+    queued within the batch window in a single ``--convert-to`` invocation.
+    """
+
+    def __init__(self):
+        self._start_lock = threading.Lock()
+        self._requests = queue.Queue()
+        self._workers = []
+        self._processes = {}
+        self._binary = None
+        self._stopping = threading.Event()
+
+    def _resolve_binary(self):
+        if self._binary is None:
+            configured = app.config.get('LIBREOFFICE_BINARY')
+            candidates = [configured] if configured else ['soffice', 'libreoffice']
+            self._binary = next((path for path in map(shutil.which, candidates) if path), '')
+        return self._binary
+
+    def _ensure_started(self):
+        with self._start_lock:
+            if self._workers:
+                return
+            self._stopping.clear()
+            for index in range(max(1, int(app.config.get('PDF_CONVERTER_WORKERS', 1)))):
+                worker = threading.Thread(
+                    target=self._run_worker,
+                    args=(index,),
+                    name=f'pdf-converter-{index}',
+                    daemon=True
+                )
+                worker.start()
+                self._workers.append(worker)
+
+    def convert_many(self, excel_paths, timeout: float = None):
+        """Convert the given workbooks and return their PDF filenames (None where conversion failed)."""
+        if not excel_paths:
+            return []
+        if not self._resolve_binary():
+            app.logger.error("LibreOffice not found")
+            return [None] * len(excel_paths)
+
+        self._ensure_started()
+        if timeout is None:
+            # Allow for the extra files in a bulk batch on top of the per-request timeout
+            timeout = float(app.config.get('PDF_CONVERSION_TIMEOUT_SECONDS', 60)) + 10 * (len(excel_paths) - 1)
+        deadline = time.monotonic() + timeout
+
+        pending = [
+            {'path': os.path.abspath(excel_path), 'done': threading.Event(), 'result': None}
+            for excel_path in excel_paths
+        ]
+        # Large requests are split evenly across workers and each share is converted as one batch
+        chunk_size = -(-len(pending) // len(self._workers))
+        for start in range(0, len(pending), chunk_size):
+            self._requests.put(pending[start:start + chunk_size])
+
+        results = []
+        for request_item in pending:
+            if not request_item['done'].wait(max(0, deadline - time.monotonic())):
+                app.logger.error("Timed out waiting for PDF conversion: %s", request_item['path'])
+            results.append(request_item['result'])
+        return results
+
+    def shutdown(self):
+        self._stopping.set()
+        for _ in self._workers:
+            self._requests.put(None)
+        for worker in self._workers:
+            worker.join(timeout=5)
+        self._workers = []
+        for index in list(self._processes):
+            self._stop_office(index)
+
+    def _next_batch(self):
+        first = self._requests.get()
+        if first is None:
+            return None
+
+        batch = list(first)
+        batch_size = max(1, int(app.config.get('PDF_CONVERTER_BATCH_SIZE', 8)))
+        deadline = time.monotonic() + app.config.get('PDF_CONVERTER_BATCH_WINDOW_MS', 50) / 1000.0
+        while len(batch) < batch_size:
+            try:
+                request_items = self._requests.get(timeout=max(0, deadline - time.monotonic()))
+            except queue.Empty:
+                break
+            if request_items is None:
+                # Leave the stop marker for this worker's next iteration
+                self._requests.put(None)
+                break
+            batch.extend(request_items)
+        return batch
+
+    def _run_worker(self, index):
+        with app.app_context():
+            while not self._stopping.is_set():
+                batch = self._next_batch()
+                if batch is None:
+                    break
+                try:
+                    self._convert_batch(index, batch)
+                except Exception:
+                    app.logger.exception("PDF conversion worker %s failed", index)
+                finally:
+                    for request_item in batch:
+                        request_item['done'].set()
+
+    def _profile_url(self, index):
+        profile_dir = os.path.join(app.instance_path, 'libreoffice', f'worker-{index}')
+        os.makedirs(profile_dir, exist_ok=True)
+        return 'file://' + os.path.abspath(profile_dir)
+
+    def _convert_batch(self, index, batch):
+        desktop = self._ensure_office(index)
+        if desktop is not None:
+            try:
+                for request_item in batch:
+                    request_item['result'] = self._convert_with_uno(desktop, request_item['path'])
+                return
+            except Exception:
+                app.logger.exception("Resident LibreOffice %s failed; restarting it", index)
+                self._stop_office(index)
+                batch = [item for item in batch if item['result'] is None]
+
+        self._convert_with_cli(index, batch)
+
+    def _ensure_office(self, index):
+        """Return a UNO desktop for this worker's resident soffice, or None when UNO is unavailable."""
+        try:
+            import uno
+        except ImportError:
+            return None
+
+        entry = self._processes.get(index)
+        if entry and entry['process'].poll() is None:
+            return entry['desktop']
+        self._stop_office(index)
+
+        import subprocess
+
+        pipe_name = f'wq_pdf_{os.getpid()}_{index}'
+        process = subprocess.Popen([
+            self._resolve_binary(),
+            '--headless', '--invisible', '--nologo', '--norestore', '--nodefault', '--nolockcheck',
+            f'-env:UserInstallation={self._profile_url(index)}',
+            f'--accept=pipe,name={pipe_name};urp;StarOffice.ComponentContext'
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            'com.sun.star.bridge.UnoUrlResolver', local_context
+        )
+        deadline = time.monotonic() + 30
+        while True:
+            try:
+                context = resolver.resolve(f'uno:pipe,name={pipe_name};urp;StarOffice.ComponentContext')
+                break
+            except Exception:
+                if process.poll() is not None or time.monotonic() > deadline:
+                    process.kill()
+                    app.logger.error("Could not start resident LibreOffice worker %s", index)
+                    return None
+                time.sleep(0.25)
+
+        desktop = context.ServiceManager.createInstanceWithContext('com.sun.star.frame.Desktop', context)
+        self._processes[index] = {'process': process, 'desktop': desktop}
+        app.logger.info("Resident LibreOffice worker %s started (pid %s)", index, process.pid)
+        return desktop
+
+    def _stop_office(self, index):
+        entry = self._processes.pop(index, None)
+        if not entry:
+            return
+        try:
+            entry['desktop'].terminate()
+        except Exception:
+            pass
+        try:
+            entry['process'].wait(timeout=5)
+        except Exception:
+            entry['process'].kill()
+
+    @staticmethod
+    def _convert_with_uno(desktop, excel_path):
+        import uno
+        from com.sun.star.beans import PropertyValue
+
+        def _property(name, value):
+            prop = PropertyValue()
+            prop.Name = name
+            prop.Value = value
+            return prop
+
+        pdf_path = os.path.splitext(excel_path)[0] + '.pdf'
+        document = desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(excel_path), '_blank', 0, (_property('Hidden', True),)
+        )
+        try:
+            document.storeToURL(uno.systemPathToFileUrl(pdf_path), (_property('FilterName', 'calc_pdf_Export'),))
+        finally:
+            document.close(True)
+        return os.path.basename(pdf_path) if os.path.exists(pdf_path) else None
+
+    def _convert_with_cli(self, index, batch):
+        import subprocess
+
+        by_directory = defaultdict(list)
+        for request_item in batch:
+            by_directory[os.path.dirname(request_item['path'])].append(request_item)
+
+        for excel_dir, items in by_directory.items():
+            try:
+                subprocess.run([
+                    self._resolve_binary(),
+                    '--headless', '--norestore', '--nolockcheck',
+                    f'-env:UserInstallation={self._profile_url(index)}',
+                    '--convert-to', 'pdf',
+                    '--outdir', excel_dir,
+                    *[item['path'] for item in items]
+                ], capture_output=True, timeout=30 + 10 * len(items))
+            except Exception:
+                app.logger.exception("LibreOffice batch conversion failed in %s", excel_dir)
+
+            for item in items:
+                pdf_path = os.path.splitext(item['path'])[0] + '.pdf'
+                item['result'] = os.path.basename(pdf_path) if os.path.exists(pdf_path) else None
+
+
+_pdf_conversion_service = _PdfConversionService()
+atexit.register(_pdf_conversion_service.shutdown)
+
+
+def convert_excel_files_to_pdf(excel_paths):
+    """Convert several Excel files to PDF in as few LibreOffice calls as possible"""
+    results = _pdf_conversion_service.convert_many(list(excel_paths))
+    for excel_path, pdf_filename in zip(excel_paths, results):
+        if pdf_filename:
+            app.logger.info("PDF created successfully: %s", pdf_filename)
+        else:
+            app.logger.error("PDF conversion failed for: %s", excel_path)
+    return results
+
+
+def convert_excel_to_pdf(excel_path):
+    """Convert Excel file to PDF using LibreOffice"""
+    try:
+        return convert_excel_files_to_pdf([excel_path])[0]
+    except Exception as e:
+        app.logger.exception("Error converting Excel to PDF: %s", excel_path)
+        return None
+
+
+class _DocumentJobQueue:
+    """Generates certificate Excel/PDF files and bulk exports on a thread pool instead of in the request.
+
+    Jobs are persisted in document_jobs so their status can be polled and
+    survives restarts; jobs still queued, or running for longer than
+    DOCUMENT_JOB_LEASE_SECONDS, when the pool starts are picked up again.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._handlers = {}
+
+    def register(self, kind: str, handler):
+        self._handlers[kind] = handler
+
+    def ensure_started(self):
+        with self._lock:
+            if self._executor is not None:
+                return
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, app.config.get('DOCUMENT_JOB_WORKERS', 2)),
+                thread_name_prefix='document-job'
+            )
+
+            # Jobs interrupted by a restart are queued again. Other worker
+            # processes may still be running jobs, so only jobs that have
+            # outlived the lease are treated as abandoned.
+            lease_expired = datetime.utcnow() - timedelta(seconds=app.config.get('DOCUMENT_JOB_LEASE_SECONDS', 3600))
+            DocumentJob.query.filter(
+                DocumentJob.status == 'running',
+                DocumentJob.started_at < lease_expired
+            ).update({'status': 'queued'})
+            db.session.commit()
+            pending_ids = [
+                job_id for (job_id,) in
+                db.session.query(DocumentJob.id).filter_by(status='queued').order_by(DocumentJob.created_at).all()
+            ]
+
+        for job_id in pending_ids:
+            self._executor.submit(self._run, job_id)
+
+    def submit(self, kind: str, record_id: int, options: dict = None, run_inline: bool = False):
+        if kind not in self._handlers:
+            raise ValueError(f'Unknown document job kind: {kind}')
+
+        self.ensure_started()
+        job = DocumentJob(
+            id=uuid.uuid4().hex,
+            kind=kind,
+            record_id=record_id,
+            status='queued',
+            options=json.dumps(options or {})
+        )
+        db.session.add(job)
+        db.session.commit()
+
+        if run_inline:
+            self._run(job.id)
+            db.session.refresh(job)
+        else:
+            self._executor.submit(self._run, job.id)
+        return job
+
+    def _claim(self, job_id: str) -> bool:
+        claimed = (
+            DocumentJob.query
+            .filter_by(id=job_id, status='queued')
+            .update({'status': 'running', 'started_at': datetime.utcnow(), 'error': None})
+        )
+        db.session.commit()
+        return claimed == 1
+
+    def _run(self, job_id: str):
+        with app.app_context():
+            if not self._claim(job_id):
+                return
+
+            job = db.session.get(DocumentJob, job_id)
+            try:
+                outputs = self._handlers[job.kind](job.record_id, json.loads(job.options or '{}'))
+                for field, value in outputs.items():
+                    setattr(job, field, value)
+                job.status = 'succeeded' if any(outputs.values()) else 'failed'
+                if job.status == 'failed':
+                    job.error = 'No output file was generated.'
+            except Exception as exc:
+                db.session.rollback()
+                app.logger.exception('Document job %s failed', job_id)
+                job = db.session.get(DocumentJob, job_id)
+                job.status = 'failed'
+                job.error = str(exc)
+
+            job.finished_at = datetime.utcnow()
+            db.session.commit()
+
+
+def _generate_physchem_certificate(record_id: int, options: dict):
+    analysis = db.session.get(PhysChemAnalysis, record_id)
+    if analysis is None:
+        raise ValueError(f'PhysChem analysis {record_id} not found')
+
+    excel_filename = create_physchem_excel(
+        analysis,
+        analyst_signature_scale=options.get('analyst_signature_scale'),
+        approver_signature_scale=options.get('approver_signature_scale')
+    )
+
+    pdf_filename = None
+    if excel_filename:
+        excel_path = os.path.join(app.config['UPLOAD_FOLDER'], 'physchem', excel_filename)
+        pdf_filename = convert_excel_to_pdf(excel_path)
+    return {'excel_file': excel_filename, 'pdf_file': pdf_filename}
+
+
+def _generate_micro_certificate(record_id: int, options: dict):
+    analysis = db.session.get(MicrobiologicalAnalysis, record_id)
+    if analysis is None:
+        raise ValueError(f'Microbiological analysis {record_id} not found')
+
+    excel_filename = create_micro_excel(
+        analysis,
+        options.get('show_benjamin', False),
+        options.get('show_eric', False),
+        options.get('analyst_signature_scale', 100),
+        options.get('approver_signature_scale', 100)
+    )
+
+    pdf_filename = None
+    if excel_filename:
+        excel_path = os.path.join(app.config['UPLOAD_FOLDER'], 'micro', excel_filename)
+        pdf_filename = convert_excel_to_pdf(excel_path)
+
+    # Saved with the job's commit
+    analysis.excel_file = excel_filename
+    analysis.pdf_file = pdf_filename
+    return {'excel_file': excel_filename, 'pdf_file': pdf_filename}
+
+
+_document_job_queue = _DocumentJobQueue()
+_document_job_queue.register('physchem_certificate', _generate_physchem_certificate)
+_document_job_queue.register('micro_certificate', _generate_micro_certificate)
+
+
+@app.before_request
+def start_document_job_queue():
+    _document_job_queue.ensure_started()
+
+
+def _document_job_response(job, message: str, record_id: int):
+    """Respond 201 with the files for a job that already ran, or 202 with its status URL."""
+    payload = {
+        'message': message,
+        'id': record_id,
+        'job_id': job.id,
+        'job_status': job.status,
+        'status_url': f'/api/jobs/{job.id}'
+    }
+    if job.status in ('succeeded', 'failed'):
+        payload.update({'excel_file': job.excel_file, 'pdf_file': job.pdf_file})
+        return jsonify(payload), 201
+    return jsonify(payload), 202
+
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def get_document_job(job_id):
+    try:
+        job = db.session.get(DocumentJob, job_id)
+        if job is None:
+            return jsonify({'error': 'Job not found'}), 404
+        return jsonify(job.to_dict()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+
+CERTIFICATE_EXPORT_MODELS = {
+    'physchem': PhysChemAnalysis,
+    'micro': MicrobiologicalAnalysis
+}
+CERTIFICATE_EXPORT_MAX_RECORDS = 500
+
+
+def _render_certificate_workbook(kind: str, analysis, options: dict, output_dir: str):
+    if kind == 'physchem':
+        return create_physchem_excel(
+            analysis,
+            analyst_signature_scale=options.get('analyst_signature_scale'),
+            approver_signature_scale=options.get('approver_signature_scale'),
+            output_dir=output_dir
+        )
+    return create_micro_excel(
+        analysis,
+        options.get('show_benjamin', False),
+        options.get('show_eric', False),
+        options.get('analyst_signature_scale', 100),
+        options.get('approver_signature_scale', 100),
+        output_dir=output_dir
+    )
+
+
+def _export_certificate_worker(kind: str, record_id: int, options: dict, output_dir: str):
+    """Process pool entry point: render one certificate workbook and return its path.
+
+    Workers are spawned, so they import this module afresh; importing it only
+    sets up the app and database, background threads start on first request.
+    """
+    with app.app_context():
+        analysis = db.session.get(CERTIFICATE_EXPORT_MODELS[kind], record_id)
+        if analysis is None:
+            return None
+
+        os.makedirs(output_dir, exist_ok=True)
+        filename = _render_certificate_workbook(kind, analysis, options, output_dir)
+        return os.path.join(output_dir, filename) if filename else None
+
+
+def _render_certificate_workbooks(kind: str, record_ids, options: dict, work_dir: str):
+    """Render workbooks on a process pool; each record gets its own directory so equal filenames never clash."""
+    tasks = [(kind, record_id, options, os.path.join(work_dir, str(record_id))) for record_id in record_ids]
+    processes = min(len(tasks), os.cpu_count() or 1, max(1, int(app.config.get('CERTIFICATE_EXPORT_PROCESSES', 4))))
+    if processes == 1:
+        return [_export_certificate_worker(*task) for task in tasks]
+
+    # Never fork: locks held by this process's scheduler, converter and job threads would stay locked in the child
+    with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context('spawn')) as pool:
+        return list(pool.map(_export_certificate_worker, *zip(*tasks), chunksize=max(1, len(tasks) // (processes * 4))))
+
+
+def _certificate_export_dir():
+    return os.path.abspath(os.path.join(app.config['UPLOAD_FOLDER'], 'exports'))
+
+
+def _prune_certificate_exports():
+    """Delete export files that were never downloaded within the retention period."""
+    export_dir = _certificate_export_dir()
+    if not os.path.isdir(export_dir):
+        return
+
+    cutoff = time.time() - app.config.get('CERTIFICATE_EXPORT_RETENTION_HOURS', 24) * 3600
+    for entry in os.scandir(export_dir):
+        if entry.stat().st_mtime >= cutoff:
+            continue
+        if entry.is_dir():
+            shutil.rmtree(entry.path, ignore_errors=True)
+        else:
+            os.remove(entry.path)
+
+
+def _generate_certificate_export(record_id: int, options: dict):
+    """Document job handler: regenerate a set of certificates into one ZIP or merged PDF."""
+    kind = options['kind']
+    export_format = options['format']
+    record_ids = options['record_ids']
+
+    _prune_certificate_exports()
+    export_dir = _certificate_export_dir()
+    work_dir = os.path.join(export_dir, uuid.uuid4().hex)
+    try:
+        workbook_paths = _render_certificate_workbooks(kind, record_ids, options.get('render', {}), work_dir)
+
+        # Flatten into one directory so LibreOffice converts the whole export in one batch
+        certificates_dir = os.path.join(work_dir, 'certificates')
+        os.makedirs(certificates_dir, exist_ok=True)
+        excel_paths = []
+        failed_ids = []
+        for certificate_id, workbook_path in zip(record_ids, workbook_paths):
+            if not workbook_path:
+                failed_ids.append(certificate_id)
+                continue
+            stem, extension = os.path.splitext(os.path.basename(workbook_path))
+            target = os.path.join(certificates_dir, stem + extension)
+            if os.path.exists(target):
+                target = os.path.join(certificates_dir, f'{stem}_{certificate_id}{extension}')
+            shutil.move(workbook_path, target)
+            excel_paths.append(target)
+
+        if not excel_paths:
+            raise RuntimeError(f'Failed to generate certificates for records {failed_ids}')
+        if failed_ids:
+            app.logger.warning("%s certificate export skipped records %s", kind, failed_ids)
+
+        pdf_filenames = convert_excel_files_to_pdf(excel_paths)
+
+        # Built inside work_dir and moved into place under a unique name once complete
+        artifact_path = os.path.join(work_dir, f'export.{export_format}')
+        if export_format == 'pdf':
+            if not all(pdf_filenames):
+                raise RuntimeError('PDF conversion failed for one or more certificates')
+
+            from pypdf import PdfWriter
+
+            writer = PdfWriter()
+            for pdf_filename in pdf_filenames:
+                writer.append(os.path.join(certificates_dir, pdf_filename))
+            with open(artifact_path, 'wb') as output:
+                writer.write(output)
+        else:
+            with zipfile.ZipFile(artifact_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+                for excel_path, pdf_filename in zip(excel_paths, pdf_filenames):
+                    archive.write(excel_path, os.path.basename(excel_path))
+                    if pdf_filename:
+                        archive.write(os.path.join(certificates_dir, pdf_filename), pdf_filename)
+
+        output_file = f'{uuid.uuid4().hex}.{export_format}'
+        os.replace(artifact_path, os.path.join(export_dir, output_file))
+        return {'output_file': output_file}
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+_document_job_queue.register('certificate_export', _generate_certificate_export)
+
+
+def _certificate_export_options(kind: str):
+    args = request.args
+    options = {
+        'analyst_signature_scale': args.get('analystSignatureScale', type=float),
+        'approver_signature_scale': args.get('approverSignatureScale', type=float)
+    }
+    if kind == 'micro':
+        options.update({
+            'show_benjamin': args.get('showSignature', '').lower() == 'true',
+            'show_eric': args.get('showEricSignature', '').lower() == 'true',
+            'analyst_signature_scale': options['analyst_signature_scale'] or 100,
+            'approver_signature_scale': options['approver_signature_scale'] or 100
+        })
+    return options
+
+
+def _certificate_export_response(kind: str):
+    """Queue a job that regenerates the certificates matching the request filters; 202 with its status URL."""
+    model = CERTIFICATE_EXPORT_MODELS[kind]
+    export_format = request.args.get('format', 'zip').lower()
+    if export_format not in ('zip', 'pdf'):
+        return jsonify({'error': 'format must be zip or pdf'}), 400
+
+    if export_format == 'pdf':
+        try:
+            import pypdf  # noqa: F401
+        except ImportError:
+            return jsonify({'error': 'pypdf is not installed in backend environment.'}), 400
+
+    query = model.query
+    start_date = request.args.get('start_date')
+    end_date = request.args.get('end_date')
+    if start_date:
+        query = query.filter(model.date_analyzed >= datetime.strptime(start_date, '%Y-%m-%d').date())
+    if end_date:
+        query = query.filter(model.date_analyzed <= datetime.strptime(end_date, '%Y-%m-%d').date())
+    client = (request.args.get('client') or '').strip()
+    if client:
+        query = query.filter(model.client.ilike(f'%{client}%'))
+    file_numbers = [number.strip() for number in request.args.get('file_numbers', '').split(',') if number.strip()]
+    if file_numbers:
+        query = query.filter(model.file_number.in_(file_numbers))
+
+    record_ids = [
+        row.id for row in query.with_entities(model.id)
+        .order_by(model.date_analyzed, model.id)
+        .limit(CERTIFICATE_EXPORT_MAX_RECORDS + 1)
+    ]
+    if not record_ids:
+        return jsonify({'error': 'No records match the export filters'}), 404
+    if len(record_ids) > CERTIFICATE_EXPORT_MAX_RECORDS:
+        return jsonify({'error': f'Export is limited to {CERTIFICATE_EXPORT_MAX_RECORDS} records; narrow the filters'}), 400
+
+    job = _document_job_queue.submit(
+        'certificate_export',
+        0,
+        {
+            'kind': kind,
+            'format': export_format,
+            'record_ids': record_ids,
+            'render': _certificate_export_options(kind)
+        }
+    )
+    return jsonify({
+        'message': f'Exporting {len(record_ids)} certificates',
+        'record_count': len(record_ids),
+        'job_id': job.id,
+        'job_status': job.status,
+        'status_url': f'/api/jobs/{job.id}',
+        'download_url': f'/api/jobs/{job.id}/download'
+    }), 202
+
+
+@app.route('/api/jobs/<job_id>/download', methods=['GET'])
+def download_document_job_output(job_id):
     try:
-        import subprocess
-        
-        # Get directory and filename
-        excel_dir = os.path.dirname(excel_path)
-        excel_filename = os.path.basename(excel_path)
-        pdf_filename = excel_filename.replace('.xlsx', '.pdf')
-        pdf_path = os.path.join(excel_dir, pdf_filename)
-        
-        # Check if LibreOffice is available
-        result = subprocess.run(
-            ['libreoffice', '--version'],
-            capture_output=True,
-            timeout=5
+        job = db.session.get(DocumentJob, job_id)
+        if job is None:
+            return jsonify({'error': 'Job not found'}), 404
+        if job.status != 'succeeded' or not job.output_file:
+            return jsonify({'error': 'Job has no output to download', 'job_status': job.status}), 409
+
+        export_dir = _certificate_export_dir()
+        output_path = os.path.join(export_dir, job.output_file)
+        if not os.path.exists(output_path):
+            return jsonify({'error': 'Export was already downloaded or has expired'}), 410
+
+        options = json.loads(job.options or '{}')
+        extension = os.path.splitext(job.output_file)[1]
+        download_name = f"{options.get('kind', 'document').upper()}_Certificates_{job.created_at.strftime('%Y%m%d_%H%M%S')}{extension}"
+
+        def stream_output():
+            # Exports are downloaded once; the file goes away when the response is closed
+            try:
+                with open(output_path, 'rb') as output:
+                    while chunk := output.read(64 * 1024):
+                        yield chunk
+            finally:
+                if os.path.exists(output_path):
+                    os.remove(output_path)
+
+        return Response(
+            stream_output(),
+            mimetype='application/pdf' if extension == '.pdf' else 'application/zip',
+            headers={
+                'Content-Disposition': f'attachment; filename={download_name}',
+                'Content-Length': str(os.path.getsize(output_path))
+            }
         )
-        
-        if result.returncode != 0:
-            app.logger.error("LibreOffice not found")
-            return None
-        
-        # Convert Excel to PDF using LibreOffice headless
-        subprocess.run([
-            'libreoffice',
-            '--headless',
-            '--convert-to', 'pdf',
-            '--outdir', excel_dir,
-            excel_path
-        ], timeout=30)
-        
-        if os.path.exists(pdf_path):
-            app.logger.info("PDF created successfully: %s", pdf_filename)
-            return pdf_filename
-        else:
-            app.logger.error("PDF conversion failed for: %s", excel_path)
-            return None
-            
     except Exception as e:
-        app.logger.exception("Error converting Excel to PDF: %s", excel_path)
-        return None
+        return jsonify({'error': str(e)}), 400
 
 
 @app.route('/api/auth/login', methods=['POST'])
@@ -1839,24 +3576,18 @@ def create_physchem():
         db.session.add(analysis)
         db.session.commit()
         
-        # Generate Excel file
-        excel_filename = create_physchem_excel(
-            analysis,
-            analyst_signature_scale=analyst_signature_scale,
-            approver_signature_scale=approver_signature_scale
+        # Generate Excel and PDF in the background; ?sync=true waits for them
+        job = _document_job_queue.submit(
+            'physchem_certificate',
+            analysis.id,
+            {
+                'analyst_signature_scale': analyst_signature_scale,
+                'approver_signature_scale': approver_signature_scale
+            },
+            run_inline=request.args.get('sync', '').lower() == 'true'
         )
         
-        pdf_filename = None
-        if excel_filename:
-            excel_path = os.path.join(app.config['UPLOAD_FOLDER'], 'physchem', excel_filename)
-            pdf_filename = convert_excel_to_pdf(excel_path)
-        
-        return jsonify({
-            'message': 'PhysChem analysis saved successfully!',
-            'id': analysis.id,
-            'excel_file': excel_filename,
-            'pdf_file': pdf_filename
-        }), 201
+        return _document_job_response(job, 'PhysChem analysis saved successfully!', analysis.id)
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 400
@@ -1864,8 +3595,7 @@ def create_physchem():
 @app.route('/api/physchem', methods=['GET'])
 def get_all_physchem():
     try:
-        analyses = PhysChemAnalysis.query.order_by(PhysChemAnalysis.created_at.desc()).all()
-        return jsonify([analysis.to_dict() for analysis in analyses]), 200
+        return _paginated_list_response(PhysChemAnalysis.query, PhysChemAnalysis, PhysChemAnalysis.created_at)
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
@@ -1881,12 +3611,13 @@ def get_physchem(id):
 def search_physchem():
     try:
         query = request.args.get('q', '')
-        analyses = PhysChemAnalysis.query.filter(
+        return _search_response(
+            'physchem_search',
+            query,
             (PhysChemAnalysis.client.ilike(f'%{query}%')) |
             (PhysChemAnalysis.location.ilike(f'%{query}%')) |
             (PhysChemAnalysis.file_number.ilike(f'%{query}%'))
-        ).order_by(PhysChemAnalysis.created_at.desc()).all()
-        return jsonify([analysis.to_dict() for analysis in analyses]), 200
+        )
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
@@ -1928,32 +3659,20 @@ def create_micro():
         db.session.add(analysis)
         db.session.commit()
         
-        # Generate Excel file WITH signature flags
-        excel_filename = create_micro_excel(
-            analysis,
-            show_benjamin,
-            show_eric,
-            analyst_signature_scale,
-            approver_signature_scale
+        # Generate Excel (with signature flags) and PDF in the background; ?sync=true waits for them
+        job = _document_job_queue.submit(
+            'micro_certificate',
+            analysis.id,
+            {
+                'show_benjamin': show_benjamin,
+                'show_eric': show_eric,
+                'analyst_signature_scale': analyst_signature_scale,
+                'approver_signature_scale': approver_signature_scale
+            },
+            run_inline=request.args.get('sync', '').lower() == 'true'
         )
         
-        # Generate PDF from Excel
-        pdf_filename = None
-        if excel_filename:
-            excel_path = os.path.join(app.config['UPLOAD_FOLDER'], 'micro', excel_filename)
-            pdf_filename = convert_excel_to_pdf(excel_path)
-        
-        # Save filenames to database
-        analysis.excel_file = excel_filename
-        analysis.pdf_file = pdf_filename
-        db.session.commit()
-        
-        return jsonify({
-            'message': 'Microbiological analysis saved successfully!',
-            'id': analysis.id,
-            'excel_file': excel_filename,
-            'pdf_file': pdf_filename
-        }), 201
+        return _document_job_response(job, 'Microbiological analysis saved successfully!', analysis.id)
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 400
@@ -1961,8 +3680,11 @@ def create_micro():
 @app.route('/api/micro', methods=['GET'])
 def get_all_micro():
     try:
-        analyses = MicrobiologicalAnalysis.query.order_by(MicrobiologicalAnalysis.created_at.desc()).all()
-        return jsonify([analysis.to_dict() for analysis in analyses]), 200
+        return _paginated_list_response(
+            MicrobiologicalAnalysis.query,
+            MicrobiologicalAnalysis,
+            MicrobiologicalAnalysis.created_at
+        )
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
@@ -1978,12 +3700,29 @@ def get_micro(id):
 def search_micro():
     try:
         query = request.args.get('q', '')
-        analyses = MicrobiologicalAnalysis.query.filter(
+        return _search_response(
+            'micro_search',
+            query,
             (MicrobiologicalAnalysis.client.ilike(f'%{query}%')) |
             (MicrobiologicalAnalysis.location.ilike(f'%{query}%'))
-        ).order_by(MicrobiologicalAnalysis.created_at.desc()).all()
-        return jsonify([analysis.to_dict() for analysis in analyses]), 200
+        )
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/api/physchem/export', methods=['GET'])
+def export_physchem_certificates():
+    try:
+        return _certificate_export_response('physchem')
     except Exception as e:
+        app.logger.exception("PhysChem certificate export failed")
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/api/micro/export', methods=['GET'])
+def export_micro_certificates():
+    try:
+        return _certificate_export_response('micro')
+    except Exception as e:
+        app.logger.exception("Micro certificate export failed")
         return jsonify({'error': str(e)}), 400
 
 # File upload routes
@@ -2148,7 +3887,7 @@ def create_water_treatment():
 @app.route('/api/screen-data/live', methods=['GET'])
 def get_live_screen_data():
     try:
-        payload = _run_scrape_coroutine(_scrape_screen_data_live)
+        payload = _screen_data_scheduler.get_live_payload()
         return jsonify(payload), 200
     except Exception as e:
         app.logger.exception("Live screen data scrape failed")
@@ -2156,6 +3895,35 @@ def get_live_screen_data():
         return jsonify(fallback_payload), 200
 
 
+@app.route('/api/screen-data/stream', methods=['GET'])
+def stream_screen_data():
+    subscriber = _screen_data_broadcaster.subscribe()
+    try:
+        initial_payload = _screen_data_scheduler.get_live_payload(wait=False)
+    except Exception as e:
+        app.logger.exception("Initial screen data stream payload failed")
+        initial_payload = _build_screen_data_fallback_payload(str(e))
+    heartbeat_seconds = app.config.get('SCREEN_DATA_STREAM_HEARTBEAT_SECONDS', 25)
+
+    def generate():
+        try:
+            yield f"data: {json.dumps(initial_payload)}\n\n"
+            while True:
+                try:
+                    message = subscriber.get(timeout=heartbeat_seconds)
+                except queue.Empty:
+                    yield ': keep-alive\n\n'
+                    continue
+                yield f"data: {message}\n\n"
+        finally:
+            _screen_data_broadcaster.unsubscribe(subscriber)
+
+    response = Response(stream_with_context(generate()), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+
 @app.route('/api/screen-data/history', methods=['GET'])
 def get_screen_data_history():
     try:
@@ -2177,8 +3945,34 @@ def get_screen_data_history():
             except ValueError:
                 return jsonify({'error': 'Invalid end_date format. Use YYYY-MM-DD.'}), 400
 
-        grouped_history = _build_screen_data_history(start_date=start_date, end_date=end_date)
-        return jsonify(grouped_history), 200
+        days = request.args.get('days', type=int)
+        cursor_value = request.args.get('cursor')
+
+        wants_ndjson = (
+            request.args.get('format') == 'ndjson'
+            or request.accept_mimetypes.best == 'application/x-ndjson'
+        )
+        if wants_ndjson:
+            def generate():
+                for group in _iter_screen_data_history_groups(start_date, end_date):
+                    yield json.dumps(group) + '\n'
+
+            return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
+
+        if days is None and not cursor_value:
+            grouped_history = _build_screen_data_history(start_date=start_date, end_date=end_date)
+            return jsonify(grouped_history), 200
+
+        cursor = None
+        if cursor_value:
+            try:
+                cursor = datetime.strptime(cursor_value, '%Y-%m-%d')
+            except ValueError:
+                return jsonify({'error': 'Invalid cursor format. Use YYYY-MM-DD.'}), 400
+
+        days = max(1, min(days or 7, 366))
+        page = _build_screen_data_history_page(start_date=start_date, end_date=end_date, days=days, cursor=cursor)
+        return jsonify(page), 200
     except Exception as e:
         app.logger.exception('Failed to fetch screen data history')
         return jsonify({'error': str(e)}), 500
@@ -2205,7 +3999,8 @@ def get_screen_data_missing_hours():
             except ValueError:
                 return jsonify({'error': 'Invalid end_date format. Use YYYY-MM-DD.'}), 400
 
-        payload = _build_missing_screen_data_hours(start_date=start_date, end_date=end_date)
+        include_entries = request.args.get('entries', 'true').lower() != 'false'
+        payload = _build_missing_screen_data_hours(start_date=start_date, end_date=end_date, include_entries=include_entries)
         return jsonify(payload), 200
     except Exception as e:
         app.logger.exception('Failed to scan missing screen data hours')
@@ -2223,6 +4018,7 @@ def save_screen_data_manual_entries():
         entries = payload.get('entries')
 
         saved_count = _upsert_manual_screen_data_entries(entries)
+        _publish_screen_data_update()
         return jsonify({'message': f'Saved {saved_count} manual entr{("y" if saved_count == 1 else "ies")}.', 'savedCount': saved_count}), 200
     except ValueError as e:
         db.session.rollback()
@@ -2250,6 +4046,7 @@ def manage_last_chlorine_tank_change():
             return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD.'}), 400
 
         saved_value = _set_last_chlorine_tank_change(date_value)
+        _publish_screen_data_update()
         return jsonify({'message': 'Last chlorine tank change updated.', 'date': saved_value}), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 400
@@ -2272,15 +4069,32 @@ def manage_last_active_dosing():
             return jsonify({'error': 'Value is too long (max 120 characters).'}), 400
 
         saved_value = _set_last_active_dosing(value)
+        _publish_screen_data_update()
         return jsonify({'message': 'Last active dosing updated.', 'value': saved_value}), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
+@app.route('/api/screen-data/treatment-hours', methods=['GET'])
+def get_screen_data_treatment_hours():
+    try:
+        year = request.args.get('year', type=int) or datetime.now().year
+        threshold = request.args.get('threshold', type=float)
+        if threshold is None:
+            threshold = TREATMENT_HOUR_THRESHOLD
+
+        return jsonify(_build_treatment_hours_series(year, threshold)), 200
+    except Exception as e:
+        app.logger.exception('Failed to fetch treatment hours')
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/water-treatment', methods=['GET'])
 def get_all_water_treatment():
     try:
-        readings = WaterTreatmentReading.query.order_by(WaterTreatmentReading.reading_datetime.desc()).all()
-        return jsonify([reading.to_dict() for reading in readings]), 200
+        return _paginated_list_response(
+            WaterTreatmentReading.query,
+            WaterTreatmentReading,
+            WaterTreatmentReading.reading_datetime
+        )
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
@@ -2295,28 +4109,196 @@ def get_water_treatment(id):
 @app.route('/api/water-treatment/search', methods=['GET'])
 def search_water_treatment():
     try:
-        start_date = request.args.get('start_date')
-        end_date = request.args.get('end_date')
-        
-        query = WaterTreatmentReading.query
-        
-        if start_date:
-            start_dt = datetime.fromisoformat(start_date)
-            query = query.filter(WaterTreatmentReading.reading_datetime >= start_dt)
-        
-        if end_date:
-            end_dt = datetime.fromisoformat(end_date)
-            if len(end_date) == 10:
-                end_dt = end_dt + timedelta(days=1)
-                query = query.filter(WaterTreatmentReading.reading_datetime < end_dt)
-            else:
-                query = query.filter(WaterTreatmentReading.reading_datetime <= end_dt)
-        
-        readings = query.order_by(WaterTreatmentReading.reading_datetime.desc()).all()
+        query = _water_treatment_search_query(request.args.get('start_date'), request.args.get('end_date'))
+        readings = query.all()
         return jsonify([reading.to_dict() for reading in readings]), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
+def _water_treatment_search_query(start_date: str = None, end_date: str = None):
+    """Readings between ISO ``start_date`` and ``end_date``, newest first; a bare end date includes that whole day."""
+    query = WaterTreatmentReading.query
+    
+    if start_date:
+        start_dt = datetime.fromisoformat(start_date)
+        query = query.filter(WaterTreatmentReading.reading_datetime >= start_dt)
+    
+    if end_date:
+        end_dt = datetime.fromisoformat(end_date)
+        if len(end_date) == 10:
+            end_dt = end_dt + timedelta(days=1)
+            query = query.filter(WaterTreatmentReading.reading_datetime < end_dt)
+        else:
+            query = query.filter(WaterTreatmentReading.reading_datetime <= end_dt)
+    
+    return query.order_by(WaterTreatmentReading.reading_datetime.desc())
+
+CLARIFIED_PAIRING_CHUNK_SIZE = 500
+
+
+def _reading_datetime_offset(column, offset: timedelta):
+    """SQL for ``column + offset`` as text laid out like the stored datetimes.
+
+    Comparing the bare indexed column against it keeps the lookup an index range search.
+    """
+    return func.strftime('%Y-%m-%d %H:%M:%f', column, f'{int(offset.total_seconds()):+d} seconds')
+
+
+def _nearest_reading_id(lower_offset: timedelta, upper_offset: timedelta, latest: bool):
+    """Correlated subquery for the id of the first reading (or the last, when ``latest``)
+    in ``[reading_datetime + lower_offset, reading_datetime + upper_offset)``."""
+    candidate = aliased(WaterTreatmentReading)
+    if latest:
+        order_columns = [candidate.reading_datetime.desc(), candidate.id.desc()]
+    else:
+        order_columns = [candidate.reading_datetime, candidate.id]
+    return (
+        select(candidate.id)
+        .where(
+            candidate.reading_datetime >= _reading_datetime_offset(WaterTreatmentReading.reading_datetime, lower_offset),
+            candidate.reading_datetime < _reading_datetime_offset(WaterTreatmentReading.reading_datetime, upper_offset)
+        )
+        .order_by(*order_columns)
+        .limit(1)
+        .correlate(WaterTreatmentReading)
+        .scalar_subquery()
+    )
+
+
+def _clarified_neighbour_columns(lag: timedelta, tolerance: timedelta):
+    """Ids of the nearest readings on either side of ``reading_datetime + lag`` within
+    ``tolerance``, each found with one index seek."""
+    return (
+        _nearest_reading_id(lag - tolerance, lag, latest=True),
+        # A second past the window, since a stored reading exactly on the far edge
+        # sorts after the millisecond bound; the exact tolerance is checked in Python
+        _nearest_reading_id(lag, lag + tolerance + timedelta(seconds=1), latest=False)
+    )
+
+
+def _pair_with_clarified_readings(raw_query, lag: timedelta, tolerance: timedelta):
+    """Yield ``(raw_record, clarified_record)`` pairing each raw reading with the reading
+    nearest to ``reading_datetime + lag``, when one lies within ``tolerance``.
+
+    Only the closest reading on each side of the target is looked up, so the work
+    grows with the number of raw readings rather than the time span they cover.
+    Raw readings are streamed and their candidates loaded a chunk at a time.
+    """
+    rows = iter(
+        raw_query
+        .add_columns(*_clarified_neighbour_columns(lag, tolerance))
+        .yield_per(CLARIFIED_PAIRING_CHUNK_SIZE)
+    )
+    while True:
+        chunk = list(itertools.islice(rows, CLARIFIED_PAIRING_CHUNK_SIZE))
+        if not chunk:
+            return
+
+        candidate_ids = {
+            candidate_id
+            for _, before_id, after_id in chunk
+            for candidate_id in (before_id, after_id)
+            if candidate_id is not None
+        }
+        candidates = {
+            record.id: record
+            for record in WaterTreatmentReading.query.filter(WaterTreatmentReading.id.in_(candidate_ids)).all()
+        } if candidate_ids else {}
+
+        for raw_record, before_id, after_id in chunk:
+            target = raw_record.reading_datetime + lag
+            nearest = None
+            for candidate_id in (before_id, after_id):
+                candidate = candidates.get(candidate_id)
+                if candidate is None:
+                    continue
+                distance = abs(candidate.reading_datetime - target)
+                if distance > tolerance:
+                    continue
+                if nearest is None or distance < abs(nearest.reading_datetime - target):
+                    nearest = candidate
+
+            if nearest is not None:
+                yield raw_record, nearest
+
+
+TREATMENT_RANKING_METRICS = ('clarified_avg', 'reduction_percentage', 'dose_per_ntu_removed')
+TREATMENT_RANKING_MAX_K = 100
+TREATMENT_RANKING_MAX_PAGE = 50
+
+
+def _clarified_average(clarified_record):
+    # Use the average of both phases or whichever is available
+    phase1 = clarified_record.clarified_water_phase1
+    phase2 = clarified_record.clarified_water_phase2
+    if phase1 and phase2:
+        return (phase1 + phase2) / 2
+    return phase1 or phase2 or None
+
+
+def _score_treatment_pairs(pairs, metric: str):
+    """Yield ``(score, sequence, raw_record, clarified_record, clarified_avg, reduction_pct, dose_per_ntu)``.
+
+    Lower scores rank higher. Pairs the metric cannot score are skipped.
+    """
+    for sequence, (raw_record, clarified_record) in enumerate(pairs):
+        clarified_avg = _clarified_average(clarified_record)
+        if clarified_avg is None:
+            continue
+
+        raw_turbidity = raw_record.raw_water_turbidity
+        reduction_pct = 0
+        if raw_turbidity and raw_turbidity > 0:
+            reduction_pct = ((raw_turbidity - clarified_avg) / raw_turbidity) * 100
+
+        dose_per_ntu = None
+        total_dose = (raw_record.pac_dosage or 0) + (raw_record.alum_dosage or 0)
+        if raw_turbidity is not None and raw_turbidity > clarified_avg and total_dose > 0:
+            dose_per_ntu = total_dose / (raw_turbidity - clarified_avg)
+
+        if metric == 'clarified_avg':
+            score = clarified_avg
+        elif metric == 'reduction_percentage':
+            score = -reduction_pct
+        else:
+            if dose_per_ntu is None:
+                continue
+            score = dose_per_ntu
+
+        yield score, sequence, raw_record, clarified_record, clarified_avg, reduction_pct, dose_per_ntu
+
+
+def _serialize_treatment_pair(raw_record, clarified_record, clarified_avg, reduction_pct, dose_per_ntu):
+    return {
+        'raw_record': raw_record.to_dict(),
+        'clarified_record': clarified_record.to_dict(),
+        'clarified_avg': round(clarified_avg, 2),
+        'reduction_percentage': round(reduction_pct, 2),
+        'dose_per_ntu_removed': round(dose_per_ntu, 4) if dose_per_ntu is not None else None,
+        'pac_dosage': raw_record.pac_dosage,
+        'alum_dosage': raw_record.alum_dosage,
+        'raw_turbidity': raw_record.raw_water_turbidity,
+        'dam_level': raw_record.dam_level,
+        'raw_datetime': raw_record.reading_datetime.isoformat(),
+        'clarified_datetime': clarified_record.reading_datetime.isoformat(),
+        'notes': raw_record.notes
+    }
+
+
+def _advanced_search_raw_query(raw_turbidity_min=None, raw_turbidity_max=None, dam_level_min=None, dam_level_max=None):
+    query = WaterTreatmentReading.query
+    
+    if raw_turbidity_min is not None:
+        query = query.filter(WaterTreatmentReading.raw_water_turbidity >= raw_turbidity_min)
+    if raw_turbidity_max is not None:
+        query = query.filter(WaterTreatmentReading.raw_water_turbidity <= raw_turbidity_max)
+    if dam_level_min is not None:
+        query = query.filter(WaterTreatmentReading.dam_level >= dam_level_min)
+    if dam_level_max is not None:
+        query = query.filter(WaterTreatmentReading.dam_level <= dam_level_max)
+    return query
+
+
 @app.route('/api/water-treatment/advanced-search', methods=['GET'])
 def advanced_search_water_treatment():
     try:
@@ -2325,79 +4307,54 @@ def advanced_search_water_treatment():
         raw_turbidity_max = request.args.get('raw_turbidity_max', type=float)
         dam_level_min = request.args.get('dam_level_min', type=float)
         dam_level_max = request.args.get('dam_level_max', type=float)
-        
-        # Find matching raw water records
-        query = WaterTreatmentReading.query
-        
-        if raw_turbidity_min is not None:
-            query = query.filter(WaterTreatmentReading.raw_water_turbidity >= raw_turbidity_min)
-        if raw_turbidity_max is not None:
-            query = query.filter(WaterTreatmentReading.raw_water_turbidity <= raw_turbidity_max)
-        if dam_level_min is not None:
-            query = query.filter(WaterTreatmentReading.dam_level >= dam_level_min)
-        if dam_level_max is not None:
-            query = query.filter(WaterTreatmentReading.dam_level <= dam_level_max)
-        
-        raw_records = query.all()
-        
-        # For each raw water record, find the clarified water 2 hours later
-        results = []
-        for raw_record in raw_records:
-            # Calculate time 2 hours later
-            two_hours_later = raw_record.reading_datetime + timedelta(hours=2)
-            
-            # Find the closest record around that time (within 30 minutes)
-            clarified_record = WaterTreatmentReading.query.filter(
-                WaterTreatmentReading.reading_datetime >= two_hours_later - timedelta(minutes=30),
-                WaterTreatmentReading.reading_datetime <= two_hours_later + timedelta(minutes=30)
-            ).order_by(
-                func.abs(
-                    func.julianday(WaterTreatmentReading.reading_datetime) - 
-                    func.julianday(two_hours_later)
-                )
-            ).first()
-            
-            # If we found a clarified record, calculate effectiveness
-            if clarified_record and (clarified_record.clarified_water_phase1 or clarified_record.clarified_water_phase2):
-                # Use the average of both phases or whichever is available
-                clarified_avg = None
-                if clarified_record.clarified_water_phase1 and clarified_record.clarified_water_phase2:
-                    clarified_avg = (clarified_record.clarified_water_phase1 + clarified_record.clarified_water_phase2) / 2
-                elif clarified_record.clarified_water_phase1:
-                    clarified_avg = clarified_record.clarified_water_phase1
-                elif clarified_record.clarified_water_phase2:
-                    clarified_avg = clarified_record.clarified_water_phase2
-                
-                if clarified_avg is not None:
-                    # Calculate reduction percentage
-                    reduction_pct = 0
-                    if raw_record.raw_water_turbidity and raw_record.raw_water_turbidity > 0:
-                        reduction_pct = ((raw_record.raw_water_turbidity - clarified_avg) / raw_record.raw_water_turbidity) * 100
-                    
-                    results.append({
-                        'raw_record': raw_record.to_dict(),
-                        'clarified_record': clarified_record.to_dict(),
-                        'clarified_avg': round(clarified_avg, 2),
-                        'reduction_percentage': round(reduction_pct, 2),
-                        'pac_dosage': raw_record.pac_dosage,
-                        'alum_dosage': raw_record.alum_dosage,
-                        'raw_turbidity': raw_record.raw_water_turbidity,
-                        'dam_level': raw_record.dam_level,
-                        'raw_datetime': raw_record.reading_datetime.isoformat(),
-                        'clarified_datetime': clarified_record.reading_datetime.isoformat(),
-                        'notes': raw_record.notes
-                    })
-        
-        # Sort by lowest clarified water (most effective treatment)
-        results.sort(key=lambda x: x['clarified_avg'])
-        
-        # Return top 10 most effective treatments
-        top_10 = results[:10]
-        app.logger.debug("Advanced search results: total=%s returned=%s", len(results), len(top_10))
+        lag_minutes = request.args.get('lag_minutes', default=120, type=int)
+        tolerance_minutes = request.args.get('tolerance_minutes', default=30, type=int)
+
+        k = request.args.get('k', default=10, type=int)
+        page = request.args.get('page', default=1, type=int)
+        metric = (request.args.get('metric') or 'clarified_avg').strip()
+
+        if lag_minutes < 0 or tolerance_minutes < 0:
+            return jsonify({'error': 'lag_minutes and tolerance_minutes must be non-negative'}), 400
+        if k < 1 or k > TREATMENT_RANKING_MAX_K:
+            return jsonify({'error': f'k must be between 1 and {TREATMENT_RANKING_MAX_K}'}), 400
+        if page < 1 or page > TREATMENT_RANKING_MAX_PAGE:
+            return jsonify({'error': f'page must be between 1 and {TREATMENT_RANKING_MAX_PAGE}'}), 400
+        if metric not in TREATMENT_RANKING_METRICS:
+            return jsonify({'error': f"metric must be one of: {', '.join(TREATMENT_RANKING_METRICS)}"}), 400
+        
+        # Stream matching raw water records through pairing and scoring, keeping only
+        # the best page * k pairs in a bounded heap and serialising just the requested page
+        clarified_pairs = _pair_with_clarified_readings(
+            _advanced_search_raw_query(raw_turbidity_min, raw_turbidity_max, dam_level_min, dam_level_max),
+            timedelta(minutes=lag_minutes),
+            timedelta(minutes=tolerance_minutes)
+        )
+        scored_pairs = _score_treatment_pairs(clarified_pairs, metric)
+        total_found = 0
+
+        def _counted(pairs):
+            nonlocal total_found
+            for pair in pairs:
+                total_found += 1
+                yield pair
+
+        ranked_pairs = heapq.nsmallest(page * k, _counted(scored_pairs), key=lambda pair: (pair[0], pair[1]))
+        top_treatments = [
+            _serialize_treatment_pair(*pair[2:])
+            for pair in ranked_pairs[(page - 1) * k:]
+        ]
+        app.logger.debug("Advanced search results: total=%s returned=%s", total_found, len(top_treatments))
 
         return jsonify({
-            'total_found': len(results),
-            'top_treatments': top_10
+            'total_found': total_found,
+            'top_treatments': top_treatments,
+            'metric': metric,
+            'k': k,
+            'page': page,
+            'total_pages': (total_found + k - 1) // k,
+            'lag_minutes': lag_minutes,
+            'tolerance_minutes': tolerance_minutes
         }), 200
         
     except Exception as e:
@@ -2415,24 +4372,347 @@ def delete_water_treatment(id):
         db.session.rollback()
         return jsonify({'error': str(e)}), 400
 
+def _water_treatment_range_query(start: datetime, end: datetime):
+    """Query for readings in the half-open range ``[start, end)``, oldest first.
+
+    Filtering on the raw column keeps the reading_datetime index usable.
+    """
+    return (
+        WaterTreatmentReading.query
+        .filter(
+            WaterTreatmentReading.reading_datetime >= start,
+            WaterTreatmentReading.reading_datetime < end
+        )
+        .order_by(WaterTreatmentReading.reading_datetime)
+    )
+
+
+WATER_TREATMENT_REPORT_VERSION = 1  # bump when create_water_treatment_excel_report output changes
+
+
+def _water_treatment_fingerprint(start: datetime, end: datetime):
+    """Return ``(row_count, fingerprint)`` for the readings in ``[start, end)``.
+
+    The fingerprint hashes SQL aggregates (row count, latest updated_at, and
+    totals of ids, timestamps and measurement columns), so it changes whenever
+    a reading in the period is added, edited or removed, without loading the
+    rows themselves.
+    """
+    columns = WaterTreatmentReading.__table__.c
+    aggregates = (
+        db.session.query(
+            func.count(columns.id),
+            func.max(columns.updated_at),
+            func.total(columns.id),
+            func.total(columns.dam_level),
+            func.total(columns.raw_water_turbidity),
+            func.total(columns.clarified_water_phase1),
+            func.total(columns.clarified_water_phase2),
+            func.total(columns.filtered_water_phase1),
+            func.total(columns.filtered_water_phase2),
+            func.total(columns.pac_dosage),
+            func.total(columns.alum_dosage),
+            func.total(func.length(columns.notes)),
+            func.total(func.julianday(columns.reading_datetime))
+        )
+        .filter(columns.reading_datetime >= start, columns.reading_datetime < end)
+        .one()
+    )
+
+    payload = json.dumps([WATER_TREATMENT_REPORT_VERSION] + list(aggregates), default=str)
+    return aggregates[0], hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _find_cached_report(cache_key: str, fingerprint: str):
+    """Return the cached water treatment report filename if it is current and still on disk."""
+    entry = db.session.get(ReportCacheEntry, cache_key)
+    directory = os.path.join(app.config['UPLOAD_FOLDER'], 'water_treatment')
+    if entry and entry.fingerprint == fingerprint and os.path.exists(os.path.join(directory, entry.filename)):
+        app.logger.debug("Water treatment report cache hit key=%s", cache_key)
+        return entry.filename
+    return None
+
+
+def _remember_cached_report(cache_key: str, fingerprint: str, filename: str):
+    try:
+        # Upsert, since concurrent requests that missed the cache may record the same key
+        statement = sqlite_insert(ReportCacheEntry).values(
+            cache_key=cache_key,
+            fingerprint=fingerprint,
+            filename=filename,
+            updated_at=datetime.utcnow()
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[ReportCacheEntry.cache_key],
+            set_={
+                'fingerprint': statement.excluded.fingerprint,
+                'filename': statement.excluded.filename,
+                'updated_at': statement.excluded.updated_at
+            }
+        )
+        db.session.execute(statement)
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        app.logger.exception("Failed to record water treatment report cache entry key=%s", cache_key)
+
+
+def _cached_water_treatment_report(report_type: str, date_info: str, start: datetime, end: datetime):
+    """Return ``(filename, row_count)`` for a report, regenerating it only when its readings changed."""
+    row_count, fingerprint = _water_treatment_fingerprint(start, end)
+    if not row_count:
+        return None, 0
+
+    cache_key = f'water_treatment:{report_type.lower()}:{start.isoformat()}:{end.isoformat()}'
+    cached_filename = _find_cached_report(cache_key, fingerprint)
+    if cached_filename:
+        return cached_filename, row_count
+
+    records = _water_treatment_range_query(start, end).yield_per(1000)
+    filename = create_water_treatment_excel_report(records, report_type, date_info)
+    if filename:
+        _remember_cached_report(cache_key, fingerprint, filename)
+    return filename, row_count
+
+
+def _invalidate_daily_rollups(connection, reading_datetime: datetime):
+    """Drop the rollups a change at ``reading_datetime`` affects.
+
+    The previous reading's interval ends at this reading, so every day from the
+    previous reading's day through this reading's day is invalidated.
+    """
+    previous_reading = connection.execute(
+        select(func.max(WaterTreatmentReading.reading_datetime))
+        .where(WaterTreatmentReading.reading_datetime < reading_datetime)
+    ).scalar()
+    first_day = (previous_reading or reading_datetime).date()
+
+    rollups = WaterTreatmentDailyRollup.__table__
+    connection.execute(
+        rollups.delete().where(rollups.c.day >= first_day, rollups.c.day <= reading_datetime.date())
+    )
+
+
+@event.listens_for(WaterTreatmentReading, 'after_insert')
+@event.listens_for(WaterTreatmentReading, 'after_delete')
+def _water_treatment_reading_written(mapper, connection, target):
+    if target.reading_datetime:
+        _invalidate_daily_rollups(connection, target.reading_datetime)
+
+
+@event.listens_for(WaterTreatmentReading, 'after_update')
+def _water_treatment_reading_updated(mapper, connection, target):
+    history = get_history(target, 'reading_datetime')
+    for reading_datetime in {target.reading_datetime, *(history.deleted or ())}:
+        if reading_datetime:
+            _invalidate_daily_rollups(connection, reading_datetime)
+
+
+def _compute_daily_rollups(first_day, last_day):
+    """Compute rollups for every day from ``first_day`` through ``last_day``.
+
+    Each reading's interval runs to the next reading, even one after
+    ``last_day``, and is counted on the day the interval starts.
+    """
+    range_start = datetime.combine(first_day, datetime.min.time())
+    range_end = datetime.combine(last_day + timedelta(days=1), datetime.min.time())
+
+    rollups = {}
+    day = first_day
+    while day <= last_day:
+        rollups[day] = WaterTreatmentDailyRollup(
+            day=day, reading_count=0, treatment_hours=0, pac_liters=0, alum_bags=0,
+            dam_level_total=0, dam_level_count=0
+        )
+        day += timedelta(days=1)
+
+    following_reading = (
+        WaterTreatmentReading.query
+        .filter(WaterTreatmentReading.reading_datetime >= range_end)
+        .order_by(WaterTreatmentReading.reading_datetime)
+        .first()
+    )
+    readings = itertools.chain(
+        _water_treatment_range_query(range_start, range_end).yield_per(1000),
+        [following_reading] if following_reading else []
+    )
+
+    for record, next_record in _iter_with_next(readings):
+        if record is following_reading:
+            break
+
+        rollup = rollups[record.reading_datetime.date()]
+        _, treatment_hours, pac_liters, alum_bags = _reading_consumption(record, next_record)
+        rollup.reading_count += 1
+        rollup.treatment_hours += treatment_hours
+        rollup.pac_liters += pac_liters
+        rollup.alum_bags += alum_bags
+        if record.dam_level:
+            rollup.dam_level_total += record.dam_level
+            rollup.dam_level_count += 1
+        if record.raw_water_turbidity is not None:
+            rollup.max_raw_turbidity = max(rollup.max_raw_turbidity or record.raw_water_turbidity, record.raw_water_turbidity)
+
+    return rollups
+
+
+def _ensure_daily_rollups(first_day, last_day):
+    """Return the rollups from ``first_day`` through ``last_day``, computing only the missing days."""
+    rollups = {
+        rollup.day: rollup
+        for rollup in WaterTreatmentDailyRollup.query.filter(
+            WaterTreatmentDailyRollup.day >= first_day,
+            WaterTreatmentDailyRollup.day <= last_day
+        ).all()
+    }
+
+    # Recompute contiguous runs of missing days with one range scan each
+    computed = {}
+    run_start = None
+    day = first_day
+    while day <= last_day + timedelta(days=1):
+        missing = day <= last_day and day not in rollups
+        if missing and run_start is None:
+            run_start = day
+        elif not missing and run_start is not None:
+            computed.update(_compute_daily_rollups(run_start, day - timedelta(days=1)))
+            run_start = None
+        day += timedelta(days=1)
+
+    if computed:
+        try:
+            db.session.add_all(computed.values())
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            app.logger.exception("Failed to store water treatment daily rollups")
+        rollups.update(computed)
+
+    return [rollups[day] for day in sorted(rollups)]
+
+
+def create_water_treatment_range_report(rollups, first_day, last_day):
+    """Generate a summary workbook for any date range from daily rollups"""
+    try:
+        wb = Workbook(write_only=True)
+        _add_water_treatment_report_styles(wb)
+        date_info = f"{first_day.strftime('%B %d, %Y')} - {last_day.strftime('%B %d, %Y')}"
+        headers = [
+            'DATE', 'READINGS', 'AVERAGE DAM LEVEL', 'MAX RAW WATER',
+            'TREATMENT HOURS', 'PAC CONSUMPTION\n(L)', 'ALUM CONSUMPTION\n(BAGS)'
+        ]
+
+        monthly_totals = {}
+        for rollup in rollups:
+            month = monthly_totals.setdefault((rollup.day.year, rollup.day.month), WaterTreatmentDailyRollup(
+                day=rollup.day.replace(day=1), reading_count=0, treatment_hours=0, pac_liters=0, alum_bags=0,
+                dam_level_total=0, dam_level_count=0
+            ))
+            month.reading_count += rollup.reading_count
+            month.treatment_hours += rollup.treatment_hours
+            month.pac_liters += rollup.pac_liters
+            month.alum_bags += rollup.alum_bags
+            month.dam_level_total += rollup.dam_level_total
+            month.dam_level_count += rollup.dam_level_count
+            if rollup.max_raw_turbidity is not None:
+                month.max_raw_turbidity = max(month.max_raw_turbidity or rollup.max_raw_turbidity, rollup.max_raw_turbidity)
+
+        def write_sheet(title, rows, label_format):
+            ws = wb.create_sheet(title)
+            for column_letter in 'ABCDEFG':
+                ws.column_dimensions[column_letter].width = 18
+
+            def styled(value, style_name):
+                cell = WriteOnlyCell(ws, value=value)
+                cell.style = style_name
+                return cell
+
+            ws.merged_cells.add('A1:G1')
+            ws.append([styled(f"TURBIDITY MONITORING SUMMARY - {date_info.upper()}", 'wt_title')])
+            ws.append([])
+            ws.append([styled(header, 'wt_header') for header in headers])
+
+            totals = {'readings': 0, 'hours': 0, 'pac': 0, 'alum': 0}
+            for row in rows:
+                data = row.to_dict()
+                ws.append([styled(value, 'wt_data') for value in (
+                    row.day.strftime(label_format),
+                    data['readingCount'],
+                    data['averageDamLevel'] if data['averageDamLevel'] is not None else '',
+                    data['maxRawTurbidity'] if data['maxRawTurbidity'] is not None else '',
+                    data['treatmentHours'] or '',
+                    data['pacLiters'] or '',
+                    data['alumBags'] or ''
+                )])
+                totals['readings'] += row.reading_count
+                totals['hours'] += row.treatment_hours
+                totals['pac'] += row.pac_liters
+                totals['alum'] += row.alum_bags
+
+            ws.append([])
+            for label, value in (
+                ("TOTAL READINGS", totals['readings']),
+                ("TOTAL TREATMENT HOURS", round(totals['hours'], 2)),
+                ("TOTAL PAC CONSUMPTION", round(totals['pac'], 2)),
+                ("TOTAL ALUM CONSUMPTION", round(totals['alum'], 2)),
+            ):
+                ws.append([styled(label, 'wt_summary'), styled(value, 'wt_summary')])
+
+        write_sheet('Monthly Summary', [monthly_totals[key] for key in sorted(monthly_totals)], '%B %Y')
+        write_sheet('Daily Summary', rollups, '%m/%d/%y')
+
+        filename = f"Water_Treatment_Range_{first_day.isoformat()}_to_{last_day.isoformat()}.xlsx"
+        filepath = os.path.join(app.config['UPLOAD_FOLDER'], 'water_treatment', filename)
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+
+        wb.save(filepath)
+        app.logger.info("Water treatment range report created: %s", filename)
+        return filename
+
+    except Exception as e:
+        app.logger.exception("Error creating water treatment range report")
+        return None
+
+
+def _parse_report_range_args():
+    """Resolve ``period``/``year``/``quarter``/``month`` or ``start_date``/``end_date`` to inclusive dates."""
+    period = (request.args.get('period') or '').strip().lower()
+    if not period:
+        first_day = datetime.strptime(request.args.get('start_date', ''), '%Y-%m-%d').date()
+        last_day = datetime.strptime(request.args.get('end_date', ''), '%Y-%m-%d').date()
+        return first_day, last_day
+
+    year = request.args.get('year', type=int) or datetime.now().year
+    if period == 'year':
+        return datetime(year, 1, 1).date(), datetime(year, 12, 31).date()
+    if period == 'quarter':
+        quarter = request.args.get('quarter', type=int)
+        if quarter not in (1, 2, 3, 4):
+            raise ValueError('quarter must be 1-4')
+        first_month = (quarter - 1) * 3 + 1
+        _, next_quarter_start = _month_bounds(year, first_month + 2)
+        return datetime(year, first_month, 1).date(), (next_quarter_start - timedelta(days=1)).date()
+    if period == 'month':
+        month_start, next_month_start = _month_bounds(year, request.args.get('month', type=int) or 0)
+        return month_start.date(), (next_month_start - timedelta(days=1)).date()
+
+    raise ValueError('period must be one of: year, quarter, month')
+
+
 @app.route('/api/water-treatment/download-daily/<date>', methods=['GET'])
 def download_daily_report(date):
     try:
         # Parse date (format: YYYY-MM-DD)
         target_date = datetime.strptime(date, '%Y-%m-%d').date()
         
-        # Get all records for that day
-        records = WaterTreatmentReading.query.filter(
-            func.date(WaterTreatmentReading.reading_datetime) == target_date
-        ).order_by(WaterTreatmentReading.reading_datetime).all()
+        # Reuse the generated file unless that day's readings changed
+        day_start = datetime.combine(target_date, datetime.min.time())
+        date_info = target_date.strftime('%B %d, %Y')
+        filename, record_count = _cached_water_treatment_report('Daily', date_info, day_start, day_start + timedelta(days=1))
         
-        if not records:
+        if not record_count:
             return jsonify({'error': 'No records found for this date'}), 404
         
-        # Generate Excel file
-        date_info = target_date.strftime('%B %d, %Y')
-        filename = create_water_treatment_excel_report(records, 'Daily', date_info)
-        
         if filename:
             # Use absolute path
             directory = os.path.abspath(os.path.join(app.config['UPLOAD_FOLDER'], 'water_treatment'))
@@ -2463,23 +4743,14 @@ def download_monthly_report(year, month):
         year = int(year)
         month = int(month)
         
-        # Get first and last day of month
-        first_day = datetime(year, month, 1)
-        last_day = datetime(year, month, monthrange(year, month)[1], 23, 59, 59)
-        
-        # Get all records for that month
-        records = WaterTreatmentReading.query.filter(
-            WaterTreatmentReading.reading_datetime >= first_day,
-            WaterTreatmentReading.reading_datetime <= last_day
-        ).order_by(WaterTreatmentReading.reading_datetime).all()
+        # Reuse the generated file unless that month's readings changed
+        first_day, next_month_first_day = _month_bounds(year, month)
+        date_info = first_day.strftime('%B %Y')
+        filename, record_count = _cached_water_treatment_report('Monthly', date_info, first_day, next_month_first_day)
         
-        if not records:
+        if not record_count:
             return jsonify({'error': 'No records found for this month'}), 404
         
-        # Generate Excel file
-        date_info = first_day.strftime('%B %Y')
-        filename = create_water_treatment_excel_report(records, 'Monthly', date_info)
-        
         if filename:
             # Use absolute path
             directory = os.path.abspath(os.path.join(app.config['UPLOAD_FOLDER'], 'water_treatment'))
@@ -2503,6 +4774,101 @@ def download_monthly_report(year, month):
         app.logger.exception("Monthly water treatment report download failed for year=%s month=%s", year, month)
         return jsonify({'error': str(e)}), 400
 
+@app.route('/api/water-treatment/download-range', methods=['GET'])
+def download_range_report():
+    try:
+        first_day, last_day = _parse_report_range_args()
+        if last_day < first_day:
+            return jsonify({'error': 'end_date must be on or after start_date'}), 400
+        if (last_day - first_day).days >= WATER_TREATMENT_RANGE_MAX_DAYS:
+            return jsonify({'error': f'Date range must not exceed {WATER_TREATMENT_RANGE_MAX_DAYS} days'}), 400
+
+        rollups = _ensure_daily_rollups(first_day, last_day)
+
+        if request.args.get('format') == 'json':
+            return jsonify({
+                'startDate': first_day.isoformat(),
+                'endDate': last_day.isoformat(),
+                'totals': {
+                    'readingCount': sum(rollup.reading_count for rollup in rollups),
+                    'treatmentHours': round(sum(rollup.treatment_hours for rollup in rollups), 2),
+                    'pacLiters': round(sum(rollup.pac_liters for rollup in rollups), 2),
+                    'alumBags': round(sum(rollup.alum_bags for rollup in rollups), 2)
+                },
+                'days': [rollup.to_dict() for rollup in rollups]
+            }), 200
+
+        if not any(rollup.reading_count for rollup in rollups):
+            return jsonify({'error': 'No records found for this date range'}), 404
+
+        # The rollups already summarise every reading, so they double as the cache fingerprint
+        cache_key = f'water_treatment:range:{first_day.isoformat()}:{last_day.isoformat()}'
+        fingerprint = hashlib.sha256(json.dumps(
+            [WATER_TREATMENT_REPORT_VERSION] + [rollup.to_dict() for rollup in rollups]
+        ).encode('utf-8')).hexdigest()
+
+        filename = _find_cached_report(cache_key, fingerprint)
+        if not filename:
+            filename = create_water_treatment_range_report(rollups, first_day, last_day)
+            if not filename:
+                return jsonify({'error': 'Failed to generate report'}), 500
+            _remember_cached_report(cache_key, fingerprint, filename)
+
+        directory = os.path.abspath(os.path.join(app.config['UPLOAD_FOLDER'], 'water_treatment'))
+        return send_from_directory(directory, filename, as_attachment=True)
+    except Exception as e:
+        app.logger.exception("Range water treatment report download failed")
+        return jsonify({'error': str(e)}), 400
+
+@app.route('/api/water-treatment/download-daily-batch', methods=['GET'])
+def download_daily_report_batch():
+    try:
+        start_date = datetime.strptime(request.args.get('start_date', ''), '%Y-%m-%d').date()
+        end_date = datetime.strptime(request.args.get('end_date', ''), '%Y-%m-%d').date()
+
+        if end_date < start_date:
+            return jsonify({'error': 'end_date must be on or after start_date'}), 400
+        if (end_date - start_date).days >= WATER_TREATMENT_BATCH_MAX_DAYS:
+            return jsonify({'error': f'Date range must not exceed {WATER_TREATMENT_BATCH_MAX_DAYS} days'}), 400
+
+        directory = os.path.abspath(os.path.join(app.config['UPLOAD_FOLDER'], 'water_treatment'))
+        archive_name = f"Water_Treatment_Daily_{start_date.isoformat()}_to_{end_date.isoformat()}.zip"
+
+        report_count = 0
+        os.makedirs(directory, exist_ok=True)
+        # Built under a private name and moved into place only when complete, so
+        # concurrent requests for the same range never see a partial archive
+        temp_path = os.path.join(directory, f'{archive_name}.{uuid.uuid4().hex}.tmp')
+        try:
+            with zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED) as archive:
+                # Each day goes through the same report cache as the single-day download
+                day = start_date
+                while day <= end_date:
+                    day_start = datetime.combine(day, datetime.min.time())
+                    filename, record_count = _cached_water_treatment_report(
+                        'Daily', day.strftime('%B %d, %Y'), day_start, day_start + timedelta(days=1)
+                    )
+                    if record_count:
+                        if not filename:
+                            return jsonify({'error': f'Failed to generate report for {day.isoformat()}'}), 500
+
+                        archive.write(os.path.join(directory, filename), filename)
+                        report_count += 1
+                    day += timedelta(days=1)
+
+            if not report_count:
+                return jsonify({'error': 'No records found for this date range'}), 404
+
+            os.replace(temp_path, os.path.join(directory, archive_name))
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+        return send_from_directory(directory, archive_name, as_attachment=True)
+    except Exception as e:
+        app.logger.exception("Batch daily water treatment report download failed")
+        return jsonify({'error': str(e)}), 400
+
 # ==================== LEAVE RECORDS ROUTES ====================
 
 def create_cto_pdf(cto):
@@ -2640,11 +5006,20 @@ def create_cto_pdf(cto):
 @app.route('/api/employees', methods=['GET'])
 def get_employees():
     try:
-        employees = Employee.query.order_by(Employee.employee_name).all()
-        return jsonify([emp.to_dict() for emp in employees]), 200
+        fields, deferred_fields = _list_field_projection(Employee)
+        employees = _apply_list_projection(Employee.query, Employee, deferred_fields).order_by(Employee.employee_name).all()
+        return jsonify([_serialize_list_record(emp, fields, deferred_fields) for emp in employees]), 200
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
+@app.route('/api/employees/<int:id>', methods=['GET'])
+def get_employee(id):
+    try:
+        employee = Employee.query.get_or_404(id)
+        return jsonify(employee.to_dict()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 404
+
 @app.route('/api/employees/sync', methods=['POST'])
 def sync_employees_from_analysis():
     try:
@@ -2777,11 +5152,18 @@ def download_cto_slip(id):
 @app.route('/api/cto-applications', methods=['GET'])
 def get_cto_applications():
     try:
-        applications = CTOApplication.query.order_by(CTOApplication.date_filed.desc()).all()
-        return jsonify([app.to_dict() for app in applications]), 200
+        return _paginated_list_response(CTOApplication.query, CTOApplication, CTOApplication.date_filed)
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
+@app.route('/api/cto-applications/<int:id>', methods=['GET'])
+def get_cto_application(id):
+    try:
+        cto = CTOApplication.query.get_or_404(id)
+        return jsonify(cto.to_dict()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 404
+
 @app.route('/api/cto-applications/<int:id>', methods=['DELETE'])
 def delete_cto_application(id):
     try:
@@ -2836,11 +5218,18 @@ def create_leave_application():
 @app.route('/api/leave-applications', methods=['GET'])
 def get_leave_applications():
     try:
-        applications = LeaveApplication.query.order_by(LeaveApplication.date_filed.desc()).all()
-        return jsonify([app.to_dict() for app in applications]), 200
+        return _paginated_list_response(LeaveApplication.query, LeaveApplication, LeaveApplication.date_filed)
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
+@app.route('/api/leave-applications/<int:id>', methods=['GET'])
+def get_leave_application(id):
+    try:
+        leave = LeaveApplication.query.get_or_404(id)
+        return jsonify(leave.to_dict()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 404
+
 @app.route('/api/leave-applications/<int:id>', methods=['DELETE'])
 def delete_leave_application(id):
     try:
@@ -2863,8 +5252,7 @@ def delete_leave_application(id):
 @app.route('/api/leave-credits', methods=['GET'])
 def get_leave_credits():
     try:
-        credits = LeaveCredits.query.all()
-        return jsonify([credit.to_dict() for credit in credits]), 200
+        return _paginated_list_response(LeaveCredits.query, LeaveCredits)
     except Exception as e:
         return jsonify({'error': str(e)}), 400
 
@@ -2916,6 +5304,132 @@ def create_or_update_leave_credits():
         db.session.rollback()
         return jsonify({'error': str(e)}), 400
 
+def _query_plan_audit_statements():
+    """Representative statements for the hot routes, as ``(route, statement, bounded, keyset_column)``.
+
+    Statements come from the same query builders the routes use, with typical
+    parameters. ``bounded`` statements carry a LIMIT, so walking an index in
+    order is fine for them. Statements with a ``keyset_column`` are cursor pages
+    and must seek into that column's index with a range.
+    """
+    now = datetime.now()
+    day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    cursor_position = (day_start, 2 ** 31)
+    page_size = 50 + 1
+
+    return [
+        ('GET /api/water-treatment?limit=', _list_page_query(
+            WaterTreatmentReading.query, WaterTreatmentReading, WaterTreatmentReading.reading_datetime
+        ).limit(page_size).statement, True, None),
+        ('GET /api/water-treatment?cursor=', _list_page_query(
+            WaterTreatmentReading.query, WaterTreatmentReading, WaterTreatmentReading.reading_datetime, cursor_position
+        ).limit(page_size).statement, True, 'reading_datetime'),
+        ('GET /api/water-treatment/search', _water_treatment_search_query(
+            (day_start - timedelta(days=7)).isoformat(), day_start.date().isoformat()
+        ).statement, False, None),
+        ('GET /api/water-treatment/advanced-search', _advanced_search_raw_query(
+            raw_turbidity_min=20.0, raw_turbidity_max=200.0, dam_level_min=40.0, dam_level_max=60.0
+        ).add_columns(*_clarified_neighbour_columns(timedelta(minutes=120), timedelta(minutes=30))).statement, False, None),
+        ('GET /api/water-treatment/download-daily/<date>', _water_treatment_range_query(
+            day_start, day_start + timedelta(days=1)
+        ).statement, False, None),
+        ('GET /api/physchem?limit=', _list_page_query(
+            PhysChemAnalysis.query, PhysChemAnalysis, PhysChemAnalysis.created_at
+        ).limit(page_size).statement, True, None),
+        ('GET /api/micro?limit=', _list_page_query(
+            MicrobiologicalAnalysis.query, MicrobiologicalAnalysis, MicrobiologicalAnalysis.created_at
+        ).limit(page_size).statement, True, None),
+        ('GET /api/physchem?cursor=', _list_page_query(
+            PhysChemAnalysis.query, PhysChemAnalysis, PhysChemAnalysis.created_at, cursor_position
+        ).limit(page_size).statement, True, 'created_at'),
+        ('GET /api/physchem?cursor= (NULL created_at)', _list_page_query(
+            PhysChemAnalysis.query, PhysChemAnalysis, PhysChemAnalysis.created_at, (None, 2 ** 31)
+        ).limit(page_size).statement, False, None),
+        ('GET /api/cto-applications?limit=', _list_page_query(
+            CTOApplication.query, CTOApplication, CTOApplication.date_filed
+        ).limit(page_size).statement, True, None),
+        ('GET /api/leave-applications?limit=', _list_page_query(
+            LeaveApplication.query, LeaveApplication, LeaveApplication.date_filed
+        ).limit(page_size).statement, True, None),
+        ('GET /api/leave-applications?cursor=', _list_page_query(
+            LeaveApplication.query, LeaveApplication, LeaveApplication.date_filed, (day_start.date(), 2 ** 31)
+        ).limit(page_size).statement, True, 'date_filed'),
+        ('GET /api/screen-data/treatment-hours?threshold= (ad hoc)', _treatment_hours_scan_query(
+            TREATMENT_HOUR_THRESHOLD, datetime(now.year, 1, 1), datetime(now.year + 1, 1, 1)
+        ).statement, False, None),
+        ('screen data: last active treatment', _last_active_treatment_slot_query(
+            TREATMENT_HOUR_THRESHOLD, now
+        ).statement, False, None),
+    ]
+
+def _query_plan_scans(plan, bounded, keyset_column=None):
+    """Return the steps of an EXPLAIN QUERY PLAN that walk more rows than the statement needs."""
+    scans = [
+        detail for detail in plan
+        if detail.startswith('SCAN ') and (not bounded or keyset_column or ' INDEX ' not in f'{detail} ')
+    ]
+    if keyset_column and not any(
+        detail.startswith('SEARCH ') and f'({keyset_column}<?' in detail for detail in plan
+    ):
+        # An ordered index scan satisfies the LIMIT but walks every row before the cursor
+        scans = scans or list(plan)
+    return scans
+
+
+def _audit_query_plans(engine=None):
+    """Run EXPLAIN QUERY PLAN for each hot statement and flag full table scans."""
+    engine = engine or db.engine
+    report = []
+    with engine.connect() as connection:
+        for route, statement, bounded, keyset_column in _query_plan_audit_statements():
+            compiled = statement.compile(dialect=engine.dialect, compile_kwargs={'render_postcompile': True})
+            params = tuple(
+                value.isoformat(sep=' ') if isinstance(value, datetime) else
+                value.isoformat() if hasattr(value, 'isoformat') else value
+                for value in (compiled.params[name] for name in compiled.positiontup)
+            )
+            plan = [row[3] for row in connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {compiled}', params)]
+
+            full_scans = _query_plan_scans(plan, bounded, keyset_column)
+            report.append({
+                'route': route,
+                'plan': plan,
+                'fullScans': full_scans,
+                'tempSort': any('USE TEMP B-TREE' in detail for detail in plan),
+                'ok': not full_scans
+            })
+    return report
+
+
+@app.cli.command('audit-query-plans')
+def audit_query_plans_command():
+    """Report hot queries whose plans fall back to full table scans."""
+    _run_startup_tasks()
+    report = _audit_query_plans()
+    for entry in report:
+        status = 'OK  ' if entry['ok'] else 'SCAN'
+        print(f"{status} {entry['route']}")
+        for detail in entry['plan']:
+            print(f'       {detail}')
+
+    failing = [entry for entry in report if not entry['ok']]
+    print(f'{len(failing)} of {len(report)} audited queries do full scans')
+    if failing:
+        raise SystemExit(1)
+
+
+@app.route('/api/admin/query-plan-audit', methods=['GET'])
+def query_plan_audit():
+    try:
+        permission_error = _require_permission('manage_users')
+        if permission_error:
+            return permission_error
+
+        return jsonify(_audit_query_plans()), 200
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+
 if __name__ == '__main__':
     app_port = int(os.getenv('APP_PORT', '5100'))
     app.run(debug=True, host='0.0.0.0', port=app_port)
@@ -17,3 +17,18 @@ class Config:
     MONITORING_PASSWORD = os.environ.get('MONITORING_PASSWORD', '')
     MONITORING_HEADLESS = os.environ.get('MONITORING_HEADLESS', 'true').lower() == 'true'
     MONITORING_ENTRY_DELAY_MINUTES = int(os.environ.get('MONITORING_ENTRY_DELAY_MINUTES', '12'))
+    MONITORING_MAX_CONCURRENCY = int(os.environ.get('MONITORING_MAX_CONCURRENCY', '2'))
+    MONITORING_SCRAPE_TIMEOUT_SECONDS = int(os.environ.get('MONITORING_SCRAPE_TIMEOUT_SECONDS', '90'))
+    MONITORING_SCHEDULER_ENABLED = os.environ.get('MONITORING_SCHEDULER_ENABLED', 'true').lower() == 'true'
+    MONITORING_REFRESH_RETRY_SECONDS = int(os.environ.get('MONITORING_REFRESH_RETRY_SECONDS', '120'))
+    SCREEN_DATA_STREAM_HEARTBEAT_SECONDS = int(os.environ.get('SCREEN_DATA_STREAM_HEARTBEAT_SECONDS', '25'))
+    TREATMENT_HOUR_THRESHOLDS = [float(value) for value in os.environ.get('TREATMENT_HOUR_THRESHOLDS', '5').split(',') if value.strip()]  # NTU thresholds kept as monthly aggregates
+    DOCUMENT_JOB_WORKERS = int(os.environ.get('DOCUMENT_JOB_WORKERS', '2'))
+    DOCUMENT_JOB_LEASE_SECONDS = int(os.environ.get('DOCUMENT_JOB_LEASE_SECONDS', '3600'))  # running jobs older than this are requeued on startup
+    LIBREOFFICE_BINARY = os.environ.get('LIBREOFFICE_BINARY', '')  # defaults to soffice/libreoffice on PATH
+    PDF_CONVERTER_WORKERS = int(os.environ.get('PDF_CONVERTER_WORKERS', '1'))
+    PDF_CONVERTER_BATCH_SIZE = int(os.environ.get('PDF_CONVERTER_BATCH_SIZE', '8'))
+    PDF_CONVERTER_BATCH_WINDOW_MS = int(os.environ.get('PDF_CONVERTER_BATCH_WINDOW_MS', '50'))
+    PDF_CONVERSION_TIMEOUT_SECONDS = int(os.environ.get('PDF_CONVERSION_TIMEOUT_SECONDS', '60'))
+    CERTIFICATE_EXPORT_PROCESSES = int(os.environ.get('CERTIFICATE_EXPORT_PROCESSES', '4'))
+    CERTIFICATE_EXPORT_RETENTION_HOURS = int(os.environ.get('CERTIFICATE_EXPORT_RETENTION_HOURS', '24'))
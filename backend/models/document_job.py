@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from models.physchem import db
+
+
+class DocumentJob(db.Model):
+    __tablename__ = 'document_jobs'
+
+    id = db.Column(db.String(32), primary_key=True)  # uuid4 hex
+    kind = db.Column(db.String(50), nullable=False)  # physchem_certificate, micro_certificate, certificate_export
+    record_id = db.Column(db.Integer, nullable=False)  # 0 for jobs spanning many records (certificate_export)
+    status = db.Column(db.String(20), nullable=False, default='queued', index=True)  # queued, running, succeeded, failed
+    options = db.Column(db.Text)  # JSON-encoded generation options (signature flags and scales)
+    excel_file = db.Column(db.String(500))
+    pdf_file = db.Column(db.String(500))
+    output_file = db.Column(db.String(500))  # bulk export archive, served by /api/jobs/<id>/download
+    error = db.Column(db.Text)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    started_at = db.Column(db.DateTime)
+    finished_at = db.Column(db.DateTime)
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'record_id': self.record_id,
+            'status': self.status,
+            'excel_file': self.excel_file,
+            'pdf_file': self.pdf_file,
+            'output_file': self.output_file,
+            'error': self.error,
+            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
@@ -9,7 +9,7 @@ class CTOApplication(db.Model):
     # Employee Information
     employee_no = db.Column(db.String(50), nullable=False)
     employee_name = db.Column(db.String(200), nullable=False)
-    date_filed = db.Column(db.Date, nullable=False)
+    date_filed = db.Column(db.Date, nullable=False, index=True)
     
     # CTO Details
     date_covered_description = db.Column(db.String(200))  # e.g., "Nov 1 to Nov 3"
@@ -32,9 +32,11 @@ class CTOApplication(db.Model):
     # Metadata
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    LIST_DEFERRED_FIELDS = ('applicant_signature', 'recommending_signature')
     
-    def to_dict(self):
-        return {
+    def to_dict(self, exclude=()):
+        data = {
             'id': self.id,
             'employee_no': self.employee_no,
             'employee_name': self.employee_name,
@@ -43,15 +45,17 @@ class CTOApplication(db.Model):
             'from_date': self.from_date.isoformat() if self.from_date else None,
             'to_date': self.to_date.isoformat() if self.to_date else None,
             'total_hours': self.total_hours,
-            'applicant_signature': self.applicant_signature,
             'recommending_approval_name': self.recommending_approval_name,
             'recommending_approval_title': self.recommending_approval_title,
-            'recommending_signature': self.recommending_signature,
             'status': self.status,
             'excel_file': self.excel_file,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+        for field in self.LIST_DEFERRED_FIELDS:
+            if field not in exclude:
+                data[field] = getattr(self, field)
+        return data
 
 
 class LeaveApplication(db.Model):
@@ -61,7 +65,7 @@ class LeaveApplication(db.Model):
     
     # Employee Information
     employee_name = db.Column(db.String(200), nullable=False)
-    date_filed = db.Column(db.Date, nullable=False)
+    date_filed = db.Column(db.Date, nullable=False, index=True)
     
     # Leave Type (store as JSON array of selected types)
     leave_types = db.Column(db.Text)  # JSON: ["Vacation Leave", "Sick Leave", etc.]
@@ -88,10 +92,12 @@ class LeaveApplication(db.Model):
     # Metadata
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    LIST_DEFERRED_FIELDS = ('applicant_signature', 'recommending_signature')
     
-    def to_dict(self):
+    def to_dict(self, exclude=()):
         import json
-        return {
+        data = {
             'id': self.id,
             'employee_name': self.employee_name,
             'date_filed': self.date_filed.isoformat() if self.date_filed else None,
@@ -100,16 +106,18 @@ class LeaveApplication(db.Model):
             'from_date': self.from_date.isoformat() if self.from_date else None,
             'to_date': self.to_date.isoformat() if self.to_date else None,
             'day_off': self.day_off,
-            'applicant_signature': self.applicant_signature,
             'recommending_approval_name': self.recommending_approval_name,
             'recommending_approval_title': self.recommending_approval_title,
-            'recommending_signature': self.recommending_signature,
             'date_signed': self.date_signed.isoformat() if self.date_signed else None,
             'status': self.status,
             'excel_file': self.excel_file,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None
         }
+        for field in self.LIST_DEFERRED_FIELDS:
+            if field not in exclude:
+                data[field] = getattr(self, field)
+        return data
 
 
 class LeaveCredits(db.Model):
@@ -155,13 +163,18 @@ class Employee(db.Model):
     
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    LIST_DEFERRED_FIELDS = ('signature',)
     
-    def to_dict(self):
-        return {
+    def to_dict(self, exclude=()):
+        data = {
             'id': self.id,
             'employee_no': self.employee_no,
             'employee_name': self.employee_name,
-            'signature': self.signature,
             'position': self.position,
             'department': self.department
-        }
\ No newline at end of file
+        }
+        for field in self.LIST_DEFERRED_FIELDS:
+            if field not in exclude:
+                data[field] = getattr(self, field)
+        return data
\ No newline at end of file
@@ -29,7 +29,7 @@ class MicrobiologicalAnalysis(db.Model):
     heterotrophic_plate_count = db.Column(db.Float)
     
     # Metadata
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
     def to_dict(self):
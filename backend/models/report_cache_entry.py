@@ -0,0 +1,12 @@
+from datetime import datetime
+
+from models.physchem import db
+
+
+class ReportCacheEntry(db.Model):
+    __tablename__ = 'report_cache_entries'
+
+    cache_key = db.Column(db.String(200), primary_key=True)  # e.g. "water_treatment:monthly:2026-03-01"
+    fingerprint = db.Column(db.String(64), nullable=False)  # SHA-256 of the source rows' aggregates
+    filename = db.Column(db.String(500), nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
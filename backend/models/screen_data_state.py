@@ -0,0 +1,11 @@
+from datetime import datetime
+
+from models.physchem import db
+
+
+class ScreenDataState(db.Model):
+    __tablename__ = 'screen_data_state'
+
+    key = db.Column(db.String(100), primary_key=True)
+    value = db.Column(db.Text, nullable=False)  # JSON-encoded value
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -0,0 +1,27 @@
+from datetime import datetime
+
+from models.physchem import db
+
+
+class TreatmentHourAggregate(db.Model):
+    __tablename__ = 'treatment_hour_aggregates'
+    __table_args__ = (
+        db.UniqueConstraint('year', 'month', 'threshold', name='uq_treatment_hour_aggregate_period'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    year = db.Column(db.Integer, nullable=False)
+    month = db.Column(db.Integer, nullable=False)
+    threshold = db.Column(db.Float, nullable=False)
+    treatment_hours = db.Column(db.Integer, nullable=False, default=0)  # hourly slots with turbidity above threshold
+    last_active_slot = db.Column(db.DateTime)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def to_dict(self):
+        return {
+            'year': self.year,
+            'month': self.month,
+            'threshold': self.threshold,
+            'treatmentHours': self.treatment_hours,
+            'lastActiveSlot': self.last_active_slot.isoformat() if self.last_active_slot else None
+        }
@@ -5,6 +5,10 @@ from models.physchem import db
 
 class TurbiditySnapshot(db.Model):
     __tablename__ = 'turbidity_snapshots'
+    __table_args__ = (
+        # Treatment-hour counts filter on turbidity above a threshold within a slot range
+        db.Index('ix_turbidity_snapshots_turbidity_slot', 'turbidity', 'slot_datetime'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     slot_datetime = db.Column(db.DateTime, nullable=False, unique=True, index=True)
@@ -7,11 +7,11 @@ class WaterTreatmentReading(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     
     # Reading date and time
-    reading_datetime = db.Column(db.DateTime, nullable=False)
+    reading_datetime = db.Column(db.DateTime, nullable=False, index=True)
     
     # Measurements
     dam_level = db.Column(db.Float)
-    raw_water_turbidity = db.Column(db.Float)  # NTU
+    raw_water_turbidity = db.Column(db.Float, index=True)  # NTU
     clarified_water_phase1 = db.Column(db.Float)  # NTU
     clarified_water_phase2 = db.Column(db.Float)  # NTU
     filtered_water_phase1 = db.Column(db.Float)  # NTU
@@ -0,0 +1,28 @@
+from datetime import datetime
+
+from models.physchem import db
+
+
+class WaterTreatmentDailyRollup(db.Model):
+    __tablename__ = 'water_treatment_daily_rollups'
+
+    day = db.Column(db.Date, primary_key=True)
+    reading_count = db.Column(db.Integer, nullable=False, default=0)
+    treatment_hours = db.Column(db.Float, nullable=False, default=0)  # hours with raw water above 5 NTU
+    pac_liters = db.Column(db.Float, nullable=False, default=0)
+    alum_bags = db.Column(db.Float, nullable=False, default=0)
+    dam_level_total = db.Column(db.Float, nullable=False, default=0)
+    dam_level_count = db.Column(db.Integer, nullable=False, default=0)
+    max_raw_turbidity = db.Column(db.Float)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def to_dict(self):
+        return {
+            'day': self.day.isoformat() if self.day else None,
+            'readingCount': self.reading_count,
+            'treatmentHours': round(self.treatment_hours or 0, 2),
+            'pacLiters': round(self.pac_liters or 0, 2),
+            'alumBags': round(self.alum_bags or 0, 2),
+            'averageDamLevel': round(self.dam_level_total / self.dam_level_count, 2) if self.dam_level_count else None,
+            'maxRawTurbidity': self.max_raw_turbidity
+        }
@@ -0,0 +1,22 @@
+from sqlalchemy import create_engine
+
+from app.main import app, db, _audit_query_plans, _query_plan_scans
+
+
+def test_cursor_pages_seek_the_sort_index():
+    engine = create_engine('sqlite://')
+    db.metadata.create_all(engine)
+    with app.app_context():
+        report = _audit_query_plans(engine)
+
+    cursor_pages = [entry for entry in report if '?cursor=' in entry['route']]
+    assert cursor_pages
+    for entry in cursor_pages:
+        assert entry['ok'], (entry['route'], entry['plan'])
+
+
+def test_ordered_index_scan_is_flagged_for_cursor_pages():
+    plan = ['SCAN water_treatment_readings USING INDEX ix_water_treatment_readings_reading_datetime']
+
+    assert _query_plan_scans(plan, bounded=True) == []
+    assert _query_plan_scans(plan, bounded=True, keyset_column='reading_datetime') == plan
@@ -132,6 +132,54 @@ export default function App() {
     setLoginPassword('');
   };
 
+  const applyScreenDataPayload = (payload) => {
+    const targetHourMatch = (payload.target_hour || '').match(/^(\d{1,2}):\d{2}\s*([AP]M)$/i);
+    const targetHourKey = targetHourMatch
+      ? `${Number(targetHourMatch[1])} ${targetHourMatch[2].toUpperCase()}`
+      : null;
+    const displayTurbidity = targetHourKey && TURBIDITY_SCREEN_OVERRIDE[targetHourKey] !== undefined
+      ? TURBIDITY_SCREEN_OVERRIDE[targetHourKey]
+      : payload.turbidity;
+    const getOverrideTurbidityForOffset = (offset) => {
+      if (!targetHourMatch) return null;
+      let hour24 = Number(targetHourMatch[1]) % 12;
+      if (targetHourMatch[2].toUpperCase() === 'PM') hour24 += 12;
+      hour24 = (hour24 - offset + 24) % 24;
+      const hour12 = hour24 % 12 || 12;
+      const meridiem = hour24 >= 12 ? 'PM' : 'AM';
+      const key = `${hour12} ${meridiem}`;
+      return TURBIDITY_SCREEN_OVERRIDE[key] !== undefined ? TURBIDITY_SCREEN_OVERRIDE[key] : null;
+    };
+    const displayTurbidity1HourPrior = getOverrideTurbidityForOffset(1) ?? payload.turbidity_1_hour_prior;
+    const displayTurbidity2HoursPrior = getOverrideTurbidityForOffset(2) ?? payload.turbidity_2_hours_prior;
+    const displayTurbidity3HoursPrior = getOverrideTurbidityForOffset(3) ?? payload.turbidity_3_hours_prior;
+
+    setScreenDataValues({
+      turbidity: displayTurbidity,
+      previousTurbidity: payload.previous_turbidity,
+      turbidity1HourPrior: displayTurbidity1HourPrior,
+      turbidity2HoursPrior: displayTurbidity2HoursPrior,
+      turbidity3HoursPrior: displayTurbidity3HoursPrior,
+      currentDamLevel: payload.current_dam_level,
+      previousDamLevel: payload.previous_dam_level,
+      damLevel1HourPrior: payload.dam_level_1_hour_prior,
+      damLevel2HoursPrior: payload.dam_level_2_hours_prior,
+      damLevel3HoursPrior: payload.dam_level_3_hours_prior,
+      oldResBigTankLevel: payload.old_res_big_tank_level,
+      tankALevel: payload.tank_a_level,
+      tankBLevel: payload.tank_b_level,
+      tankCdLevel: payload.tank_cd_level,
+      oldResStatus: payload.old_res_status,
+      lastActiveDosing: payload.last_active_dosing,
+      totalTreatmentHoursMonth: payload.total_treatment_hours_month,
+      currentOperator: payload.current_operator,
+      reservedMetric: payload.reserved_metric,
+      targetHour: payload.target_hour,
+      fetchedAt: payload.fetched_at,
+      scrapeError: payload.scrape_error || null
+    });
+  };
+
   const fetchScreenData = async () => {
     setScreenDataLoading(true);
     setScreenDataError('');
@@ -143,51 +191,7 @@ export default function App() {
         throw new Error(payload.error || 'Failed to fetch screen data');
       }
 
-      const targetHourMatch = (payload.target_hour || '').match(/^(\d{1,2}):\d{2}\s*([AP]M)$/i);
-      const targetHourKey = targetHourMatch
-        ? `${Number(targetHourMatch[1])} ${targetHourMatch[2].toUpperCase()}`
-        : null;
-      const displayTurbidity = targetHourKey && TURBIDITY_SCREEN_OVERRIDE[targetHourKey] !== undefined
-        ? TURBIDITY_SCREEN_OVERRIDE[targetHourKey]
-        : payload.turbidity;
-      const getOverrideTurbidityForOffset = (offset) => {
-        if (!targetHourMatch) return null;
-        let hour24 = Number(targetHourMatch[1]) % 12;
-        if (targetHourMatch[2].toUpperCase() === 'PM') hour24 += 12;
-        hour24 = (hour24 - offset + 24) % 24;
-        const hour12 = hour24 % 12 || 12;
-        const meridiem = hour24 >= 12 ? 'PM' : 'AM';
-        const key = `${hour12} ${meridiem}`;
-        return TURBIDITY_SCREEN_OVERRIDE[key] !== undefined ? TURBIDITY_SCREEN_OVERRIDE[key] : null;
-      };
-      const displayTurbidity1HourPrior = getOverrideTurbidityForOffset(1) ?? payload.turbidity_1_hour_prior;
-      const displayTurbidity2HoursPrior = getOverrideTurbidityForOffset(2) ?? payload.turbidity_2_hours_prior;
-      const displayTurbidity3HoursPrior = getOverrideTurbidityForOffset(3) ?? payload.turbidity_3_hours_prior;
-
-      setScreenDataValues({
-        turbidity: displayTurbidity,
-        previousTurbidity: payload.previous_turbidity,
-        turbidity1HourPrior: displayTurbidity1HourPrior,
-        turbidity2HoursPrior: displayTurbidity2HoursPrior,
-        turbidity3HoursPrior: displayTurbidity3HoursPrior,
-        currentDamLevel: payload.current_dam_level,
-        previousDamLevel: payload.previous_dam_level,
-        damLevel1HourPrior: payload.dam_level_1_hour_prior,
-        damLevel2HoursPrior: payload.dam_level_2_hours_prior,
-        damLevel3HoursPrior: payload.dam_level_3_hours_prior,
-        oldResBigTankLevel: payload.old_res_big_tank_level,
-        tankALevel: payload.tank_a_level,
-        tankBLevel: payload.tank_b_level,
-        tankCdLevel: payload.tank_cd_level,
-        oldResStatus: payload.old_res_status,
-        lastActiveDosing: payload.last_active_dosing,
-        totalTreatmentHoursMonth: payload.total_treatment_hours_month,
-        currentOperator: payload.current_operator,
-        reservedMetric: payload.reserved_metric,
-        targetHour: payload.target_hour,
-        fetchedAt: payload.fetched_at,
-        scrapeError: payload.scrape_error || null
-      });
+      applyScreenDataPayload(payload);
     } catch (error) {
       setScreenDataError(error.message || 'Failed to fetch screen data');
     } finally {
@@ -195,6 +199,35 @@ export default function App() {
     }
   };
 
+  const streamFullHistory = async () => {
+    const response = await fetch(`${API_ORIGIN}/api/screen-data/history?format=ndjson`, { credentials: 'include' });
+    if (!response.ok || !response.body) {
+      const payload = await response.json().catch(() => ({}));
+      throw new Error(payload.error || 'Failed to fetch historical data');
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    const groups = [];
+    let buffer = '';
+
+    setHistoryGroups([]);
+    while (true) {
+      const { done, value } = await reader.read();
+      buffer += decoder.decode(value || new Uint8Array(), { stream: !done });
+
+      const lines = buffer.split('\n');
+      buffer = done ? '' : lines.pop();
+      const parsed = lines.filter((line) => line.trim()).map((line) => JSON.parse(line));
+      if (parsed.length) {
+        groups.push(...parsed);
+        setHistoryGroups([...groups]);
+      }
+
+      if (done) break;
+    }
+  };
+
   const fetchHistoricalData = async () => {
     setHistoryLoading(true);
     setHistoryError('');
@@ -207,9 +240,12 @@ export default function App() {
       }
 
       const query = params.toString();
-      const endpoint = query
-        ? `${API_ORIGIN}/api/screen-data/history?${query}`
-        : `${API_ORIGIN}/api/screen-data/history`;
+      if (!query) {
+        await streamFullHistory();
+        return;
+      }
+
+      const endpoint = `${API_ORIGIN}/api/screen-data/history?${query}`;
 
       const response = await fetch(endpoint, { credentials: 'include' });
       const payload = await response.json();
@@ -372,9 +408,28 @@ export default function App() {
   useEffect(() => {
     if (authLoading || !currentUser) return;
 
-    fetchScreenData();
-    const interval = setInterval(fetchScreenData, 15 * 60 * 1000);
-    return () => clearInterval(interval);
+    if (typeof EventSource === 'undefined') {
+      fetchScreenData();
+      const interval = setInterval(fetchScreenData, 15 * 60 * 1000);
+      return () => clearInterval(interval);
+    }
+
+    setScreenDataLoading(true);
+    const stream = new EventSource(`${API_ORIGIN}/api/screen-data/stream`, { withCredentials: true });
+    stream.onmessage = (event) => {
+      try {
+        applyScreenDataPayload(JSON.parse(event.data));
+        setScreenDataError('');
+      } catch (error) {
+        setScreenDataError(error.message || 'Failed to read screen data');
+      } finally {
+        setScreenDataLoading(false);
+      }
+    };
+    stream.onerror = () => {
+      setScreenDataLoading(false);
+    };
+    return () => stream.close();
   }, [authLoading, currentUser]);
 
   useEffect(() => {